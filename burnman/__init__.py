@@ -58,12 +58,13 @@ Acknowledgement and Support:
 from version import version as __version__
 
 # classes for representing rocks and minerals:
-from mineral import Mineral
+from mineral import Mineral, SharedStates
 from material import Material
 from composite import Composite
 from solutionmodel import SolutionModel
 from solidsolution import SolidSolution
 from mineral_helpers import *
+from tabulated_mineral import TabulatedMineral
 
 # high level functions
 from main import *
@@ -16,7 +16,18 @@ class AveragingScheme(object):
     New averaging schemes should define the functions
     average_bulk_moduli and average_shear_moduli, as
     specified here.
+
+    The schemes of this module also take 2-D arrays of shape (n_points,
+    n_phases), one row per evaluation point, and then return arrays of
+    length n_points (the phases are always along the last axis), which
+    they compute without looping over the points.  Schemes that do this
+    set averages_arrays to True, :func:`burnman.average_moduli_arrays`
+    calls the other ones once per point.
     """
+
+    # whether the averages take 2-D arrays of many points
+    averages_arrays = False
+
     def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
         """
         Average the bulk moduli :math:`K` for a composite. This defines the interface
@@ -84,8 +95,8 @@ class AveragingScheme(object):
         rho : float
            Density :math:`\\rho`. :math:`[kg/m^3]`
         """
-        total_mass = np.sum(np.array(densities)*np.array(volumes))
-        total_vol = np.sum(np.array(volumes)) #should sum to one
+        total_mass = _phase_sum(np.asarray(densities)*np.asarray(volumes))
+        total_vol = _phase_sum(np.asarray(volumes, dtype=float)) #should sum to one
         density = total_mass/total_vol
         return density
 
@@ -93,8 +104,8 @@ class AveragingScheme(object):
         """
         thermal expansion coefficient of the mineral :math:`\\alpha`. :math:`[1/K]`
         """
-        total_vol = np.sum(np.array(volumes))
-        return np.sum(np.array(alphas)*np.array(volumes)) / total_vol
+        total_vol = _phase_sum(np.asarray(volumes, dtype=float))
+        return _phase_sum(np.asarray(alphas)*np.asarray(volumes)) / total_vol
 
     def average_heat_capacity_v(self, fractions, c_v):
         #TODO: double-check that the formula we use is appropriate here.
@@ -116,7 +127,7 @@ class AveragingScheme(object):
         c_v : float
           heat capacity at constant volume of the composite :math:`C_V`. :math:`[J/K/mol]`
         """
-        return np.sum(np.array(fractions)*np.array(c_v))
+        return _phase_sum(np.asarray(fractions)*np.asarray(c_v))
 
     def average_heat_capacity_p(self, fractions, c_p):
         #TODO: double-check that the formula we use is correct.
@@ -135,7 +146,7 @@ class AveragingScheme(object):
         c_p : float
           heat capacity at constant pressure :math:`C_P` of the composite. :math:`[J/K/mol]`
         """
-        return np.sum(np.array(fractions)*np.array(c_p))
+        return _phase_sum(np.asarray(fractions)*np.asarray(c_p))
 
 
 class VoigtReussHill(AveragingScheme):
@@ -146,6 +157,8 @@ class VoigtReussHill(AveragingScheme):
     :func:`burnman.averaging_schemes.averaging_scheme.average_shear_moduli` functions.
     """
 
+    averages_arrays = True
+
     def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
         """
         Average the bulk moduli of a composite with the Voigt-Reuss-Hill average, given by:
@@ -211,6 +224,8 @@ class Voigt(AveragingScheme):
     :func:`burnman.averaging_schemes.averaging_scheme.average_shear_moduli` functions.
     """
 
+    averages_arrays = True
+
     def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
         """
         Average the bulk moduli of a composite :math:`K` with the Voigt (iso-strain)
@@ -272,6 +287,8 @@ class Reuss(AveragingScheme):
     :func:`burnman.averaging_schemes.averaging_scheme.average_shear_moduli` functions.
     """
 
+    averages_arrays = True
+
     def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
         """
         Average the bulk moduli of a composite with the Reuss (iso-stress)
@@ -338,6 +355,8 @@ class HashinShtrikmanUpper(AveragingScheme):
     may not be.
     """
 
+    averages_arrays = True
+
     def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
         """
         Average the bulk moduli of a composite with the upper Hashin-Shtrikman bound.
@@ -359,16 +378,12 @@ class HashinShtrikmanUpper(AveragingScheme):
             The upper Hashin-Shtrikman average bulk modulus :math:`K`. :math:`[Pa]`
         """
 
-        K_n = max(bulk_moduli)
-        G_n = max(shear_moduli)
-
-        vol_frac = volumes/sum(volumes)
+        vol_frac, bulk_moduli, shear_moduli = _volume_fractions(volumes, bulk_moduli, shear_moduli)
+        K_n = _phase_reduce(np.maximum, bulk_moduli)
+        G_n = _phase_reduce(np.maximum, shear_moduli)
 
         alpha_n = -3. / (3.*K_n+4.*G_n)
-        A_n = 0
-        for i in range(len(vol_frac)):
-            if bulk_moduli[i] != K_n:
-                A_n += vol_frac[i] / (1. / (bulk_moduli[i] - K_n) - alpha_n)
+        A_n = _hashin_shtrikman_sum(vol_frac, bulk_moduli, K_n, 1., alpha_n)
 
         K_upper = K_n + A_n/(1. + alpha_n*A_n)
         return K_upper
@@ -394,16 +409,12 @@ class HashinShtrikmanUpper(AveragingScheme):
             The upper Hashin-Shtrikman average shear modulus :math:`G`. :math:`[Pa]`
         """
 
-        K_n = max(bulk_moduli)
-        G_n = max(shear_moduli)
-
-        vol_frac = volumes/sum(volumes)
+        vol_frac, bulk_moduli, shear_moduli = _volume_fractions(volumes, bulk_moduli, shear_moduli)
+        K_n = _phase_reduce(np.maximum, bulk_moduli)
+        G_n = _phase_reduce(np.maximum, shear_moduli)
 
         beta_n = -3. * (K_n + 2.*G_n)  / (5.*G_n * (3.*K_n+4.*G_n))
-        B_n = 0
-        for i in range(len(vol_frac)):
-            if  shear_moduli[i] != G_n:
-                B_n += vol_frac[i] / (1. / (2. * (shear_moduli[i] - G_n)) - beta_n)
+        B_n = _hashin_shtrikman_sum(vol_frac, shear_moduli, G_n, 2., beta_n)
 
         G_upper = G_n + (0.5)*B_n/(1. + beta_n*B_n)
         return G_upper
@@ -421,6 +432,8 @@ class HashinShtrikmanLower(AveragingScheme):
     may not be.
     """
 
+    averages_arrays = True
+
     def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
         """
         Average the bulk moduli of a composite with the lower Hashin-Shtrikman bound.
@@ -442,16 +455,12 @@ class HashinShtrikmanLower(AveragingScheme):
             The lower Hashin-Shtrikman average bulk modulus :math:`K`. :math:`[Pa]`
         """
 
-        K_1 = min(bulk_moduli)
-        G_1 = min(shear_moduli)
-
-        vol_frac = volumes/sum(volumes)
+        vol_frac, bulk_moduli, shear_moduli = _volume_fractions(volumes, bulk_moduli, shear_moduli)
+        K_1 = _phase_reduce(np.minimum, bulk_moduli)
+        G_1 = _phase_reduce(np.minimum, shear_moduli)
 
         alpha_1 = -3. / (3.*K_1+4.*G_1)
-        A_1 = 0
-        for i in range(len(vol_frac)):
-            if  bulk_moduli[i] != K_1:
-                A_1 += vol_frac[i] / (1. / (bulk_moduli[i] - K_1) - alpha_1)
+        A_1 = _hashin_shtrikman_sum(vol_frac, bulk_moduli, K_1, 1., alpha_1)
 
         K_lower = K_1 + A_1/(1. + alpha_1*A_1)
         return K_lower
@@ -477,16 +486,12 @@ class HashinShtrikmanLower(AveragingScheme):
             The lower Hashin-Shtrikman average shear modulus :math:`G`. :math:`[Pa]`
         """
 
-        K_1 = min(bulk_moduli)
-        G_1 = min(shear_moduli)
-
-        vol_frac = volumes/sum(volumes)
+        vol_frac, bulk_moduli, shear_moduli = _volume_fractions(volumes, bulk_moduli, shear_moduli)
+        K_1 = _phase_reduce(np.minimum, bulk_moduli)
+        G_1 = _phase_reduce(np.minimum, shear_moduli)
 
         beta_1 = -3. * (K_1 + 2.*G_1)  / (5.*G_1 * (3.*K_1+4.*G_1))
-        B_1 = 0
-        for i in range(len(vol_frac)):
-            if  shear_moduli[i] != G_1:
-                B_1 += vol_frac[i] / (1. / (2. * (shear_moduli[i] - G_1)) - beta_1)
+        B_1 = _hashin_shtrikman_sum(vol_frac, shear_moduli, G_1, 2., beta_1)
 
         G_lower = G_1 + (0.5)*B_1/(1. + beta_1*B_1)
         return G_lower
@@ -499,6 +504,8 @@ class HashinShtrikmanAverage(AveragingScheme):
     the :func:`burnman.averaging_schemes.averaging_scheme.average_bulk_moduli` 
     and :func:`burnman.averaging_schemes.averaging_scheme.average_shear_moduli` functions.
     """
+
+    averages_arrays = True
     def __init__(self):
         self.upper = HashinShtrikmanUpper()
         self.lower = HashinShtrikmanLower()
@@ -552,17 +559,66 @@ class HashinShtrikmanAverage(AveragingScheme):
                 + self.lower.average_shear_moduli(volumes, bulk_moduli, shear_moduli))/2.0
 
 
+def _phase_reduce(ufunc, X):
+    """
+    Reduce X along its last axis (the phases) with a binary ufunc, like
+    np.add or np.maximum.  This loops over the phases instead of the
+    points, which is much faster than ufunc.reduce(X, axis=-1) when there
+    are many points and few phases.  The phases are reduced in order, so
+    the result of np.add is the same as that of the builtin sum.
+    """
+    if X.shape[-1] == 0:
+        return ufunc.reduce(X, axis=-1)
+    result = np.array(X[..., 0], dtype=float)
+    for i in range(1, X.shape[-1]):
+        ufunc(result, X[..., i], out=result)
+    return result[()]
+
+
+def _phase_sum(X):
+    """
+    Sum X along its last axis (the phases), see :func:`_phase_reduce`.
+    """
+    return _phase_reduce(np.add, X)
+
+
+def _volume_fractions(volumes, bulk_moduli, shear_moduli):
+    """
+    Return the volume fractions, bulk moduli and shear moduli as float
+    arrays, with the phases along the last axis.
+    """
+    volumes = np.asarray(volumes, dtype=float)
+    vol_frac = volumes/_phase_sum(volumes)[..., np.newaxis]
+    return vol_frac, np.asarray(bulk_moduli, dtype=float), np.asarray(shear_moduli, dtype=float)
+
+
+def _hashin_shtrikman_sum(vol_frac, X, X_n, factor, coefficient):
+    """
+    Sum of the terms vol_frac / (1/(factor*(X - X_n)) - coefficient) over
+    the phases whose modulus X is not the extremal modulus X_n (the other
+    terms are zero), as in the Hashin-Shtrikman bounds of :cite:`Watt1976`.
+    X_n and coefficient have one value per point.
+    """
+    X_n = np.asarray(X_n)[..., np.newaxis]
+    coefficient = np.asarray(coefficient)[..., np.newaxis]
+    # the terms of the phases with X == X_n are masked out by the division
+    # by zero: 1/0 is inf, and vol_frac/inf is exactly zero
+    with np.errstate(divide='ignore'):
+        return _phase_sum(vol_frac / (1. / (factor*(X - X_n)) - coefficient))
+
+
 def voigt_average_function(phase_volume, X):
     """
     Do Voigt (iso-strain) average.  Rather like
     resistors in series.  Called by voigt and
     voigt_reuss_hill classes, takes a list of
     volumes and moduli, returns a modulus.
+    Also takes 2-D arrays with one row per
+    point, and then returns one modulus per row.
     """
-    it = range(len(phase_volume))
-    V_i = phase_volume
-    V_tot = sum(V_i)
-    X_voigt = sum(V_i[i]/V_tot * X[i] for i in it)
+    V_i = np.asarray(phase_volume, dtype=float)
+    V_tot = _phase_sum(V_i)[..., np.newaxis]
+    X_voigt = _phase_sum(V_i/V_tot * np.asarray(X, dtype=float))
     return X_voigt
 
 
@@ -572,15 +628,22 @@ def reuss_average_function(phase_volume, X):
     resistors in parallel.  Called by reuss and
     voigt_reuss_hill classes, takes a list of
     volumes and moduli, returns a modulus.
+    Also takes 2-D arrays with one row per
+    point, and then returns one modulus per row.
     """
-    it = range(len(phase_volume))
-    V_i = phase_volume
-    V_tot = sum(V_i)
-    if (min(X)<=0.0):
-        X_reuss = 0.0
+    V_i = np.asarray(phase_volume, dtype=float)
+    X = np.asarray(X, dtype=float)
+    V_tot = _phase_sum(V_i)[..., np.newaxis]
+    # moduli can be nan (e.g. the shear moduli of the spin transition
+    # minerals), which are not <= 0
+    with np.errstate(invalid='ignore'):
+        invalid = X <= 0.0
+    if np.any(invalid):
         warnings.warn("Oops, called reuss_average with Xi<=0!")
-    else:
-        X_reuss = 1./sum(V_i[i]/V_tot* 1./X[i] for i in it)
+        invalid = np.any(invalid, axis=-1)
+        X = np.where(invalid[..., np.newaxis], 1., X)
+        return np.where(invalid, 0.0, 1./_phase_sum(V_i/V_tot* 1./X))[()]
+    X_reuss = 1./_phase_sum(V_i/V_tot* 1./X)
     return X_reuss
 
 
@@ -590,7 +653,8 @@ def voigt_reuss_hill_function(phase_volume, X):
     of Voigt and Reuss bounds).  Called by
     voigt_reuss_hill class, takes a list of
     volumes and moduli, returns a modulus.
+    Also takes 2-D arrays with one row per
+    point, and then returns one modulus per row.
     """
     X_vrh = (voigt_average_function(phase_volume, X) + reuss_average_function(phase_volume, X))/2.0
     return X_vrh
-
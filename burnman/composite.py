@@ -23,6 +23,17 @@ def check_pairs(fractions, minerals):
                 raise Exception('ERROR: object of type ''%s'' is not of type material' % (type(p)))
 
 
+class _Unrolled(object):
+    """
+    The cached result of :func:`Composite.unroll`, with the fractions also
+    as a (read-only) array, and what is needed to check that it is still
+    valid: the children it was computed from, the child composites with
+    their caches, and the children whose unroll() depends on the state with
+    the fractions and the ids of the minerals they unrolled to.
+    """
+    __slots__ = ['fractions', 'fraction_array', 'minerals', 'children', 'composites', 'dynamic']
+
+
 # static composite of minerals/composites
 class Composite(Material):
     """
@@ -63,6 +74,7 @@ class Composite(Material):
             fractions = [fr / total for fr in fractions]
 
         self.children = zip(fractions, phases)
+        self._unrolled = None
 
     def debug_print(self, indent=""):
         print "%sComposite:" % indent
@@ -79,16 +91,74 @@ class Composite(Material):
         for (fraction, phase) in self.children:
             phase.set_method(method)
 
+    def set_warm_start(self, warm_start):
+        """
+        Switch warm started volume solves on or off for all the phases in the composite
+        """
+        for (fraction, phase) in self.children:
+            phase.set_warm_start(warm_start)
+
     def unroll(self):
+        """
+        Return the lists of the molar fractions and of the minerals of the
+        composite, with nested materials unrolled.  The result is kept until
+        the children change, or until a child whose unroll() depends on the
+        state (see
+        :data:`burnman.Material.unroll_depends_on_state`, e.g. a
+        :class:`burnman.mineral_helpers.HelperSpinTransition`) unrolls to
+        other minerals.
+        """
+        unrolled = self._unroll_cached()
+        return (list(unrolled.fractions), list(unrolled.minerals))
+
+    def unroll_arrays(self):
+        """
+        Like :func:`unroll`, but returns the cached (read-only) array of the
+        molar fractions and the cached list of the minerals without copying
+        them, so the list must not be modified.  This is what the
+        evaluations at many points use.
+        """
+        unrolled = self._unroll_cached()
+        return (unrolled.fraction_array, unrolled.minerals)
+
+    def _unroll_cached(self):
+        unrolled = self.__dict__.get('_unrolled')
+        if unrolled is not None and unrolled.children == self.children:
+            for (phase, cached) in unrolled.composites:
+                if phase._unroll_cached() is not cached:
+                    break
+            else:
+                for (phase, fractions, ids) in unrolled.dynamic:
+                    p_fr, p_min = phase.unroll()
+                    if list(p_fr) != fractions or [id(m) for m in p_min] != ids:
+                        break
+                else:
+                    return unrolled
+
+        unrolled = _Unrolled()
+        unrolled.children = list(self.children)
+        unrolled.composites = []
+        unrolled.dynamic = []
         fractions = []
         minerals = []
-
         for (fraction, phase) in self.children:
-            p_fr,p_min = phase.unroll()
+            if isinstance(phase, Composite):
+                cached = phase._unroll_cached()
+                unrolled.composites.append((phase, cached))
+                p_fr, p_min = cached.fractions, cached.minerals
+            else:
+                p_fr, p_min = phase.unroll()
+                if phase.unroll_depends_on_state:
+                    unrolled.dynamic.append((phase, list(p_fr), [id(m) for m in p_min]))
             check_pairs(p_fr, p_min)
             fractions.extend([i*fraction for i in p_fr])
             minerals.extend(p_min)
-        return (fractions, minerals)
+        unrolled.fractions = fractions
+        unrolled.fraction_array = np.array(fractions)
+        unrolled.fraction_array.flags.writeable = False
+        unrolled.minerals = minerals
+        self._unrolled = unrolled
+        return unrolled
 
     def to_string(self):
         """
@@ -96,14 +166,17 @@ class Composite(Material):
         """
         return "'" + self.__class__.__name__ + "'"
 
-    def set_state(self, pressure, temperature):
+    def set_state(self, pressure, temperature, properties=None):
         """
         Update the material to the given pressure [Pa] and temperature [K].
+        The properties of each phase are computed on first access, or right
+        away if they are listed in properties, see
+        :func:`burnman.Mineral.set_state`.
         """
         self.pressure = pressure
         self.temperature = temperature
         for (fraction, phase) in self.children:
-            phase.set_state(pressure, temperature)
+            phase.set_state(pressure, temperature, properties)
 
     def density(self):
         """
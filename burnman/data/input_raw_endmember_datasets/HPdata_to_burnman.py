@@ -2,11 +2,14 @@
 # Copyright (C) 2012-2014, Myhill, R., Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
 # Released under GPL v2 or later.
 
-# This is a standalone program that converts the Holland and Powell data format into the standard burnman format (printed to stdout)
+# This is a standalone program that converts the Holland and Powell data format into the standard burnman format
+# (the data file of burnman.minerals.catalogue, and the module printed to stdout)
 # It only outputs properties of solid endmembers - other endmembers are currently ignored.
 
 
 import sys
+sys.path.insert(1, '../../..')
+from burnman.minerals import catalogue
 
 # Components
 components=['Si','Ti','Al','Fe','Mg','Mn','Ca','Na','K','O','H','C','Cl','e-','Ni','Zr','S','Cu','Cr']
@@ -52,6 +55,42 @@ def getmbr(ds, mbr):
             endmember=Endmember(mbr,atoms,formula, int(ds[i*4+3][1]), map(float,ds[i*4+3][2:(len(ds[i*4+3])-1)]), float(ds[i*4+4][0]), float(ds[i*4+4][1]), float(ds[i*4+4][2]), map(float,ds[i*4+5]), float(ds[i*4+6][0]), map(float,ds[i*4+6][1:4]), flag, map(float,ds[i*4+6][5:]))
             return endmember
 
+def rounded(value):
+    # values are rounded to the 12 significant digits that str() prints
+    return float(str(value))
+
+endmembers=[]
+for i in range(int(ds[0][0])):
+    mbr=ds[i*4+3][0]
+    M=getmbr(ds,mbr)
+    if mbr == 'and': # change silly abbreviation
+        mbr = 'andalusite'
+    if M.flag != -1 and M.flag != -2 and M.k[0] > 0:
+        params = {'name': M.name,
+                  'equation_of_state': 'hp_tmt',
+                  'H_0': rounded(M.H*1e3),
+                  'S_0': rounded(M.S*1e3),
+                  'V_0': rounded(M.V*1e-5),
+                  'Cp': [round(M.Cp[0]*1e3,10), round(M.Cp[1]*1e3,10), round(M.Cp[2]*1e3,10), round(M.Cp[3]*1e3,10)],
+                  'a_0': rounded(M.a),
+                  'K_0': rounded(M.k[0]*1e8),
+                  'Kprime_0': rounded(M.k[1]),
+                  'Kdprime_0': rounded(M.k[2]*1e-8)}
+        if M.flag==1:
+            params.update({'landau_Tc': rounded(M.od[0]),
+                           'landau_Smax': rounded(M.od[1]*1e3),
+                           'landau_Vmax': rounded(M.od[2]*1e-5)})
+        if M.flag==2:
+            params.update({'BW_deltaH': rounded(M.od[0]*1e3),
+                           'BW_deltaV': rounded(M.od[1]*1e-5),
+                           'BW_W': rounded(M.od[2]*1e3),
+                           'BW_Wv': rounded(M.od[3]*1e-5),
+                           'BW_n': rounded(M.od[4]),
+                           'BW_factor': rounded(M.od[5])})
+        endmembers.append((mbr, M.formula, params, None))
+
+catalogue.write_dataset('../input_endmember_datasets/HP_2011_ds62.json', 'HP_2011_ds62', endmembers)
+
 print '# BurnMan - a lower mantle toolkit'
 print '# Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.'
 print '# Released under GPL v2 or later.'
@@ -69,6 +108,7 @@ print 'from burnman.mineral import Mineral'
 print 'from burnman.solidsolution import SolidSolution'
 print 'from burnman.solutionmodel import *'
 print 'from burnman.processchemistry import read_masses, dictionarize_formula, formula_mass'
+print 'from burnman.minerals import catalogue'
 print ''
 print 'atomic_masses=read_masses()'
 print ''
@@ -80,47 +120,9 @@ fin.close()
 
 print '"""'
 print 'ENDMEMBERS'
-print '"""'     
 print ''
-formula='0'
-for i in range(int(ds[0][0])):
-    mbr=ds[i*4+3][0]
-    M=getmbr(ds,mbr)
-    if mbr == 'and': # change silly abbreviation
-        mbr = 'andalusite'
-    if M.flag != -1 and M.flag != -2 and M.k[0] > 0:
-        print 'class', mbr, '(Mineral):'
-        print '    def __init__(self):'
-        print ''.join(['        formula=\'',M.formula,'\''])
-        print '        formula = dictionarize_formula(formula)'
-        print '        self.params = {'
-        print ''.join(['            \'name\': \'', M.name, '\','])
-        print '            \'formula\': formula,'
-        print '            \'equation_of_state\': \'hp_tmt\','
-        print '            \'H_0\':', M.H*1e3, ','
-        print '            \'S_0\':', M.S*1e3, ','
-        print '            \'V_0\':', M.V*1e-5, ','
-        print '            \'Cp\':', [round(M.Cp[0]*1e3,10), round(M.Cp[1]*1e3,10), round(M.Cp[2]*1e3,10), round(M.Cp[3]*1e3,10)], ','
-        print '            \'a_0\':', M.a, ','
-        print '            \'K_0\':', M.k[0]*1e8, ','
-        print '            \'Kprime_0\':', M.k[1], ','
-        print '            \'Kdprime_0\':', M.k[2]*1e-8, ','
-        print '            \'n\': sum(formula.values()),'
-        if M.flag==0:
-            print '            \'molar_mass\': formula_mass(formula, atomic_masses)}'
-        else:
-            print '            \'molar_mass\': formula_mass(formula, atomic_masses),'
-        if M.flag==1:
-            print '            \'landau_Tc\':', M.od[0], ','
-            print '            \'landau_Smax\':', M.od[1]*1e3, ','
-            print '            \'landau_Vmax\':', M.od[2]*1e-5, '}'
-        if M.flag==2:
-            print '            \'BW_deltaH\':', M.od[0]*1e3, ','
-            print '            \'BW_deltaV\':', M.od[1]*1e-5, ','
-            print '            \'BW_W\':', M.od[2]*1e3, ','
-            print '            \'BW_Wv\':', M.od[3]*1e-5, ','
-            print '            \'BW_n\':', M.od[4], ','
-            print '            \'BW_factor\':', M.od[5], '}'
-        print '        Mineral.__init__(self)'
-        print ''
+print 'The endmember classes are made by burnman.minerals.catalogue from'
+print 'data/input_endmember_datasets/HP_2011_ds62.json'
+print '"""'
 print ''
+print "globals().update(catalogue.mineral_classes('HP_2011_ds62'))"
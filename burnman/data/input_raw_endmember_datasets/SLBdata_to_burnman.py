@@ -2,10 +2,13 @@
 # Copyright (C) 2012-2014, Myhill, R., Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
 # Released under GPL v2 or later.
 
-# This is a standalone program that converts a tabulated version of the Stixrude and Lithgow-Bertelloni data format into the standard burnman format (printed to stdout)
+# This is a standalone program that converts a tabulated version of the Stixrude and Lithgow-Bertelloni data format into the standard burnman format
+# (the data file of burnman.minerals.catalogue, and the module printed to stdout)
 
 
 import sys
+sys.path.insert(1, '../../..')
+from burnman.minerals import catalogue
 
 def read_dataset(datafile):
     f=open(datafile,'r')
@@ -16,6 +19,43 @@ def read_dataset(datafile):
 
 ds=read_dataset('slb_2011.txt')
 
+param_scales = [ -1., -1., #not nubmers, so we won't scale
+                  1.e3, 1.e3, #KJ -> J
+                  1.e-6, 1.e-6, #cm^3/mol -> m^3/mol
+                  1.e9, 1.e9, #GPa -> Pa
+                  1.0, 1.0, # no scale for K'
+                  1.0, 1.0, # no scale for Debye
+                  1.0, 1.0, # no scale for gruneisen
+                  1.0, 1.0, # no scale for q
+                  1.e9, 1.e9, #GPa -> Pa
+                  1.0, 1.0, # no scale for G'
+                  1.0, 1.0] # no scale for eta_s 
+
+
+def rounded(value):
+    # values are rounded to the 12 significant digits that str() prints
+    return float(str(value))
+
+# quartz is not in the database
+excluded=['Quartz']
+
+endmembers=[]
+for idx, m in enumerate(ds):
+    if idx == 0:
+        param_names=m
+    elif m[0] not in excluded:
+        params = {'name': str(m[0]),
+                  'equation_of_state': 'slb3'}
+        uncertainties = {}
+        for pid, param in enumerate(m):
+            if pid > 1 and pid%2 == 0:
+                params[str(param_names[pid])] = rounded(float(param)*param_scales[pid])
+            elif pid > 1 and pid%2 == 1 and pid<22:
+                uncertainties[str(param_names[pid])] = rounded(float(param)*param_scales[pid])
+        endmembers.append((str(m[0].lower()), str(m[1]), params, uncertainties))
+
+catalogue.write_dataset('../input_endmember_datasets/SLB_2011.json', 'SLB_2011', endmembers)
+
 print '# BurnMan - a lower mantle toolkit'
 print '# Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.'
 print '# Released under GPL v2 or later.'
@@ -30,23 +70,11 @@ print 'from burnman.mineral import Mineral'
 print 'from burnman.solidsolution import SolidSolution'
 print 'from burnman.solutionmodel import *'
 print 'from burnman.processchemistry import read_masses, dictionarize_formula, formula_mass'
+print 'from burnman.minerals import catalogue'
 print ''
 print 'atomic_masses=read_masses()'
 print ''
 
-param_scales = [ -1., -1., #not nubmers, so we won't scale
-                  1.e3, 1.e3, #KJ -> J
-                  1.e-6, 1.e-6, #cm^3/mol -> m^3/mol
-                  1.e9, 1.e9, #GPa -> Pa
-                  1.0, 1.0, # no scale for K'
-                  1.0, 1.0, # no scale for Debye
-                  1.0, 1.0, # no scale for gruneisen
-                  1.0, 1.0, # no scale for q
-                  1.e9, 1.e9, #GPa -> Pa
-                  1.0, 1.0, # no scale for G'
-                  1.0, 1.0] # no scale for eta_s 
-
-
 solutionfile='slb_2011_solutions.txt'
 with open(solutionfile, 'r') as fin:
     print fin.read()
@@ -54,38 +82,13 @@ fin.close()
 
 print '"""'
 print 'ENDMEMBERS'
-print '"""'             
 print ''
-formula='0'
-for idx, m in enumerate(ds):
-    if idx == 0:
-        param_names=m
-    else:
-        print 'class', m[0].lower(), '(Mineral):'
-        print '    def __init__(self):'
-        print ''.join(['        formula=\'',m[1],'\''])
-        print '        formula = dictionarize_formula(formula)'
-        print '        self.params = {'
-        print ''.join(['            \'name\': \'', m[0], '\','])
-        print '            \'formula\': formula,'
-        print '            \'equation_of_state\': \'slb3\','
-        for pid, param in enumerate(m):
-            if pid > 1 and pid%2 == 0:
-                print '            \''+param_names[pid]+'\':', float(param)*param_scales[pid], ','
-        print '            \'n\': sum(formula.values()),'
-        print '            \'molar_mass\': formula_mass(formula, atomic_masses)}'
-        print ''
-        print '        self.uncertainties = {'
-        for pid, param in enumerate(m):
-            if pid > 1 and pid%2 == 1 and pid<21:
-                print '            \''+param_names[pid]+'\':', float(param)*param_scales[pid], ','
-        pid=21
-        param=m[pid]
-        print '            \''+param_names[pid]+'\':', float(param)*param_scales[pid], '}'
-        print '        Mineral.__init__(self)'
-        print ''
-
-
+print 'The endmember classes are made by burnman.minerals.catalogue from'
+print 'data/input_endmember_datasets/SLB_2011.json'
+print '"""'
+print ''
+print "globals().update(catalogue.mineral_classes('SLB_2011'))"
+print ''
 
 aliasfile='slb_2011_aliases.txt'
 with open(aliasfile, 'r') as fin:
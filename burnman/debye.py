@@ -108,48 +108,215 @@ def debye_fn_cheb(x):
         return ((val_infinity/x)/x)/x;
 
 
-def thermal_energy(T, debye_T, n):
+def debye_fn_array(x, tabulated=False):
+    """
+    Evaluate the Debye function for a float or an array of x = Debye_T/T.
+    The branches of :func:`debye_fn_cheb` are evaluated with masked array
+    operations, giving the same values.  If tabulated is True, the Debye
+    function is interpolated from :data:`debye_table` instead, which is
+    faster for large arrays.  Values of x must be positive.
+    """
+    if tabulated:
+        return _debye_fn_table(x)
+    if np.ndim(x) == 0:
+        return debye_fn_cheb(x)
+
+    x = np.asarray(x, dtype=float)
+    if x.size == 1:
+        # single points (e.g. from a scalar volume solve) are cheaper without the masks
+        return np.full(x.shape, debye_fn_cheb(x.item()))
+    if np.any(x <= 0.0) or np.any(np.isnan(x)):
+        raise ValueError("the Debye function is only defined for positive x")
+    D = np.empty(x.shape)
+    val_infinity = 19.4818182068004875
+    xcut = -log_eps
+
+    small = x < 2.0*np.sqrt(2.0)*sqrt_eps
+    cheb = ~small & (x <= 4.0)
+    series = (x > 4.0) & (x < -(np.log(2.0) + log_eps))
+    asymptotic = (x >= -(np.log(2.0) + log_eps)) & (x < xcut)
+    large = x >= xcut
+
+    if np.any(small):
+        xs = x[small]
+        D[small] = 1.0 - 3.0*xs/8.0 + xs*xs/20.0
+
+    if np.any(cheb):
+        xc = x[cheb]
+        D[cheb] = _chebval(xc*xc/8.0 - 1.0, chebyshev_representation) - 0.375*xc
+
+    if np.any(series):
+        # the same sum as in debye_fn_cheb, with the terms k > nexp masked out
+        xs = x[series]
+        nexp = np.floor(xcut/xs)
+        ex = np.exp(-xs)
+        sum = np.zeros(xs.shape)
+        for k in range(int(np.max(nexp)), 0, -1):
+            xk_inv = 1.0/(k*xs)
+            term = sum*ex + (((6.0*xk_inv + 6.0)*xk_inv + 3.0)*xk_inv + 1.0) / k
+            sum = np.where(k <= nexp, term, sum)
+        D[series] = val_infinity/(xs*xs*xs) - 3.0 * sum * ex
+
+    if np.any(asymptotic):
+        xa = x[asymptotic]
+        x3 = xa*xa*xa
+        D[asymptotic] = (val_infinity - 3.0 * (6.0 + 6.0*xa + 3.0*xa*xa + x3) * np.exp(-xa)) / x3
+
+    if np.any(large):
+        xl = x[large]
+        D[large] = ((val_infinity/xl)/xl)/xl
+
+    return D
+
+
+"""
+Spacing in x = Debye_T/T of the table used by the tabulated Debye function.
+The Debye function is interpolated with cubic Hermite polynomials using its
+values and derivatives at the nodes, which gives a relative error of less
+than 2e-12 compared to :func:`debye_fn_cheb` for all x.
+"""
+debye_table_spacing = 0.01
+
+"""
+Nodes, values and derivatives of the table for the tabulated Debye function,
+built on first use.  Beyond the last node the Debye function is evaluated
+from its asymptotic form (as in :func:`debye_fn_cheb`).
+"""
+debye_table = None
+
+
+def _build_debye_table():
+    global debye_table
+    x = np.arange(0., -log_eps + 2.*debye_table_spacing, debye_table_spacing)
+    D = np.empty(x.shape)
+    dD = np.empty(x.shape)
+    D[0] = 1.0
+    dD[0] = -3.0/8.0
+    D[1:] = debye_fn_array(x[1:])
+    # D'(x) = 3/(exp(x)-1) - 3 D(x)/x
+    dD[1:] = 3.0/np.expm1(x[1:]) - 3.0*D[1:]/x[1:]
+    debye_table = (x, D, dD)
+    return debye_table
+
+
+def _debye_fn_table(x):
+    x_nodes, D_nodes, dD_nodes = debye_table if debye_table is not None else _build_debye_table()
+    x = np.asarray(x, dtype=float)
+    if np.any(x <= 0.0) or np.any(np.isnan(x)):
+        raise ValueError("the Debye function is only defined for positive x")
+    h = debye_table_spacing
+    i = np.minimum((x/h).astype(int), len(x_nodes) - 2)
+    t = x/h - i
+    t2 = t*t
+    t3 = t2*t
+    D = (2.*t3 - 3.*t2 + 1.)*D_nodes[i] + (t3 - 2.*t2 + t)*h*dD_nodes[i] \
+        + (-2.*t3 + 3.*t2)*D_nodes[i+1] + (t3 - t2)*h*dD_nodes[i+1]
+    return np.where(x < x_nodes[-1], D, 19.4818182068004875/(x*x*x))
+
+
+def _array_state(T, debye_T):
+    """
+    Broadcast temperatures and Debye temperatures to arrays, and return them
+    together with x = Debye_T/T and a mask of the temperatures that are
+    numerically zero (where x is replaced by one, as all the thermal
+    functions are zero there).
+    """
+    T, debye_T = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(debye_T, dtype=float))
+    cold = T <= eps
+    x = debye_T/np.where(cold, 1.0, T)
+    x = np.where(cold, 1.0, x)
+    return T, x, cold
+
+
+def _thermal_properties_array(T, debye_T, n, tabulated):
+    T, x, cold = _array_state(T, debye_T)
+    D = debye_fn_array(x, tabulated)
+    nR = n*constants.gas_constant
+    ex = np.exp(-x)
+    log_term = np.log1p(-ex)
+    E_th = np.where(cold, 0., 3.*nR*T * D)
+    C_v = np.where(cold, 0., 3.0*nR* ( 4.0*D - 3.0*x*ex/(1.0-ex) ))
+    F = np.where(cold, 0., nR*T * ( 3.0*log_term - D ))
+    S = np.where(cold, 0., nR * ( 4.*D - 3.*log_term ))
+    return E_th, C_v, F, S
+
+
+def thermal_energy(T, debye_T, n, tabulated=False):
     """
     calculate the thermal energy of a substance.  Takes the temperature,
     the Debye temperature, and n, the number of atoms per molecule.
-    Returns thermal energy in J/mol
+    Returns thermal energy in J/mol.  T and debye_T can be floats or arrays,
+    see :func:`debye_fn_array` for tabulated.
     """
+    if np.ndim(T) != 0 or np.ndim(debye_T) != 0 or tabulated:
+        T, x, cold = _array_state(T, debye_T)
+        return np.where(cold, 0., 3.*n*constants.gas_constant*T * debye_fn_array(x, tabulated))
     if T <= eps:
         return 0.
     E_th = 3.*n*constants.gas_constant*T * debye_fn_cheb(debye_T/T)
     return E_th
 
-def heat_capacity_v(T,debye_T,n):
+def heat_capacity_v(T, debye_T, n, tabulated=False):
     """
-    Heat capacity at constant volume.  In J/K/mol
+    Heat capacity at constant volume.  In J/K/mol.  T and debye_T can be
+    floats or arrays, see :func:`debye_fn_array` for tabulated.
     """
+    if np.ndim(T) != 0 or np.ndim(debye_T) != 0 or tabulated:
+        return _thermal_properties_array(T, debye_T, n, tabulated)[1]
     if T <= eps:
         return 0.
     x = debye_T/T
     C_v = 3.0*n*constants.gas_constant* ( 4.0*debye_fn_cheb(x) - 3.0*x/(np.exp(x)-1.0) )
     return C_v
 
-def helmholtz_free_energy(T, debye_T, n):
+def helmholtz_free_energy(T, debye_T, n, tabulated=False):
     """
     Helmholtz free energy of lattice vibrations in the Debye model.
     It is important to note that this does NOT include the zero 
     point energy of vibration for the lattice.  As long as you are 
     calculating relative differences in F, this should cancel anyways.
-    In Joules.
+    In Joules.  T and debye_T can be floats or arrays, see
+    :func:`debye_fn_array` for tabulated.
     """
+    if np.ndim(T) != 0 or np.ndim(debye_T) != 0 or tabulated:
+        return _thermal_properties_array(T, debye_T, n, tabulated)[2]
     if T <= eps:
         return 0.
     x = debye_T/T
     F = n * constants.gas_constant * T * ( 3.0 * np.log( 1.0 - np.exp(-x)) - debye_fn_cheb(x) )
     return F
 
-def entropy( T, debye_T, n):
+def entropy( T, debye_T, n, tabulated=False):
     """
-    Entropy due to lattice vibrations in the Debye model [J/K]
+    Entropy due to lattice vibrations in the Debye model [J/K].  T and
+    debye_T can be floats or arrays, see :func:`debye_fn_array` for tabulated.
     """
+    if np.ndim(T) != 0 or np.ndim(debye_T) != 0 or tabulated:
+        return _thermal_properties_array(T, debye_T, n, tabulated)[3]
     if T <= eps:
         return 0.
     x = debye_T/T
     S = n * constants.gas_constant * ( 4. * debye_fn_cheb(x) - 3. * np.log( 1.0 - np.exp(-x) ) ) 
     return S
 
+def thermal_properties(T, debye_T, n, tabulated=False):
+    """
+    Thermal energy [J/mol], heat capacity at constant volume [J/K/mol],
+    Helmholtz free energy [J/mol] and entropy [J/K/mol] of lattice vibrations
+    in the Debye model, as returned by the functions above, but sharing a
+    single evaluation of the Debye function.  T and debye_T can be floats or
+    arrays, see :func:`debye_fn_array` for tabulated.
+    """
+    if np.ndim(T) != 0 or np.ndim(debye_T) != 0 or tabulated:
+        return _thermal_properties_array(T, debye_T, n, tabulated)
+    if T <= eps:
+        return 0., 0., 0., 0.
+    x = debye_T/T
+    D = debye_fn_cheb(x)
+    nR = n*constants.gas_constant
+    log_term = np.log( 1.0 - np.exp(-x) )
+    E_th = 3.*nR*T * D
+    C_v = 3.0*nR* ( 4.0*D - 3.0*x/(np.exp(x)-1.0) )
+    F = nR*T * ( 3.0*log_term - D )
+    S = nR * ( 4.*D - 3.*log_term )
+    return E_th, C_v, F, S
@@ -3,8 +3,8 @@
 # Released under GPL v2 or later.
 
 import numpy as np
-import scipy.optimize as opt
 import constants
+from burnman.eos import newton
 
 T_0=298.15 # Standard temperature = 25 C
 P_0=1.e5 # Standard pressure = 1.e5 Pa
@@ -18,6 +18,7 @@ def landau_ordering(P, T, params):
     Returns critical temperature [K] at pressure [Pa], 
     and the states of order [unitless] at the 
     reference temperature and temperature of interest  
+    P and T can be floats or arrays.
 
     from Holland and Powell, 1996 
     """
@@ -25,12 +26,9 @@ def landau_ordering(P, T, params):
             # Q_0 is Q at T0, P0? 
     Q_0=np.power((params['landau_Tc']-T_0)/params['landau_Tc'],1./4.)
     
-    # Find state of ordering
+    # Find state of ordering (zero above Tcstar)
     # Note that Q > 1 where Vmax*P > Smax*T. 
-    if Tcstar-T > 0.:
-        Q=np.power((Tcstar-T)/params['landau_Tc'],1./4.)
-    else:
-        Q=0.0
+    Q=np.power(np.maximum(Tcstar-T, 0.)/params['landau_Tc'],1./4.)
 
     return Tcstar, Q_0, Q
 
@@ -91,13 +89,28 @@ def heat_capacity_p_disorder_Landau(P, T, params):
     """
     # N.B. Assumes Vt==1, see above
     Tcstar, Q_0, Q = landau_ordering(P, T, params)
-    Hdisord=gibbs_disorder_Landau(P, T, params) + T*entropy_disorder_Landau(P, T, params)
-    if Q==0.:
-        Cp_disord=0.
-    else:
+    with np.errstate(divide='ignore'):
+        Cp_disord=np.where(Q==0., 0., params['landau_Smax']/(2.*np.sqrt(np.maximum(Tcstar-T, 0.)*params['landau_Tc'])))
+    return Cp_disord if np.ndim(Cp_disord) != 0 else float(Cp_disord)
 
-        Cp_disord=params['landau_Smax']/(2.*np.sqrt((Tcstar-T)*params['landau_Tc']))
-    return Cp_disord
+def disorder_Landau(P, T, params):
+    """
+    Returns the Gibbs energy [J/mol], entropy [J/K/mol], enthalpy [J/mol]
+    and heat capacity [J/K/mol] of disordering from the Landau model (see
+    the functions above) for a pressure [Pa] and temperature [K], or for
+    arrays of them, with a single evaluation of the states of order.
+    """
+    # N.B. Assumes Vt==1, see above
+    Tcstar, Q_0, Q = landau_ordering(P, T, params)
+    Tc=params['landau_Tc']
+    Smax=params['landau_Smax']
+    Q2=Q*Q
+    Q_02=Q_0*Q_0
+    Gdisord=Tc*Smax*(Q_02 - np.power(Q_0,6)/3.0) - Smax*(Tcstar*Q2 - Tc*Q2*Q2*Q2/3.0) - T*(Smax*(Q_02 - Q2)) + P*(params['landau_Vmax']*Q_02)
+    Sdisord=Smax*(Q_02 - Q2)
+    with np.errstate(divide='ignore'):
+        Cp_disord=np.where(Q==0., 0., Smax/(2.*np.sqrt(np.maximum(Tcstar-T, 0.)*Tc)))
+    return Gdisord, Sdisord, Gdisord + T*Sdisord, Cp_disord
 
 
 # see derivation in thermodynamic_introduction.pdf
@@ -122,30 +135,85 @@ def equilibrium_Q(Q, deltaS, P, T, params):
         Q=0.9 # A simple catch to make sure the optimisation doesn't fail
     return params['BW_deltaH'] - params['BW_factor']*T*deltaS + P*params['BW_deltaV'] + params['BW_factor']*constants.gas_constant*T*(lnxdisord(n,Q) - lnxord(n,Q)) + (2.*Q - 1.)*W
 
-# Energy of disordering from Bragg-Williams symmetric model; see Holland and Powell, 1996
-def gibbs_disorder_BW(P, T, params):
+# derivatives of lnxord and lnxdisord with respect to Q
+def dlnxorddQ(n,Q):
+    return n/(1.+n*Q) + n/(n+Q)
+
+def dlnxdisorddQ(n,Q):
+    return (n/(1.+n))*(1./(1.+n*Q) - 2./(1.-Q) + n/(n+Q))
+
+# Q is bracketed by [Q_min, 1 - Q_min], as lnxdisord is singular at Q=1
+Q_min = 1.e-12
+
+def order_parameter_BW(P, T, params):
+    """
+    Returns the equilibrium state of order Q [unitless] of the
+    Bragg-Williams model (the root of :func:`equilibrium_Q`) for a pressure
+    [Pa] and temperature [K], or for arrays of them.  All points are solved
+    together with :func:`burnman.eos.newton.safeguarded_newton`, bracketed
+    on (0, 1).
+    """
+    P, T = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(T, dtype=float))
+    shape = P.shape
+    P = P.ravel()
+    T = T.ravel()
     n=params['BW_n']
+    f=params['BW_factor']
     deltaS=entropydisorder(n)
-    Q=opt.fsolve(equilibrium_Q, 0.999995, args=(deltaS, P, T, params))[0]
+    R=constants.gas_constant
+
+    # The residual goes like log(1-Q) for Q close to one (the common case), so
+    # we solve for x = log(1-Q), in which it is almost linear
+    def func(x, idx):
+        Q=-np.expm1(x)
+        W=params['BW_W'] + P[idx]*params['BW_Wv']
+        RT=f*R*T[idx]
+        residual = params['BW_deltaH'] - f*T[idx]*deltaS + P[idx]*params['BW_deltaV'] + RT*(lnxdisord(n,Q) - lnxord(n,Q)) + (2.*Q - 1.)*W
+        return residual, -(1.-Q)*(RT*(dlnxdisorddQ(n,Q) - dlnxorddQ(n,Q)) + 2.*W)
+
+    # points with the root beyond one of the ends of the bracket are (numerically)
+    # fully ordered or disordered, only the others need to be solved for
+    idx = np.arange(len(P))
+    x_min = np.log(Q_min)
+    x_max = np.log1p(-Q_min)
+    x = np.zeros(len(P))
+    x[func(np.ones(len(P))*x_max, idx)[0] <= 0.] = x_max
+    x[func(np.ones(len(P))*x_min, idx)[0] >= 0.] = x_min
+    inside = idx[(x != x_min) & (x != x_max)]
+    if len(inside) > 0:
+        x[inside] = newton.safeguarded_newton(lambda x, i: func(x, inside[i]), np.log(0.5)*np.ones(len(inside)),
+                                              x_min, x_max, decreasing=False)[0]
+    return (-np.expm1(x)).reshape(shape)
+
+def disorder_BW(P, T, params, Q=None):
+    """
+    Returns the Gibbs energy [J/mol], entropy [J/K/mol] and enthalpy [J/mol]
+    of disordering from the Bragg-Williams symmetric model (Holland and
+    Powell, 1996) for a pressure [Pa] and temperature [K], or for arrays of
+    them, with a single solve for the equilibrium state of order Q (see
+    :func:`order_parameter_BW`), unless Q is given.
+    """
+    if Q is None:
+        Q=order_parameter_BW(P, T, params)
+    n=params['BW_n']
+    f=params['BW_factor']
+    R=constants.gas_constant
     W=params['BW_W'] + P*params['BW_Wv']
-    ideal=(1.-Q)*(params['BW_deltaH'] - params['BW_factor']*T*entropydisorder(n) + P*params['BW_deltaV'] + params['BW_factor']*constants.gas_constant*T*lnxdisord(n,Q)) + params['BW_factor']*Q*(constants.gas_constant*T*lnxord(n,Q))
+    deltaS=entropydisorder(n)
+    lnxo=lnxord(n,Q)
+    lnxd=lnxdisord(n,Q)
     nonideal=(1.-Q)*Q*W
-    Edisord=ideal+nonideal
-    return Edisord
+    Hdisord=(1.-Q)*(params['BW_deltaH'] + P*params['BW_deltaV']) + nonideal
+    Sdisord=f*((1.-Q)*(deltaS - R*lnxd) - Q*(R*lnxo))
+    Gdisord=Hdisord - T*Sdisord
+    return Gdisord, Sdisord, Hdisord
+
+# Energy of disordering from Bragg-Williams symmetric model; see Holland and Powell, 1996
+def gibbs_disorder_BW(P, T, params):
+    return disorder_BW(P, T, params)[0]
 
 def entropy_disorder_BW(P, T, params):
-    n=params['BW_n']
-    deltaS=entropydisorder(n)
-    Q=opt.fsolve(equilibrium_Q, 0.999995, args=(deltaS, P, T, params))[0]
-    Sdisord=params['BW_factor']*((1.-Q)*(entropydisorder(n) - constants.gas_constant*lnxdisord(n,Q)) - Q*(constants.gas_constant*lnxord(n,Q)))
-    return Sdisord
+    return disorder_BW(P, T, params)[1]
 
 def enthalpy_disorder_BW(P, T, params):
-    n=params['BW_n']
-    deltaS=entropydisorder(n)
-    Q=opt.fsolve(equilibrium_Q, 0.999995, args=(deltaS, P, T, params))[0]
-    W=params['BW_W'] + P*params['BW_Wv']
-    ideal=(1.-Q)*(params['BW_deltaH'] + P*params['BW_deltaV'])
-    nonideal=(1.-Q)*Q*W
-    Hdisord=ideal+nonideal
-    return Hdisord
+    return disorder_BW(P, T, params)[2]
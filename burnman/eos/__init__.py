@@ -10,6 +10,7 @@ Equation of State
 """
 
 from equation_of_state import EquationOfState
+from parameters import Parameters
 from birch_murnaghan import BM2, BM3
 from mie_grueneisen_debye import MGD2, MGD3
 from slb import SLB2, SLB3
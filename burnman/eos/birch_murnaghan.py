@@ -2,8 +2,10 @@
 # Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
 # Released under GPL v2 or later.
 
+import numpy as np
 import scipy.optimize as opt
 import equation_of_state as eos
+import newton
 import warnings
 
 def bulk_modulus(volume, params):
@@ -39,15 +41,25 @@ def density(pressure, params):
     """
     return params['molar_mass']/volume(pressure,params)
 
-def volume(pressure, params):
+def volume(pressure, params, guess=None, width=None):
     """
     Get the birch-murnaghan volume at a reference temperature for a given
-    pressure :math:`[Pa]`. Returns molar volume in :math:`[m^3]`
+    pressure :math:`[Pa]`. Returns molar volume in :math:`[m^3]`.
+    If a guess of the volume and its relative uncertainty width are given,
+    the volume is found with Newton's method starting from the guess
+    (see :func:`burnman.eos.newton.solve_volumes`).
     """
 
-    func = lambda x: birch_murnaghan(params['V_0']/x, params) - pressure
-    V = opt.brentq(func, 0.5*params['V_0'], 1.5*params['V_0'])
-    return V
+    if guess is None:
+        func = lambda x: birch_murnaghan(params['V_0']/x, params) - pressure
+        V = opt.brentq(func, 0.5*params['V_0'], 1.5*params['V_0'])
+        return V
+
+    func = lambda V, idx: (birch_murnaghan(params['V_0']/V, params) - pressure, -bulk_modulus(V, params)/V)
+    V, iterations, converged, bracketed = newton.solve_volumes(func, 1, 0.5*params['V_0'], 1.5*params['V_0'],
+                                                               params['V_0'], guess, width)
+    newton.check_volumes(converged, bracketed)
+    return float(V)
 
 def shear_modulus_second_order(volume, params):
     """
@@ -85,6 +97,14 @@ class BirchMurnaghanBase(eos.EquationOfState):
         """
         return volume(pressure,params)
 
+    def volume_from_guess(self, pressure, temperature, params, guess, width):
+        """
+        Returns volume :math:`[m^3]` as a function of pressure :math:`[Pa]`,
+        solved starting from guess, see
+        :func:`burnman.eos.EquationOfState.volume_from_guess`.
+        """
+        return volume(pressure, params, guess, width)
+
     def pressure(self, temperature, volume, params):
         return birch_murnaghan(params['V_0']/volume, params)
 
@@ -134,6 +154,32 @@ class BirchMurnaghanBase(eos.EquationOfState):
         """
         return 0.
 
+    def evaluate(self, pressures, temperatures, params):
+        """
+        Vectorized version of :func:`burnman.eos.EquationOfState.evaluate`.
+        The volumes are found point by point with :func:`volume`, all other
+        properties are computed for all points at once. This equation of state
+        does not provide thermodynamic potentials, so those are nan.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        V = np.empty(P.shape)
+        for idx in np.ndindex(P.shape):
+            V[idx] = volume(P[idx], params)
+
+        K = bulk_modulus(V, params)
+        if(self.order == 2):
+            G = shear_modulus_second_order(V, params)
+        elif(self.order == 3):
+            G = shear_modulus_third_order(V, params)
+
+        zeros = np.zeros(P.shape)
+        large = np.empty(P.shape)
+        large.fill(1.e99)
+        nans = np.empty(P.shape)
+        nans.fill(float('nan'))
+        return {'V': V, 'gr': zeros, 'K_T': K, 'K_S': K.copy(), 'G': G, 'C_v': large, 'C_p': large.copy(),
+                'alpha': zeros.copy(), 'gibbs': nans, 'helmholtz': nans.copy(), 'S': nans.copy(), 'H': nans.copy()}
+
     def validate_parameters(self, params):
         """
         Check for existence and validity of the parameters
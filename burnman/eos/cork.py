@@ -126,6 +126,22 @@ class CORK(eos.EquationOfState):
         """
         return 0.
                   
+    def evaluate(self, pressures, temperatures, params):
+        """
+        Vectorized version of :func:`burnman.eos.EquationOfState.evaluate`.
+        Only the volume and the Gibbs free energy are provided by this
+        equation of state, the other thermodynamic potentials are nan.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        V = self.volume(P, T, params)
+        gibbs = self.gibbs_free_energy(P, T, V, params) + np.zeros(P.shape)
+        zeros = np.zeros(P.shape)
+        nans = np.empty(P.shape)
+        nans.fill(float('nan'))
+        return {'V': V, 'gr': zeros, 'K_T': zeros.copy(), 'K_S': zeros.copy(), 'G': zeros.copy(),
+                'C_v': zeros.copy(), 'C_p': zeros.copy(), 'alpha': zeros.copy(),
+                'gibbs': gibbs, 'helmholtz': nans, 'S': nans.copy(), 'H': nans.copy()}
+
     def validate_parameters(self, params):
         """
         Check for existence and validity of the parameters
@@ -11,12 +11,27 @@ Functions for the Einstein model of a solid.
 
 eps = np.finfo(np.float).eps
 
+def _array_state(T, einstein_T):
+    """
+    Broadcast temperatures and Einstein temperatures to arrays, and return
+    x = einstein_T/T together with a mask of the temperatures that are
+    numerically zero (where x is replaced by one).
+    """
+    T, einstein_T = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(einstein_T, dtype=float))
+    cold = T <= eps
+    x = np.where(cold, 1.0, einstein_T/np.where(cold, 1.0, T))
+    return x, cold
+
 def thermal_energy(T, einstein_T, n):
     """
     calculate the thermal energy of a substance.  Takes the temperature,
     the Einstein temperature, and n, the number of atoms per molecule.
-    Returns thermal energy in J/mol
+    Returns thermal energy in J/mol.  T and einstein_T can be floats or arrays.
     """
+    if np.ndim(T) != 0 or np.ndim(einstein_T) != 0:
+        x, cold = _array_state(T, einstein_T)
+        with np.errstate(over='ignore'):
+            return 3.*n*constants.gas_constant*einstein_T*( 0.5 + np.where(cold, 0., 1. / np.expm1( x )) )
     if T <= eps:
         return 3.*n*constants.gas_constant*einstein_T*0.5 # zero point energy
     x = einstein_T/T
@@ -26,8 +41,13 @@ def thermal_energy(T, einstein_T, n):
 
 def heat_capacity_v(T,einstein_T,n):
     """
-    Heat capacity at constant volume.  In J/K/mol
+    Heat capacity at constant volume.  In J/K/mol.  T and einstein_T can be
+    floats or arrays.
     """
+    if np.ndim(T) != 0 or np.ndim(einstein_T) != 0:
+        x, cold = _array_state(T, einstein_T)
+        ex = np.exp( -x )
+        return np.where(cold, 0., 3.0*n*constants.gas_constant* ( x * x * ex / np.power( 1.0 - ex, 2.0 ) ))
     if T <= eps:
         return 0.
     x = einstein_T/T
@@ -2,6 +2,61 @@
 # Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
 # Released under GPL v2 or later.
 
+import numpy as np
+
+import parameters
+
+
+"""
+Names of the properties returned by :func:`EquationOfState.evaluate`. These
+are the same names as the attributes that :func:`burnman.Mineral.set_state`
+sets on a mineral.
+"""
+property_names = ['V', 'gr', 'K_T', 'K_S', 'G', 'C_v', 'C_p', 'alpha', 'gibbs', 'helmholtz', 'S', 'H']
+
+"""
+Properties that an equation of state is allowed to leave unimplemented
+(or to fail on because of missing params). These are returned as nan.
+"""
+thermodynamic_property_names = ['gibbs', 'helmholtz', 'S', 'H']
+
+"""
+Properties needed for seismic velocities, densities and adiabats.
+"""
+elastic_property_names = ['V', 'gr', 'K_T', 'K_S', 'G', 'C_v', 'C_p', 'alpha']
+
+"""
+Named sets of properties that can be passed to :func:`burnman.Mineral.set_state`.
+The volume is part of every set, as all other properties depend on it.
+"""
+property_sets = {'all': property_names,
+                 'elastic': elastic_property_names,
+                 'thermodynamic': ['V'] + thermodynamic_property_names}
+
+
+def requested_properties(properties):
+    """
+    Turn the name of a property set ('all', 'elastic' or 'thermodynamic') or
+    a list of property names into a list of property names that always
+    includes the volume.
+    """
+    if isinstance(properties, basestring):
+        if properties not in property_sets:
+            raise ValueError("Unknown property set '" + properties + "', use one of " + ", ".join(sorted(property_sets)))
+        return property_sets[properties]
+
+    for name in properties:
+        if name not in property_names:
+            raise ValueError("Unknown property '" + name + "'")
+    return ['V'] + [name for name in property_names if name in properties and name != 'V']
+
+
+def broadcast_state(pressures, temperatures):
+    """
+    Convert pressures and temperatures to float arrays of a common shape.
+    """
+    return np.broadcast_arrays(np.asarray(pressures, dtype=float), np.asarray(temperatures, dtype=float))
+
 
 class EquationOfState(object):
     """
@@ -41,6 +96,34 @@ class EquationOfState(object):
         """
         raise NotImplementedError("")
 
+    def volume_from_guess(self, pressure, temperature, params, guess, width):
+        """
+        Returns the molar volume like :func:`volume`, but gives equations of
+        state that solve for the volume a starting point, e.g. the volume
+        extrapolated from a neighbouring point of a profile.  The default
+        implementation ignores the guess.
+
+        Parameters
+        ----------
+        pressure : float
+            Pressure at which to evaluate the equation of state. :math:`[Pa]`
+        temperature : float
+            Temperature at which to evaluate the equation of state. :math:`[K]`
+        params : dictionary
+            Dictionary containing material parameters required by the equation of state.
+        guess : float
+            Estimate of the molar volume. :math:`[m^3]`
+        width : float
+            Relative uncertainty of the guess, used for the initial bracket
+            of the solve.
+
+        Returns
+        -------
+        volume : float
+            Molar volume of the mineral. :math:`[m^3]`
+        """
+        return self.volume(pressure, temperature, params)
+
     def pressure(self, temperature, volume, params):
         """
         Parameters
@@ -331,6 +414,124 @@ class EquationOfState(object):
         """
         raise NotImplementedError("")
 
+    def evaluate(self, pressures, temperatures, params):
+        """
+        Evaluate the equation of state for many pressures and temperatures
+        at once. The equations of state that come with BurnMan implement
+        this with vectorized numpy operations. The implementation in the
+        base class calls the scalar functions above once per point, so that
+        user defined equations of state get this function for free.
+
+        Parameters
+        ----------
+        pressures : array of floats
+            Pressures at which to evaluate the equation of state. :math:`[Pa]`
+        temperatures : array of floats
+            Temperatures at which to evaluate the equation of state.
+            Needs to have the same shape as pressures (or be broadcastable to it). :math:`[K]`
+        params : dictionary
+            Dictionary containing material parameters required by the equation of state.
+
+        Returns
+        -------
+        properties : dictionary of arrays
+            Dictionary with one array for each entry in
+            :data:`burnman.eos.equation_of_state.property_names`
+            ('V', 'gr', 'K_T', 'K_S', 'G', 'C_v', 'C_p', 'alpha', 'gibbs',
+            'helmholtz', 'S', 'H'), in the same units as the scalar functions.
+            Thermodynamic potentials that are not available for this
+            equation of state or these params are nan.
+        """
+        pressures, temperatures = broadcast_state(pressures, temperatures)
+        result = dict( (name, np.empty(pressures.shape)) for name in property_names )
+
+        for idx in np.ndindex(pressures.shape):
+            P = pressures[idx]
+            T = temperatures[idx]
+            V = self.volume(P, T, params)
+            for (name, value) in self.properties(P, T, V, params).items():
+                result[name][idx] = value
+
+        return result
+
+    def properties(self, pressure, temperature, volume, params, names=property_names):
+        """
+        Evaluate all properties of the equation of state at once for a given
+        pressure, temperature and volume. This is what
+        :func:`burnman.Mineral.set_state` uses. The implementation in the
+        base class calls the functions above one by one, skipping those that
+        are not in names; equations of state can override it to share
+        intermediate results between properties.
+
+        Parameters
+        ----------
+        pressure : float
+            Pressure at which to evaluate the equation of state. [Pa]
+        temperature : float
+            Temperature at which to evaluate the equation of state. [K]
+        volume : float
+            Molar volume of the mineral.  For consistency this should be calculated
+            using :func:`volume`. [m^3]
+        params : dictionary
+            Dictionary containing material parameters required by the equation of state.
+        names : list of strings
+            Properties to compute, see :func:`requested_properties`. Defaults
+            to all of :data:`property_names`.
+
+        Returns
+        -------
+        properties : dictionary
+            Dictionary with one value for each entry in names (and possibly
+            others). Thermodynamic potentials that are not available for this
+            equation of state or these params are nan.
+        """
+        P = pressure
+        T = temperature
+        V = volume
+        result = {'V': V}
+        for (name, function) in [('gr', self.grueneisen_parameter), ('K_T', self.isothermal_bulk_modulus),
+                                 ('K_S', self.adiabatic_bulk_modulus), ('G', self.shear_modulus),
+                                 ('C_v', self.heat_capacity_v), ('C_p', self.heat_capacity_p),
+                                 ('alpha', self.thermal_expansivity)]:
+            if name in names:
+                result[name] = function(P, T, V, params)
+
+        for (name, function) in [('gibbs', self.gibbs_free_energy), ('helmholtz', self.helmholtz_free_energy),
+                                 ('S', self.entropy), ('H', self.enthalpy)]:
+            if name in names:
+                try:
+                    result[name] = function(P, T, V, params)
+                except (KeyError, NotImplementedError):
+                    result[name] = float('nan')
+
+        return result
+
+    def compile_parameters(self, params):
+        """
+        Build the compiled parameter record (a
+        :class:`burnman.eos.parameters.ParameterRecord`) that this equation
+        of state uses in its calculations, with the derived constants that
+        only depend on params precomputed.  The base class does not use a
+        record and returns None.
+        """
+        return None
+
+    def compiled_parameters(self, params):
+        """
+        Return the compiled parameter record for params (see
+        :func:`compile_parameters`).  If params is a
+        :class:`burnman.eos.parameters.Parameters` (as the params of a
+        :class:`burnman.Mineral` are), the record is kept until params are
+        modified, otherwise it is compiled on every call.
+        """
+        if not isinstance(params, parameters.Parameters):
+            return self.compile_parameters(params)
+        record = params.compiled.get(type(self))
+        if record is None:
+            record = self.compile_parameters(params)
+            params.compiled[type(self)] = record
+        return record
+
     def validate_parameters(self, params):
         """
         The params object is just a dictionary associating mineral physics parameters 
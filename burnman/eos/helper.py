@@ -12,32 +12,38 @@ import cork
 from equation_of_state import EquationOfState
 
 
+"""
+The equations of state that can be created from a string, see :func:`create`.
+"""
+methods = {"slb2": slb.SLB2,
+           "mgd2": mgd.MGD2,
+           "mgd3": mgd.MGD3,
+           "slb3": slb.SLB3,
+           "bm2": bm.BM2,
+           "bm3": bm.BM3,
+           "mt": mt.MT,
+           "hp_tmt": hp.HP_TMT,
+           "cork": cork.CORK}
+
+# the instances created from strings, which are shared between all minerals
+_instances = {}
+
+
 def create(method):
     """
     Creates an instance of an EquationOfState from a string,
     a class EquationOfState, or an instance of EquationOfState.
+    The equations of state do not keep any state of their own, so all
+    calls with the same string return the same instance.
     """
     if isinstance(method, basestring):
-        if method == "slb2":
-            return slb.SLB2()
-        elif method == "mgd2":
-            return mgd.MGD2()
-        elif method == "mgd3":
-            return mgd.MGD3()
-        elif method == "slb3":
-            return slb.SLB3()
-        elif method == "bm2":
-            return bm.BM2()
-        elif method == "bm3":
-            return bm.BM3()
-        elif method == "mt":
-            return mt.MT()
-        elif method == "hp_tmt":
-            return hp.HP_TMT()
-        elif method == "cork":
-            return cork.CORK()
-        else:
+        try:
+            return _instances[method]
+        except KeyError:
+            pass
+        if method not in methods:
             raise Exception("unsupported material method " + method)
+        return _instances.setdefault(method, methods[method]())
     elif isinstance(method, EquationOfState):
         return method
     elif inspect.isclass(method) and issubclass(method, EquationOfState):
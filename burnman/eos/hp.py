@@ -17,6 +17,35 @@ T_0=298.15 # Standard temperature = 25 C
 P_0=1.e5 # Standard pressure = 1.e5 Pa
 
 
+class HPParameters(mt.TaitParameters):
+    """
+    Compiled parameters of :class:`HP_TMT`, with the Einstein temperature,
+    the reference values of the Einstein functions and of the heat capacity
+    integrals precomputed, as well as the Bragg-Williams disordering terms
+    at the reference state (zero without Bragg-Williams disordering).
+    """
+    param_names = mt.TaitParameters.param_names + ['H_0', 'S_0', 'a_0', 'n']
+    __slots__ = ['H_0', 'S_0', 'a_0', 'n', 'Cp', 'einstein_T', 'C_V0', 'E_th_0', 'thermal_pressure_factor',
+                 'intCpdT_0', 'intCpoverTdT_0', 'BW_gibbs_0', 'BW_S_0', 'BW_H_0']
+
+    def compute_derived(self, params):
+        mt.TaitParameters.compute_derived(self, params)
+        self.Cp = tuple(params['Cp'])
+        Cp = self.Cp
+        # Empirical Einstein temperature
+        # Holland and Powell, 2011; base of p.346, para.1
+        self.einstein_T = 10636./(self.S_0/self.n + 6.44)
+        self.C_V0 = einstein.heat_capacity_v( T_0, self.einstein_T, self.n )
+        self.E_th_0 = einstein.thermal_energy( T_0, self.einstein_T, self.n )
+        self.thermal_pressure_factor = self.a_0*self.K_0 / self.C_V0
+        self.intCpdT_0 = Cp[0]*T_0 + 0.5*Cp[1]*T_0*T_0 - Cp[2]/T_0 + 2.0*Cp[3]*np.sqrt(T_0)
+        self.intCpoverTdT_0 = Cp[0]*np.log(T_0) + Cp[1]*T_0 - 0.5*Cp[2]/(T_0*T_0) - 2.0*Cp[3]/np.sqrt(T_0)
+        if 'BW_deltaH' in params:
+            self.BW_gibbs_0, self.BW_S_0, self.BW_H_0 = [float(x) for x in disorder_BW(P_0, T_0, params)]
+        else:
+            self.BW_gibbs_0 = self.BW_S_0 = self.BW_H_0 = 0.
+
+
 class HP_TMT(eos.EquationOfState):
     """
     Base class for the Holland and Powell (2011) correction to
@@ -35,7 +64,7 @@ class HP_TMT(eos.EquationOfState):
         EQ 12
         """
         Pth=self.__relative_thermal_pressure(temperature,params)
-        return mt.volume(pressure-Pth, params)
+        return mt._volume(pressure-Pth, self.compiled_parameters(params))
 
     def pressure(self, temperature, volume, params):
         """
@@ -61,7 +90,7 @@ class HP_TMT(eos.EquationOfState):
         temperature [K], and volume [m^3].  EQ 13+2
         """
         Pth=self.__relative_thermal_pressure(temperature,params)
-        return mt.bulk_modulus(pressure-Pth, params)
+        return mt._bulk_modulus(pressure-Pth, self.compiled_parameters(params))
 
     #calculate the shear modulus as a function of P, V, and T
     def shear_modulus(self, pressure, temperature, volume, params):
@@ -78,23 +107,21 @@ class HP_TMT(eos.EquationOfState):
         Returns heat capacity at constant volume at the pressure, temperature, and volume [J/K/mol].
         """
         C_p=self.heat_capacity_p(pressure, temperature, volume, params)
-        V=self.volume(pressure,temperature,params)
         alpha=self.thermal_expansivity(pressure, temperature, volume , params)
         K_T=self.isothermal_bulk_modulus(pressure,temperature,volume, params)
-        return C_p - V*temperature*alpha*alpha*K_T
+        return C_p - volume*temperature*alpha*alpha*K_T
 
     def thermal_expansivity(self, pressure, temperature, volume , params):
         """
         Returns thermal expansivity at the pressure, temperature, and volume [1/K]
         Replace -Pth in EQ 13+1 with P-Pth for non-ambient temperature 
         """
-        a, b, c = mt.tait_constants(params)
+        p = self.compiled_parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth=self.__relative_thermal_pressure(temperature,params)
         psubpth=pressure-Pth
-        einstein_T=self.__einstein_temperature(params['S_0'], params['n'])
-        C_V0 = einstein.heat_capacity_v( T_0, einstein_T, params['n'] )
-        C_V =  einstein.heat_capacity_v(temperature, einstein_T,params['n'])
-        alpha = params['a_0'] * (C_V/C_V0) *1./((1.+b*psubpth)*(a + (1.-a)*np.power((1+b*psubpth), c)))
+        C_V =  einstein.heat_capacity_v(temperature, p.einstein_T, p.n)
+        alpha = p.a_0 * (C_V/p.C_V0) *1./((1.+b*psubpth)*(a + (1.-a)*np.power((1+b*psubpth), c)))
  
         return alpha
 
@@ -136,7 +163,8 @@ class HP_TMT(eos.EquationOfState):
         and temperature [K].
         """
         # Calculate temperature and pressure integrals
-        a, b, c = mt.tait_constants(params)
+        p = self.compiled_parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth=self.__relative_thermal_pressure(temperature,params)
 
         psubpth=pressure-Pth
@@ -149,7 +177,7 @@ class HP_TMT(eos.EquationOfState):
             Gdisord=gibbs_disorder_Landau(pressure, temperature, params)
         else:
             if params.has_key('BW_deltaH'): # Add Bragg-Williams disordering
-                Gdisord=gibbs_disorder_BW(pressure, temperature, params) - gibbs_disorder_BW(P_0, T_0, params)
+                Gdisord=gibbs_disorder_BW(pressure, temperature, params) - p.BW_gibbs_0
             else:
                 Gdisord=0.0
 
@@ -161,11 +189,11 @@ class HP_TMT(eos.EquationOfState):
         Returns the entropy [J/K/mol] as a function of pressure [Pa]
         and temperature [K].
         """
-        a, b, c = mt.tait_constants(params)
+        p = self.compiled_parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth=self.__relative_thermal_pressure(temperature,params)
 
-        einstein_T=self.__einstein_temperature(params['S_0'], params['n'])
-        ksi_over_ksi_0=einstein.heat_capacity_v( temperature, einstein_T, params['n'] )/einstein.heat_capacity_v( T_0, einstein_T, params['n'] )
+        ksi_over_ksi_0=einstein.heat_capacity_v( temperature, p.einstein_T, p.n )/p.C_V0
 
         dintVdpdx=(params['V_0']*params['a_0']*params['K_0']*a*ksi_over_ksi_0)*(np.power((1.+b*(pressure-Pth)), 0.-c) - np.power((1.-b*Pth), 0.-c))
 
@@ -174,7 +202,7 @@ class HP_TMT(eos.EquationOfState):
             Sdisord=entropy_disorder_Landau(pressure, temperature, params)
         else:
             if params.has_key('BW_deltaH'): # Add Bragg-Williams disordering
-                Sdisord=entropy_disorder_BW(pressure, temperature, params) - entropy_disorder_BW(P_0, T_0, params)
+                Sdisord=entropy_disorder_BW(pressure, temperature, params) - p.BW_S_0
             else:
                 Sdisord=0.0
 
@@ -185,6 +213,7 @@ class HP_TMT(eos.EquationOfState):
         Returns the enthalpy [J/mol] as a function of pressure [Pa]
         and temperature [K].
         """
+        p = self.compiled_parameters(params)
         gibbs=self.gibbs_free_energy(pressure,temperature,volume, params)
         entropy=self.entropy(pressure,temperature,volume, params)
         
@@ -193,7 +222,7 @@ class HP_TMT(eos.EquationOfState):
             Hdisord=enthalpy_disorder_Landau(pressure, temperature, params)
         else:
             if params.has_key('BW_deltaH'): # Add Bragg-Williams disordering
-                Hdisord=enthalpy_disorder_BW(pressure, temperature, params) - enthalpy_disorder_BW(P_0, T_0, params)
+                Hdisord=enthalpy_disorder_BW(pressure, temperature, params) - p.BW_H_0
             else:
                 Hdisord=0.0
 
@@ -204,11 +233,11 @@ class HP_TMT(eos.EquationOfState):
         Returns the heat capacity [J/K/mol] as a function of pressure [Pa]
         and temperature [K].
         """
-        a, b, c = mt.tait_constants(params)
+        p = self.compiled_parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth=self.__relative_thermal_pressure(temperature,params)
 
-        einstein_T=self.__einstein_temperature(params['S_0'], params['n'])
-        ksi_over_ksi_0=einstein.heat_capacity_v( temperature, einstein_T, params['n'] )/einstein.heat_capacity_v( T_0, einstein_T, params['n'] )
+        ksi_over_ksi_0=einstein.heat_capacity_v( temperature, p.einstein_T, p.n )/p.C_V0
 
         dSdT=params['V_0']*params['K_0']*np.power((ksi_over_ksi_0*params['a_0']),2.0)*(np.power((1.+b*(pressure-Pth)), -1.-c) - np.power((1.-b*Pth), -1.-c))
 
@@ -221,15 +250,89 @@ class HP_TMT(eos.EquationOfState):
         return self.heat_capacity_p0(temperature,params) + temperature*dSdT + Cpdisord
 
 
-    def __einstein_temperature(self, S, n):
+    def properties(self, pressure, temperature, volume, params, names=eos.property_names):
+        """
+        Returns all properties at once from :func:`evaluate`, so that the
+        order-disorder terms (in particular the Bragg-Williams state of
+        order) are computed only once per state.  The volume is not needed,
+        as it is an explicit function of pressure and temperature.
         """
-        Empirical Einstein temperature
-        Holland and Powell, 2011; base of p.346, para.1
+        thermodynamic = any(name in eos.thermodynamic_property_names for name in names)
+        result = self.__evaluate(pressure, temperature, params, thermodynamic)
+        return dict((name, float(result[name])) for name in result if name in names or name == 'V')
+
+    def evaluate(self, pressures, temperatures, params):
         """
-        return 10636./(S/n + 6.44)
-    
+        Vectorized version of :func:`burnman.eos.EquationOfState.evaluate`.
+        The Helmholtz free energy is not provided by this equation of state,
+        so it is nan.
+        """
+        return self.__evaluate(pressures, temperatures, params, True)
+
+    def __evaluate(self, pressures, temperatures, params, thermodynamic):
+        """
+        Implementation of :func:`evaluate`, which skips the thermodynamic
+        potentials (and the Bragg-Williams order parameter) unless
+        thermodynamic is True.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        p = self.compiled_parameters(params)
+        a, b, c = p.a, p.b, p.c
+        Cp = p.Cp
+
+        # EQ 12 - 1 of Holland and Powell, 2011
+        E_th = einstein.thermal_energy(T, p.einstein_T, p.n)
+        Pth = p.thermal_pressure_factor * (E_th - p.E_th_0)
+        psubpth = P - Pth
+
+        # all powers of (1+b*(P-Pth)) and (1-b*Pth) below are derived from these two
+        x = 1. + b*psubpth
+        y = 1. - b*Pth
+        x_c = np.power(x, -c)
+        y_c = np.power(y, -c)
+
+        V = p.V_0*(1. - a*(1. - x_c))
+        K_T = p.K_0*x*(a + (1.-a)/x_c)
+
+        ksi_over_ksi_0 = einstein.heat_capacity_v(T, p.einstein_T, p.n)/p.C_V0
+        alpha = p.a_0 * ksi_over_ksi_0 *1./(x*(a + (1.-a)/x_c))
+
+        dSdT = p.V_0*p.K_0*np.power((ksi_over_ksi_0*p.a_0),2.0)*(x_c/x - y_c/y)
+
+        # Add order-disorder terms if required (the Bragg-Williams order
+        # parameter is only solved for the thermodynamic potentials)
+        if params.has_key('landau_Tc'): # For a phase transition described by Landau term
+            Gdisord, Sdisord, Hdisord, Cpdisord = disorder_Landau(P, T, params)
+        elif params.has_key('BW_deltaH') and thermodynamic: # Add Bragg-Williams disordering, with a single solve for the state of order
+            Gdisord, Sdisord, Hdisord = disorder_BW(P, T, params)
+            Gdisord = Gdisord - p.BW_gibbs_0
+            Sdisord = Sdisord - p.BW_S_0
+            Hdisord = Hdisord - p.BW_H_0
+            Cpdisord = 0.
+        else:
+            Gdisord = Sdisord = Hdisord = Cpdisord = 0.
+
+        sqrt_T = np.sqrt(T)
+        C_p = Cp[0] + Cp[1]*T + Cp[2]/(T*T) + Cp[3]/sqrt_T + T*dSdT + Cpdisord
+        C_v = C_p - V*T*alpha*alpha*K_T
+        result = {'V': V, 'gr': alpha * K_T * V / C_v, 'K_T': K_T, 'K_S': K_T*C_p/C_v, 'G': np.zeros(P.shape),
+                  'C_v': C_v, 'C_p': C_p, 'alpha': alpha}
+        if not thermodynamic:
+            return result
+
+        dintVdpdx = (p.V_0*p.a_0*p.K_0*a*ksi_over_ksi_0)*(x_c - y_c)
+        intVdP = P*p.V_0*(1. - a + (a*(y_c*y - x_c*x)/(b*(c-1.)*P))) # EQ 13
+
+        intCpdT = (Cp[0]*T + 0.5*Cp[1]*T*T - Cp[2]/T + 2.*Cp[3]*sqrt_T) - p.intCpdT_0
+        intCpoverTdT = (Cp[0]*np.log(T) + Cp[1]*T - 0.5*Cp[2]/(T*T) - 2.0*Cp[3]/sqrt_T) - p.intCpoverTdT_0
+        gibbs = p.H_0 + intCpdT - T*(p.S_0 + intCpoverTdT) + intVdP + Gdisord
+        S = p.S_0 + intCpoverTdT + dintVdpdx + Sdisord
+
+        nans = np.empty(P.shape)
+        nans.fill(float('nan'))
+        result.update({'gibbs': gibbs, 'helmholtz': nans, 'S': S, 'H': gibbs + T*S + Hdisord})
+        return result
 
-    
     def __thermal_pressure(self,T,params):
         """
         Returns thermal pressure [Pa] as a function of T [K] 
@@ -244,10 +347,9 @@ class HP_TMT(eos.EquationOfState):
         # Note that the xi function in HP2011 is just the Einstein heat capacity
         # divided by 3nR.  I don't know why they don't use that, but anyhow...
 
-        einstein_T=self.__einstein_temperature(params['S_0'],params['n'])
-        E_th = einstein.thermal_energy( T, einstein_T, params['n'] )
-        C_V0 = einstein.heat_capacity_v( T_0, einstein_T, params['n'] )
-        P_th = params['a_0']*params['K_0'] / C_V0 * E_th
+        p = self.compiled_parameters(params)
+        E_th = einstein.thermal_energy( T, p.einstein_T, p.n )
+        P_th = p.thermal_pressure_factor * E_th
         return P_th
 
     def __relative_thermal_pressure( self, T, params):
@@ -255,24 +357,34 @@ class HP_TMT(eos.EquationOfState):
         Returns relative thermal pressure [Pa] as a function of T-T_0 [K] 
         EQ 12 - 1 of Holland and Powell, 2011 
         """
-        return self.__thermal_pressure(T, params) - \
-               self.__thermal_pressure(T_0, params)
+        p = self.compiled_parameters(params)
+        return self.__thermal_pressure(T, params) - p.thermal_pressure_factor*p.E_th_0
 
     def __intCpdT (self, temperature, params):
         """
         Returns the thermal addition to the standard state enthalpy [J/mol]
         at ambient pressure [Pa]
         """
-        return (params['Cp'][0]*temperature + 0.5*params['Cp'][1]*np.power(temperature,2.) - params['Cp'][2]/temperature + 2.*params['Cp'][3]*np.sqrt(temperature)) - (params['Cp'][0]*T_0 + 0.5*params['Cp'][1]*T_0*T_0 - params['Cp'][2]/T_0 + 2.0*params['Cp'][3]*np.sqrt(T_0))
+        p = self.compiled_parameters(params)
+        Cp = p.Cp
+        return (Cp[0]*temperature + 0.5*Cp[1]*np.power(temperature,2.) - Cp[2]/temperature + 2.*Cp[3]*np.sqrt(temperature)) - p.intCpdT_0
 
     def __intCpoverTdT (self, temperature, params):
         """
         Returns the thermal addition to the standard state entropy [J/K/mol]
         at ambient pressure [Pa]
         """
-        return (params['Cp'][0]*np.log(temperature) + params['Cp'][1]*temperature - 0.5*params['Cp'][2]/np.power(temperature,2.) - 2.0*params['Cp'][3]/np.sqrt(temperature)) - (params['Cp'][0]*np.log(T_0) + params['Cp'][1]*T_0 - 0.5*params['Cp'][2]/(T_0*T_0) - 2.0*params['Cp'][3]/np.sqrt(T_0))
+        p = self.compiled_parameters(params)
+        Cp = p.Cp
+        return (Cp[0]*np.log(temperature) + Cp[1]*temperature - 0.5*Cp[2]/np.power(temperature,2.) - 2.0*Cp[3]/np.sqrt(temperature)) - p.intCpoverTdT_0
 
 
+    def compile_parameters(self, params):
+        """
+        Returns the compiled parameters, see :class:`HPParameters`.
+        """
+        return HPParameters(params)
+
     def validate_parameters(self, params):
         """
         Check for existence and validity of the parameters
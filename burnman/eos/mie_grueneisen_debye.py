@@ -3,10 +3,10 @@
 # Released under GPL v2 or later.
 
 import numpy as np
-import scipy.optimize as opt
 import warnings
 
 import equation_of_state as eos
+import newton
 import birch_murnaghan as bm
 import burnman.debye as debye
 import burnman.constants as constants
@@ -31,17 +31,55 @@ class MGDBase(eos.EquationOfState):
         """
         return self.__grueneisen_parameter(params['V_0']/volume, params)
 
+    def solve_volumes(self, pressures, temperatures, params, guesses=None, widths=None):
+        """
+        Find the volumes [m^3] for arrays of pressures [Pa] and temperatures [K]
+        at once (EQ B7) with :func:`burnman.eos.newton.safeguarded_newton`,
+        starting from V_0 and bracketed by [0.5 V_0, 1.5 V_0], or from guesses
+        with relative bracket widths (see
+        :func:`burnman.eos.newton.solve_volumes`).  Returns the volumes, the
+        number of evaluations of the pressure for each point, whether each
+        point converged and whether it was found in [0.5 V_0, 1.5 V_0].
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        shape = P.shape
+        P = P.ravel()
+        T = T.ravel()
+        T_0 = self.reference_temperature( params )
+
+        def func(V, idx):
+            gr = self.__grueneisen_parameter(params['V_0']/V, params)
+            Debye_T = self.__debye_temperature(params['V_0']/V, params)
+            P_V = bm.birch_murnaghan(params['V_0']/V, params) + \
+                gr * (debye.thermal_energy(T[idx], Debye_T, params['n']) - debye.thermal_energy(T_0, Debye_T, params['n']))/V
+            # the Chebyshev Debye function is accurate enough for the derivative
+            K_th = lambda T: 3.*params['n']*constants.gas_constant*T/V * gr * \
+                ((1. - params['q_0'] - 3.*gr)*debye.debye_fn_array(Debye_T/T)+3.*gr*(Debye_T/T)/(np.exp(Debye_T/T) - 1.)) # EQ B5
+            K_T = bm.bulk_modulus(V, params) + K_th(T[idx]) - K_th(T_0)
+            return P_V - P[idx], -K_T/V
+
+        V_0 = params['V_0']
+        V, iterations, converged, bracketed = newton.solve_volumes(func, len(P), 0.5*V_0, 1.5*V_0, V_0, guesses, widths)
+        return V.reshape(shape), iterations.reshape(shape), converged.reshape(shape), bracketed.reshape(shape)
+
+    def volume_from_guess(self, pressure, temperature, params, guess, width):
+        """
+        Returns molar volume :math:`[m^3]`, solved starting from guess
+        within the bracket guess*(1 +- width).  See
+        :func:`burnman.eos.EquationOfState.volume_from_guess`.
+        """
+        V, iterations, converged, bracketed = self.solve_volumes(pressure, temperature, params, guess, width)
+        newton.check_volumes(converged, bracketed)
+        return float(V)
+
     def volume(self, pressure,temperature,params):
         """
         Returns volume [m^3] as a function of pressure [Pa] and temperature [K]
         EQ B7
         """
-        T_0 = self.reference_temperature( params )
-        func = lambda x: bm.birch_murnaghan(params['V_0']/x, params) + \
-            self.__thermal_pressure(temperature, x, params) - \
-            self.__thermal_pressure(T_0, x, params) - pressure
-        V = opt.brentq(func, 0.5*params['V_0'], 1.5*params['V_0'])
-        return V
+        V, iterations, converged, bracketed = self.solve_volumes(pressure, temperature, params)
+        newton.check_volumes(converged, bracketed)
+        return float(V)
 
     def pressure(self, temperature, volume, params):
         P = bm.birch_murnaghan(params['V_0']/volume, params) + \
@@ -170,6 +208,61 @@ class MGDBase(eos.EquationOfState):
         return K_th
 
 
+    def properties(self, pressure, temperature, volume, params, names=eos.property_names):
+        """
+        Fused version of :func:`burnman.eos.EquationOfState.properties`,
+        sharing the Grueneisen parameter, Debye temperature and Debye function
+        between all properties. Accepts floats or arrays of the same shape.
+        This equation of state does not provide thermodynamic potentials,
+        so those are nan.
+        """
+        T = temperature
+        V = volume
+        T_0 = self.reference_temperature( params )
+        n = params['n']
+        gr = self.__grueneisen_parameter(params['V_0']/V, params)
+        debye_T = self.__debye_temperature(params['V_0']/V, params)
+
+        def thermal_bulk_and_shear(temperature):
+            # EQ B5 and B10, sharing the Debye function
+            D = debye.debye_fn_array(debye_T/temperature)
+            K_th = 3.*n*constants.gas_constant*temperature/V * gr * \
+                ((1. - params['q_0'] - 3.*gr)*D + 3.*gr*(debye_T/temperature)/(np.exp(debye_T/temperature) - 1.))
+            G_th = 3./5. * ( K_th - 6*constants.gas_constant*temperature*n/V * gr * D )
+            return K_th, G_th
+
+        K_th, G_th = thermal_bulk_and_shear(T)
+        K_th_ref, G_th_ref = thermal_bulk_and_shear(T_0)
+
+        K_T = bm.bulk_modulus(V, params) + K_th - K_th_ref
+        if self.order==2:
+            G = bm.shear_modulus_second_order(V, params) + G_th - G_th_ref
+        elif self.order==3:
+            G = bm.shear_modulus_third_order(V, params) + G_th - G_th_ref
+        else:
+            raise NotImplementedError("")
+
+        C_v = debye.heat_capacity_v(T, debye_T, n)
+        alpha = gr * C_v / K_T / V
+        K_S = K_T*(1. + gr * alpha * T)
+        C_p = C_v*(1. + gr * alpha * T)
+
+        # nan in the shape of V
+        return {'V': V, 'gr': gr, 'K_T': K_T, 'K_S': K_S, 'G': G, 'C_v': C_v, 'C_p': C_p, 'alpha': alpha,
+                'gibbs': np.nan*V, 'helmholtz': np.nan*V, 'S': np.nan*V, 'H': np.nan*V}
+
+    def evaluate(self, pressures, temperatures, params):
+        """
+        Vectorized version of :func:`burnman.eos.EquationOfState.evaluate`.
+        All points, including the volume solves, are computed at once. This
+        equation of state does not provide thermodynamic potentials, so those
+        are nan.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        V, iterations, converged, bracketed = self.solve_volumes(P, T, params)
+        newton.check_volumes(converged, bracketed)
+        return self.properties(P, T, V, params)
+
     def validate_parameters(self, params):
         """
         Check for existence and validity of the parameters
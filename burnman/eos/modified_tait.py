@@ -4,6 +4,7 @@
 
 import numpy as np
 import equation_of_state as eos
+import parameters
 import warnings
 
 P_0=1.e5 # Standard pressure = 1.e5 Pa
@@ -47,6 +48,31 @@ def bulk_modulus(pressure, params):
     return params['K_0']*(1. + b*(pressure))*(a + (1.-a)*np.power((1. + b*(pressure)), c))
 
 
+class TaitParameters(parameters.ParameterRecord):
+    """
+    Compiled parameters of the modified Tait equation of state, with the
+    constants of :func:`tait_constants` precomputed.
+    """
+    param_names = ['V_0', 'K_0', 'Kprime_0', 'Kdprime_0']
+    __slots__ = param_names + ['a', 'b', 'c']
+
+    def compute_derived(self, params):
+        self.a, self.b, self.c = tait_constants(params)
+
+
+def _volume(pressure, p):
+    """
+    :func:`volume` for compiled parameters p (:class:`TaitParameters`).
+    """
+    return p.V_0*(1. - p.a*( 1. - np.power(( 1. + p.b*(pressure)), -1.0*p.c)))
+
+def _bulk_modulus(pressure, p):
+    """
+    :func:`bulk_modulus` for compiled parameters p (:class:`TaitParameters`).
+    """
+    return p.K_0*(1. + p.b*(pressure))*(p.a + (1.-p.a)*np.power((1. + p.b*(pressure)), p.c))
+
+
 class MT(eos.EquationOfState):
     """
     Base class for a generic modified Tait equation of state.  
@@ -63,7 +89,7 @@ class MT(eos.EquationOfState):
         """
         Returns volume :math:`[m^3]` as a function of pressure :math:`[Pa]`.
         """
-        return volume(pressure,params)
+        return _volume(pressure, self.compiled_parameters(params))
 
     def pressure(self, temperature, volume, params):
         """
@@ -75,7 +101,7 @@ class MT(eos.EquationOfState):
         """
         Returns isothermal bulk modulus :math:`K_T` of the mineral. :math:`[Pa]`.
         """
-        return bulk_modulus(pressure, params)
+        return _bulk_modulus(pressure, self.compiled_parameters(params))
 
     def adiabatic_bulk_modulus(self,pressure, temperature, volume, params):
         """
@@ -115,6 +141,29 @@ class MT(eos.EquationOfState):
         """
         return 0.
 
+    def evaluate(self, pressures, temperatures, params):
+        """
+        Vectorized version of :func:`burnman.eos.EquationOfState.evaluate`.
+        This equation of state does not provide thermodynamic potentials,
+        so those are nan.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        p = self.compiled_parameters(params)
+        zeros = np.zeros(P.shape)
+        large = np.empty(P.shape)
+        large.fill(1.e99)
+        nans = np.empty(P.shape)
+        nans.fill(float('nan'))
+        return {'V': _volume(P, p), 'gr': zeros, 'K_T': _bulk_modulus(P, p), 'K_S': large,
+                'G': zeros.copy(), 'C_v': large.copy(), 'C_p': large.copy(), 'alpha': zeros.copy(),
+                'gibbs': nans, 'helmholtz': nans.copy(), 'S': nans.copy(), 'H': nans.copy()}
+
+    def compile_parameters(self, params):
+        """
+        Returns the compiled parameters, see :class:`TaitParameters`.
+        """
+        return TaitParameters(params)
+
     def validate_parameters(self, params):
         """
         Check for existence and validity of the parameters
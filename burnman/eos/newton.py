@@ -0,0 +1,161 @@
+# BurnMan - a lower mantle toolkit
+# Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
+# Released under GPL v2 or later.
+
+import numpy as np
+import warnings
+
+"""
+Batched root finding for the equations of state.  Many points (lanes) are
+solved in lockstep with Newton's method, and each lane falls back to
+bisection if a Newton step leaves its bracket.
+"""
+
+
+def safeguarded_newton(func, x0, lower, upper, decreasing=True, xtol=1.e-12, max_iterations=100):
+    """
+    Find the roots of a function for many independent points at once.
+
+    Each lane keeps a bracket [lower, upper] that is narrowed with every
+    function evaluation. Newton steps that leave the bracket (or are not
+    finite) are replaced by a bisection step. The bounds are not evaluated
+    up front, a bound is only evaluated when a Newton step crosses it. If
+    the root turns out to be beyond one of the initial bounds, the lane
+    continues with plain Newton steps (limited to a factor of two per
+    step, as the unknown is assumed to be positive, e.g. a volume).
+
+    Parameters
+    ----------
+    func : function
+        func(x, idx) returns the residuals and their derivatives with
+        respect to x for the lanes idx (an array of indices) evaluated at
+        x (an array of the same length as idx).
+    x0 : array of floats
+        Initial guesses, one per lane.
+    lower : array of floats
+        Lower ends of the initial brackets.
+    upper : array of floats
+        Upper ends of the initial brackets.
+    decreasing : bool
+        Whether the residual decreases with x. This is used to decide
+        which end of the bracket to move after each evaluation. For volume
+        solves (residual P(V)-P) this is True.
+    xtol : float
+        Relative tolerance on x.
+    max_iterations : int
+        Maximum number of function evaluations per lane.
+
+    Returns
+    -------
+    x : array of floats
+        The roots.
+    iterations : array of ints
+        Number of function evaluations for each lane.
+    converged : array of bools
+        Whether each lane converged.
+    bracketed : array of bools
+        Whether the root of each lane was found inside its initial bracket.
+    """
+    x = np.array(x0, dtype=float).ravel()
+    n = len(x)
+    lower = np.array(np.broadcast_to(lower, (n,)), dtype=float)
+    upper = np.array(np.broadcast_to(upper, (n,)), dtype=float)
+    x = np.clip(x, lower, upper)
+    lo = lower.copy()
+    hi = upper.copy()
+
+    lo_verified = np.zeros(n, dtype=bool)
+    hi_verified = np.zeros(n, dtype=bool)
+    bracketed = np.ones(n, dtype=bool)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    active = np.arange(n)
+
+    for it in range(max_iterations):
+        if len(active) == 0:
+            break
+
+        xa = x[active]
+        f, df = func(xa, active)
+        f = np.asarray(f, dtype=float)
+        df = np.asarray(df, dtype=float)
+        iterations[active] += 1
+
+        # narrow the brackets
+        root_above = (f > 0.) if decreasing else (f < 0.)
+        root_below = (f < 0.) if decreasing else (f > 0.)
+        lo[active] = np.where(root_above, xa, lo[active])
+        lo_verified[active] |= root_above
+        hi[active] = np.where(root_below, xa, hi[active])
+        hi_verified[active] |= root_below
+        lo_a = lo[active]
+        hi_a = hi[active]
+
+        # lanes evaluated at one of their initial bounds with the root beyond it
+        # continue without a bracket
+        inside = bracketed[active]
+        lost = inside & (((xa <= lower[active]) & root_below) | ((xa >= upper[active]) & root_above))
+        bracketed[active[lost]] = False
+        inside &= ~lost
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = f/df
+        x_new = xa - step
+        newton_converged = np.abs(step) <= xtol*np.abs(xa)
+
+        # safeguard: a Newton step that leaves the bracket goes to the crossed
+        # bound if that has not been evaluated yet, otherwise we bisect
+        leaves = inside & ~newton_converged & ~((x_new > lo_a) & (x_new < hi_a))
+        to_lo = leaves & ~lo_verified[active] & (x_new <= lo_a)
+        to_hi = leaves & ~hi_verified[active] & (x_new >= hi_a)
+        bisect = leaves & ~to_lo & ~to_hi
+        x_new = np.where(bisect, 0.5*(lo_a + hi_a), x_new)
+        x_new = np.where(to_lo, lo_a, x_new)
+        x_new = np.where(to_hi, hi_a, x_new)
+
+        # lanes without a bracket only get their steps limited
+        outside = ~inside
+        x_new = np.where(outside, np.clip(x_new, 0.5*xa, 2.*xa), x_new)
+
+        collapsed = bisect & (hi_a - lo_a <= xtol*np.abs(xa)) & lo_verified[active] & hi_verified[active]
+        done = (f == 0.) | newton_converged | collapsed
+        failed = ~np.isfinite(f)
+
+        x[active] = np.where(f == 0., xa, x_new)
+        converged[active] = done & ~failed
+        active = active[~(done | failed)]
+
+    return x, iterations, converged, bracketed
+
+
+def solve_volumes(func, n, lower, upper, V_0, guesses=None, widths=None):
+    """
+    Solve for n volumes with :func:`safeguarded_newton`, where func(V, idx)
+    returns P(V)-P and dP/dV for the points idx.  Without guesses, all
+    points start from V_0 with the bracket [lower, upper], which is the
+    range of validity of the equation of state.  With guesses (e.g. from a
+    neighbouring point of a profile), each point starts from its guess with
+    the bracket guess*(1-width), guess*(1+width), widths being relative.
+    Either way, bracketed reports whether the volume is in [lower, upper].
+    Returns the volumes, iterations, converged and bracketed arrays as
+    :func:`safeguarded_newton`.
+    """
+    if guesses is None:
+        return safeguarded_newton(func, np.ones(n)*V_0, lower, upper)
+
+    guesses = np.array(np.broadcast_to(guesses, (n,)), dtype=float)
+    widths = np.broadcast_to(widths, (n,))
+    V, iterations, converged, bracketed = safeguarded_newton(func, guesses, guesses*(1.-widths), guesses*(1.+widths))
+    return V, iterations, converged, (V >= lower) & (V <= upper)
+
+
+def check_volumes(converged, bracketed):
+    """
+    Raise a ValueError if any of the volume solves failed, and warn if any
+    of the volumes was found outside of the initial bracket (which is the
+    range in which the equation of state is expected to be valid).
+    """
+    if not np.all(converged):
+        raise ValueError('Cannot find volume, likely outside of the range of validity for EOS')
+    if not np.all(bracketed):
+        warnings.warn("May be outside the range of validity for EOS", stacklevel=3)
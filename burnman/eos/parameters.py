@@ -0,0 +1,228 @@
+# BurnMan - a lower mantle toolkit
+# Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
+# Released under GPL v2 or later.
+
+import itertools
+
+import numpy as np
+
+"""
+Parameter dictionaries that keep track of their modifications, and compiled
+parameter records that equations of state build from them.  Looking up an
+attribute of a record is cheaper than a dictionary lookup with a string key,
+and the record also holds constants derived from the parameters, so that
+they are not recomputed on every call.
+"""
+
+# versions are unique over all Parameters objects
+_versions = itertools.count()
+
+
+def _content(value):
+    # a hashable value that is equal for equal parameter values (floats by
+    # their repr, so that nan equals nan, and arrays by their bytes)
+    if isinstance(value, dict):
+        return ('dict',) + tuple(sorted((key, _content(v)) for key, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_content(v) for v in value)
+    elif isinstance(value, np.ndarray):
+        return ('array', value.dtype.str, value.shape, value.tostring())
+    elif isinstance(value, float):
+        return repr(value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class Parameters(dict):
+    """
+    A dictionary of mineral parameters with a version number that changes
+    whenever the dictionary is modified.  :class:`burnman.Mineral` stores its
+    params as this class, which lets the equations of state keep their
+    compiled parameter records (see
+    :func:`burnman.eos.EquationOfState.compiled_parameters`) until the
+    params change, and lets :func:`burnman.Mineral.set_method` skip the
+    validation of params that have been validated already (the equations
+    of state that validated this version are in validated).  Note that
+    modifications inside of values (like the entries of a list) are not
+    noticed.
+
+    Dictionaries with equal contents have the same :data:`fingerprint`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.version = next(_versions)
+        self.compiled = {}
+        self.validated = set()
+        # the keys of the list and dictionary values, which shared_copy()
+        # copies, found on its first call
+        self.mutable_keys = None
+        self._contents = None
+        self._fingerprint = None
+
+    def modified(self):
+        """
+        Give this dictionary a new version number, and drop the compiled
+        records and validations.  This is called by all methods that modify
+        the dictionary.
+        """
+        self.version = next(_versions)
+        self.compiled = {}
+        self.validated = set()
+        self.mutable_keys = None
+        self._contents = None
+        self._fingerprint = None
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.modified()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.modified()
+
+    def clear(self):
+        dict.clear(self)
+        self.modified()
+
+    def pop(self, *args):
+        value = dict.pop(self, *args)
+        self.modified()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self.modified()
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self.modified()
+
+    def copy(self):
+        return Parameters(self)
+
+    def shared_copy(self):
+        """
+        Return a copy that shares the version number, the compiled records
+        and the validations with this dictionary, so that the copy does not
+        validate and compile the same parameters again.  Each of the two
+        gets its own version when it is modified (copy on write).  The lists
+        and dictionaries in the values are copied, modifications inside of
+        them are not noticed.
+        """
+        if self.mutable_keys is None:
+            self.mutable_keys = [key for key, value in self.iteritems()
+                                 if type(value) is list or type(value) is dict]
+        params = Parameters.__new__(Parameters)
+        dict.update(params, self)
+        for key in self.mutable_keys:
+            dict.__setitem__(params, key, type(self[key])(self[key]))
+        params.version = self.version
+        params.compiled = self.compiled
+        params.validated = self.validated
+        params.mutable_keys = self.mutable_keys
+        params._contents = self._contents
+        params._fingerprint = self._fingerprint
+        return params
+
+    @property
+    def contents(self):
+        """
+        A hashable value that is equal for all Parameters objects with
+        equal contents (computed once per version), unlike the version,
+        which is only shared by :func:`shared_copy`.  Floats are compared
+        by their repr, so nan equals nan, but 1 does not equal 1.0.
+        """
+        if self._contents is None:
+            self._contents = _content(dict(self))
+        return self._contents
+
+    @property
+    def fingerprint(self):
+        """
+        The hash of :data:`contents` (computed once per version), which is
+        equal for equal contents.  Different contents can have the same
+        fingerprint, :class:`ContentIndex` tells them apart.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hash(self.contents)
+        return self._fingerprint
+
+    def __getstate__(self):
+        # the compiled records are rebuilt and the validations redone when
+        # needed (the state must not be empty, otherwise __setstate__ is not
+        # called)
+        return {'version': None}
+
+    def __setstate__(self, state):
+        self.version = next(_versions)
+        self.compiled = {}
+        self.validated = set()
+        self.mutable_keys = None
+        self._contents = None
+        self._fingerprint = None
+
+
+class ContentIndex(object):
+    """
+    Numbers Parameters objects by their contents: params with equal
+    :data:`Parameters.contents` get the same number, others different
+    ones.  The contents are only kept as long as the index, e.g. while a
+    :class:`burnman.SharedStates` context is active.
+    """
+
+    def __init__(self):
+        # the numbers by version, and the contents and numbers by fingerprint
+        self.numbers = {}
+        self.by_fingerprint = {}
+        self.count = 0
+
+    def number(self, params):
+        """
+        Returns the number of the contents of params.
+        """
+        number = self.numbers.get(params.version)
+        if number is None:
+            candidates = self.by_fingerprint.setdefault(params.fingerprint, [])
+            for (contents, n) in candidates:
+                if contents == params.contents:
+                    number = n
+                    break
+            else:
+                number = self.count
+                self.count += 1
+                candidates.append((params.contents, number))
+            self.numbers[params.version] = number
+        return number
+
+
+class ParameterRecord(object):
+    """
+    Base class for compiled parameter records.  A derived class lists the
+    params it copies in param_names (missing ones are nan) and all of its
+    attributes, including the derived constants set in
+    :func:`compute_derived`, in __slots__.
+    """
+    __slots__ = ['version']
+    param_names = []
+
+    def __init__(self, params):
+        self.version = getattr(params, 'version', None)
+        for name in self.param_names:
+            setattr(self, name, params[name] if name in params else float('nan'))
+        self.compute_derived(params)
+
+    def compute_derived(self, params):
+        """
+        Compute the derived constants of the record.
+        """
+        pass
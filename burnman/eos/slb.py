@@ -3,12 +3,37 @@
 # Released under GPL v2 or later.
 
 import numpy as np
-import scipy.optimize as opt
 import warnings
 
 import birch_murnaghan as bm
 import burnman.debye as debye
 import equation_of_state as eos
+import newton
+import parameters
+
+class SLBParameters(parameters.ParameterRecord):
+    """
+    Compiled parameters of :class:`SLBBase`, with the coefficients of the
+    finite strain expansions of :cite:`Stixrude2005` precomputed.
+    """
+    param_names = ['V_0', 'K_0', 'Kprime_0', 'G_0', 'Gprime_0', 'n', 'Debye_0', 'grueneisen_0', 'q_0', 'eta_s_0', 'F_0']
+    __slots__ = param_names + ['T_0', 'a1_ii', 'a2_iikk', 'a2_s', 'b_iikk', 'b_iikkmm',
+                               'K_1', 'G_1_second_order', 'G_1_third_order', 'G_2_third_order']
+
+    def compute_derived(self, params):
+        gruen_0 = self.grueneisen_0
+        self.T_0 = params['T_0'] if 'T_0' in params else 300.
+        self.a1_ii = 6. * gruen_0 # EQ 47
+        self.a2_iikk = -12.*gruen_0 + 36.*gruen_0*gruen_0 - 18.*self.q_0*gruen_0 # EQ 47
+        self.a2_s = -2.*gruen_0 - 2.*self.eta_s_0 # EQ 47
+        self.b_iikk = 9.*self.K_0 # EQ 28
+        self.b_iikkmm = 27.*self.K_0*(self.Kprime_0-4.) # EQ 29
+        # coefficients of the finite strain expansions of the moduli in birch_murnaghan.py
+        self.K_1 = 3.*self.K_0*self.Kprime_0 - 5.*self.K_0
+        self.G_1_second_order = -(5. - 3.*self.Gprime_0*self.K_0/self.G_0)
+        self.G_1_third_order = 3.*self.K_0*self.Gprime_0 - 5.*self.G_0
+        self.G_2_third_order = 6.*self.K_0*self.Gprime_0 - 24.*self.K_0 - 14.*self.G_0 + 9./2.*self.K_0*self.Kprime_0
+
 
 class SLBBase(eos.EquationOfState):
     """
@@ -68,38 +93,81 @@ class SLBBase(eos.EquationOfState):
         P_th = gr * debye.thermal_energy(T,Debye_T, params['n'])/V
         return P_th
 
+    def __pressure_and_bulk_modulus(self, temperature, volume, params):
+        """
+        Pressure (EQ 21) and isothermal bulk modulus for arrays of
+        temperatures and volumes. The bulk modulus gives the derivative
+        needed by the volume solver, dP/dV = -K_T/V.
+        """
+        p = self.compiled_parameters(params)
+        T_0 = p.T_0
+        f = 0.5*(np.power(p.V_0/volume, 2./3.) - 1.) # EQ 24
+        a2_iikk = p.a2_iikk
+
+        nu_o_nu0_sq = 1.+ p.a1_ii*f + (1./2.)*a2_iikk * f*f # EQ 41
+        debye_T = p.Debye_0 * np.sqrt(nu_o_nu0_sq)
+        gr = 1./6./nu_o_nu0_sq * (2.*f+1.) * ( p.a1_ii + a2_iikk*f )
+        q = 1./9.*(18.*gr - 6. - 1./2. / nu_o_nu0_sq * (2.*f+1.)*(2.*f+1.)*a2_iikk/gr)
+
+        E_th, C_v = debye.thermal_properties(temperature, debye_T, p.n)[:2]
+        E_th_ref, C_v_ref = debye.thermal_properties(T_0, debye_T, p.n)[:2]
+
+        x52 = np.power(1.+2.*f, 5./2.)
+        P = (1./3.)*x52*(p.b_iikk*f + 0.5*p.b_iikkmm*f*f) \
+            + gr*(E_th - E_th_ref)/volume # EQ 21
+        K_T = x52*(p.K_0 + p.K_1*f + 0.5*p.b_iikkmm*f*f) \
+            + (gr + 1.-q)* ( gr / volume ) * (E_th - E_th_ref) \
+            - ( gr*gr / volume )*(C_v*temperature - C_v_ref*T_0)
+        return P, K_T
+
+    def solve_volumes(self, pressures, temperatures, params, guesses=None, widths=None):
+        """
+        Find the molar volumes for arrays of pressures and temperatures at
+        once with :func:`burnman.eos.newton.safeguarded_newton`, starting from
+        V_0 and bracketed by [0.6 V_0, 1.2 V_0], or from guesses with
+        relative bracket widths (see :func:`burnman.eos.newton.solve_volumes`).
+
+        Returns
+        -------
+        V : array of floats
+            Molar volumes :math:`[m^3]`, shaped like the broadcast inputs.
+        iterations : array of ints
+            Number of evaluations of the pressure for each point.
+        converged : array of bools
+            Whether the volume of each point was found.
+        bracketed : array of bools
+            Whether the volume was found in [0.6 V_0, 1.2 V_0].
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        shape = P.shape
+        P = P.ravel()
+        T = T.ravel()
+
+        def func(V, idx):
+            P_V, K_T = self.__pressure_and_bulk_modulus(T[idx], V, params)
+            return P_V - P[idx], -K_T/V
+
+        V_0 = params['V_0']
+        V, iterations, converged, bracketed = newton.solve_volumes(func, len(P), 0.6*V_0, 1.2*V_0, V_0, guesses, widths)
+        return V.reshape(shape), iterations.reshape(shape), converged.reshape(shape), bracketed.reshape(shape)
+
+    def volume_from_guess(self, pressure, temperature, params, guess, width):
+        """
+        Returns molar volume :math:`[m^3]`, solved starting from guess
+        within the bracket guess*(1 +- width).  See
+        :func:`burnman.eos.EquationOfState.volume_from_guess`.
+        """
+        V, iterations, converged, bracketed = self.solve_volumes(pressure, temperature, params, guess, width)
+        newton.check_volumes(converged, bracketed)
+        return float(V)
+
     def volume(self, pressure, temperature, params):
         """
         Returns molar volume. :math:`[m^3]`
         """
-        T_0 = self.reference_temperature( params )
-        debye_T = lambda x : self.__debye_temperature(params['V_0']/x, params)
-        gr = lambda x : self.grueneisen_parameter(pressure, temperature, x, params)
-        E_th =  lambda x : debye.thermal_energy(temperature, debye_T(x), params['n']) #thermal energy at temperature T
-        E_th_ref = lambda x : debye.thermal_energy(T_0, debye_T(x), params['n']) #thermal energy at reference temperature
-
-        b_iikk= 9.*params['K_0'] # EQ 28
-        b_iikkmm= 27.*params['K_0']*(params['Kprime_0']-4.) # EQ 29
-        f = lambda x: 0.5*(pow(params['V_0']/x,2./3.)-1.) # EQ 24
-        func = lambda x: (1./3.)*(pow(1.+2.*f(x),5./2.))*((b_iikk*f(x)) \
-            +(0.5*b_iikkmm*pow(f(x),2.))) + gr(x)*(E_th(x) - E_th_ref(x))/x - pressure #EQ 21
-
-        # we need to have a sign change in [a,b] to find a zero. Let us start with a
-        # conservative guess:
-        a = 0.6*params['V_0']
-        b = 1.2*params['V_0']
-
-        # if we have a sign change, we are done:
-        if func(a)*func(b)<0:
-            return opt.brentq(func, a, b)
-        else:
-            tol = 0.0001
-            sol = opt.fmin(lambda x : func(x)*func(x), 1.0*params['V_0'], ftol=tol, full_output=1, disp=0)
-            if sol[1] > tol*2:
-                raise ValueError('Cannot find volume, likely outside of the range of validity for EOS')
-            else:
-                warnings.warn("May be outside the range of validity for EOS")
-                return sol[0]
+        V, iterations, converged, bracketed = self.solve_volumes(pressure, temperature, params)
+        newton.check_volumes(converged, bracketed)
+        return float(V)
 
     def pressure( self, temperature, volume, params):
         """
@@ -157,8 +225,9 @@ class SLBBase(eos.EquationOfState):
         Returns adiabatic bulk modulus. :math:`[Pa]` 
         """
         K_T=self.isothermal_bulk_modulus(pressure, temperature, volume, params)
-        alpha = self.thermal_expansivity(pressure, temperature, volume, params)
+        C_v = self.heat_capacity_v(pressure, temperature, volume, params)
         gr = self.grueneisen_parameter(pressure, temperature, volume, params)
+        alpha = gr * C_v / K_T / volume
         K_S = K_T*(1. + gr * alpha * temperature)
         return K_S
 
@@ -231,7 +300,7 @@ class SLBBase(eos.EquationOfState):
         
         return self.helmholtz_free_energy( pressure, temperature, volume, params) + \
                temperature * self.entropy( pressure, temperature, volume, params) + \
-               pressure * self.volume( pressure, temperature, params)
+               pressure * volume
 
     def helmholtz_free_energy( self, pressure, temperature, volume, params):
         """
@@ -242,7 +311,7 @@ class SLBBase(eos.EquationOfState):
         Debye_T = self.__debye_temperature(params['V_0']/volume, params)
 
         F_quasiharmonic = debye.helmholtz_free_energy( temperature, Debye_T, params['n'] ) - \
-                          debye.helmholtz_free_energy( 300., Debye_T, params['n'] )
+                          debye.helmholtz_free_energy( self.reference_temperature( params ), Debye_T, params['n'] )
 
         b_iikk= 9.*params['K_0'] # EQ 28
         b_iikkmm= 27.*params['K_0']*(params['Kprime_0']-4.) # EQ 29
@@ -253,6 +322,70 @@ class SLBBase(eos.EquationOfState):
 
         return F
 
+    def properties(self, pressure, temperature, volume, params, names=eos.property_names):
+        """
+        Fused version of :func:`burnman.eos.EquationOfState.properties`.
+        The finite strain, Grueneisen and Debye terms are computed once and
+        shared between all properties, so this needs only two evaluations of
+        the Debye function (at T and at the reference temperature). Accepts
+        floats or arrays of the same shape. The elastic properties are always
+        returned, the thermodynamic potentials only if they are in names.
+        """
+        T = temperature
+        V = volume
+        p = self.compiled_parameters(params)
+        T_0 = p.T_0
+        f = 1./2. * (np.power(p.V_0/V, 2./3.) - 1.) # EQ 24
+        a2_iikk = p.a2_iikk
+
+        nu_o_nu0_sq = 1.+ p.a1_ii*f + (1./2.)*a2_iikk * f*f # EQ 41
+        debye_T = p.Debye_0 * np.sqrt(nu_o_nu0_sq)
+        gr = 1./6./nu_o_nu0_sq * (2.*f+1.) * ( p.a1_ii + a2_iikk*f )
+        q = 1./9.*(18.*gr - 6. - 1./2. / nu_o_nu0_sq * (2.*f+1.)*(2.*f+1.)*a2_iikk/gr)
+        eta_s = - gr - (1./2. / nu_o_nu0_sq * (2.*f+1.)*(2.*f+1.)*p.a2_s) # EQ 46
+
+        E_th, C_v, F_th, S = debye.thermal_properties(T, debye_T, p.n)
+        E_th_ref, C_v_ref, F_th_ref, S_ref = debye.thermal_properties(T_0, debye_T, p.n)
+
+        x52 = np.power(1.+2.*f, 5./2.)
+        K_T = x52*(p.K_0 + p.K_1*f + 0.5*p.b_iikkmm*f*f) \
+            + (gr + 1.-q)* ( gr / V ) * (E_th - E_th_ref) \
+            - ( gr*gr / V )*(C_v*T - C_v_ref*T_0)
+        alpha = gr * C_v / K_T / V
+        K_S = K_T*(1. + gr * alpha * T)
+        C_p = C_v*(1. + gr * alpha * T)
+
+        if self.order==2:
+            G = p.G_0*x52*(1. + p.G_1_second_order*f) - eta_s * (E_th-E_th_ref) / V
+        elif self.order==3:
+            G = x52*(p.G_0 + p.G_1_third_order*f + p.G_2_third_order*f*f) - eta_s * (E_th-E_th_ref) / V
+        else:
+            raise NotImplementedError("")
+
+        result = {'V': V, 'gr': gr, 'K_T': K_T, 'K_S': K_S, 'G': G, 'C_v': C_v, 'C_p': C_p, 'alpha': alpha}
+
+        if any(name in names for name in eos.thermodynamic_property_names):
+            F = p.F_0 + 0.5*p.b_iikk*f*f*p.V_0 + (1./6.)*p.V_0*p.b_iikkmm*f*f*f + F_th - F_th_ref
+            result.update({'gibbs': F + pressure*V, 'helmholtz': F, 'S': S, 'H': F + T*S + pressure*V})
+
+        return result
+
+    def evaluate(self, pressures, temperatures, params):
+        """
+        Vectorized version of :func:`burnman.eos.EquationOfState.evaluate`.
+        All points, including the volume solves, are computed at once.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        V, iterations, converged, bracketed = self.solve_volumes(P, T, params)
+        newton.check_volumes(converged, bracketed)
+        return self.properties(P, T, V, params)
+
+    def compile_parameters(self, params):
+        """
+        Returns the compiled parameters, see :class:`SLBParameters`.
+        """
+        return SLBParameters(params)
+
     def validate_parameters(self, params):
         """
         Check for existence and validity of the parameters
@@ -6,6 +6,13 @@ import numpy as np
 import scipy.integrate as integrate
 import tools
 import seismic
+import main
+from mineral import Mineral
+from composite import Composite
+import eos
+
+# the properties of the phases that the adiabatic gradient needs
+_gradient_properties = ['gr', 'K_S', 'C_p']
 
 
 def brown_shankland(pressure):
@@ -22,13 +29,7 @@ def brown_shankland(pressure):
     temperature : list of floats
         The list of temperatures for each of the pressures. :math:`[K]`
     """
-    temperature = np.empty_like(pressure)
-    for i in range(len(pressure)):
-      depth = seismic.prem_model.depth(pressure[i])
-      if depth < min(table_brown_depth):
-        raise ValueError, "depth smaller than range Brown & Shankland, 1981"
-      temperature[i] = tools.lookup_and_interpolate(table_brown_depth, table_brown_temperature, depth)
-    return temperature
+    return _table_geotherm("input_geotherm/brown_81.txt", "Brown & Shankland, 1981", False)(pressure)
 
 
 def anderson(pressure):
@@ -45,13 +46,74 @@ def anderson(pressure):
     temperature : list of floats
         The list of temperatures for each of the pressures. :math:`[K]`
     """
-    temperature = np.empty_like(pressure)
-    for i in range(len(pressure)):
-      depth = seismic.prem_model.depth(pressure[i])
-      temperature[i] = tools.lookup_and_interpolate(table_anderson_depth, table_anderson_temperature, depth)
-    return temperature
+    return _table_geotherm("input_geotherm/anderson_82.txt", "Anderson, 1982", True)(pressure)
+
+
+class TableGeotherm(object):
+    """
+    A geotherm given by a table of temperatures at depths, which are
+    linearly interpolated.  The pressures are converted to depths with a
+    seismic model (PREM by default).  The table is sorted by depth once,
+    so that evaluating the geotherm for an array of pressures is one
+    interpolation of the seismic model and one :func:`numpy.interp`.
+    Depths below the table get the temperature of its last row.
+
+    Parameters
+    ----------
+    depths : list of floats
+        The depths of the table. :math:`[m]`
+    temperatures : list of floats
+        The temperatures of the table. :math:`[K]`
+    seismic_model : :class:`burnman.seismic.Seismic1DModel`
+        The model that gives the depths of the pressures, by default
+        :data:`burnman.seismic.prem_model`.
+    extrapolate_top : bool
+        Whether depths above the table get the temperature of its first
+        row, otherwise they raise a ValueError.
+    name : string
+        The name of the geotherm in error messages.
+    """
+
+    def __init__(self, depths, temperatures, seismic_model=None, extrapolate_top=True, name="the table"):
+        depths = np.array(depths, dtype=float)
+        order = np.argsort(depths, kind='mergesort')
+        self.depths = depths[order]
+        self.temperatures = np.array(temperatures, dtype=float)[order]
+        self.seismic_model = seismic_model
+        self.extrapolate_top = extrapolate_top
+        self.name = name
+
+    @classmethod
+    def from_file(cls, filename, seismic_model=None, extrapolate_top=True, name=None):
+        """
+        Read a geotherm from a file with the columns depth :math:`[m]` and
+        temperature :math:`[K]` (see :func:`burnman.tools.read_table`).  The
+        files are only read once.
+        """
+        depths, temperatures = _read_table(filename)
+        return cls(depths, temperatures, seismic_model, extrapolate_top,
+                   filename if name is None else name)
+
+    def __call__(self, pressure):
+        """
+        Returns the temperatures :math:`[K]` at a list of pressures :math:`[Pa]`.
+        """
+        seismic_model = seismic.prem_model if self.seismic_model is None else self.seismic_model
+        depth = seismic_model.depth(np.asarray(pressure, dtype=float))
+        if not self.extrapolate_top and np.any(depth < self.depths[0]):
+            raise ValueError("depth smaller than range " + self.name)
+        return np.interp(depth, self.depths, self.temperatures)
+
+
+# the geotherms of the tables of the built-in geotherms, by file name
+_table_geotherms = {}
 
-def adiabatic(pressures, T0, rock):
+def _table_geotherm(filename, name, extrapolate_top):
+    if filename not in _table_geotherms:
+        _table_geotherms[filename] = TableGeotherm.from_file(filename, extrapolate_top=extrapolate_top, name=name)
+    return _table_geotherms[filename]
+
+def adiabatic(pressures, T0, rock, warm_start=False):
     """
     This calculates a geotherm based on an anchor temperature and a rock,
     assuming that the rock's temperature follows an adiabatic gradient with
@@ -78,13 +140,23 @@ def adiabatic(pressures, T0, rock):
         must compute average Grueneisen parameters and adiabatic bulk moduli
         for each pressure/temperature.
 
+    warm_start : bool
+        Whether the volume solves start from the solution at the previous
+        state of the integration (see :func:`burnman.Mineral.set_warm_start`).
+
     Returns
     -------
 
     temperature: list of floats
         The list of temperatures for each pressure. :math:`[K]`
     """
-    temperatures = integrate.odeint(lambda t,p : dTdP(t,p,rock), T0, pressures)
+    if warm_start:
+        rock.set_warm_start(True)
+    try:
+        temperatures = integrate.odeint(lambda t,p : dTdP(t,p,rock), T0, pressures)
+    finally:
+        if warm_start:
+            rock.set_warm_start(False)
     return temperatures.ravel()
 
 def dTdP(temperature, pressure, rock):
@@ -125,8 +197,8 @@ def dTdP(temperature, pressure, rock):
     """
     top = 0
     bottom = 0
-    rock.set_state(pressure, temperature)
-    (fractions,minerals) = rock.unroll()
+    rock.set_state(pressure, temperature, _gradient_properties)
+    (fractions,minerals) = rock.unroll_arrays()
     for (fr,mineral) in zip(fractions,minerals):
         gr = mineral.grueneisen_parameter()
         K_s = mineral.adiabatic_bulk_modulus()
@@ -138,11 +210,408 @@ def dTdP(temperature, pressure, rock):
     return temperature*top/bottom
 
 
-table_brown = tools.read_table("input_geotherm/brown_81.txt")
-table_brown_depth = np.array(table_brown)[:,0]
-table_brown_temperature = np.array(table_brown)[:,1]
+def isentrope(pressures, T0, rock, rtol=1.e-10, max_iterations=50):
+    """
+    This calculates the same geotherm as :func:`adiabatic`, as the
+    temperatures at which the entropy of the rock is that at the first
+    pressure and T0:
+
+    .. math::
+        \\Sigma_i X_i S_i(P, T) = \\Sigma_i X_i S_i(P_0, T_0)
+
+    which is solved with Newton's method for all pressures at once, using
+    :math:`\\partial S / \\partial T = C_p / T`.  The pressures do not depend
+    on each other, and every iteration evaluates the phases at all the
+    pressures that have not converged yet in one go (see
+    :func:`burnman.Mineral.evaluate`).  The equations of state of the
+    phases have to provide the entropy (like 'slb2', 'slb3' and 'hp_tmt').
+
+    Parameters
+    ----------
+    pressures : list of floats
+        The list of pressures in :math:`[Pa]` at which to evaluate the geotherm.
+    T0 : float
+        An anchor temperature, corresponding to the temperature of the first
+        pressure in the list. :math:`[K]`
+    rock : :class:`burnman.Material`
+        Material for which we compute the isentrope.
+    rtol : float
+        Relative tolerance of the temperatures.
+    max_iterations : int
+        The maximum number of Newton iterations.
+
+    Returns
+    -------
+    temperature: list of floats
+        The list of temperatures for each pressure. :math:`[K]`
+    """
+    pressures = np.array(pressures, dtype=float)
+    S0 = _entropy_and_heat_capacity(rock, pressures[:1], np.array([float(T0)]))[0][0]
+    if np.isnan(S0):
+        raise ValueError("the equations of state of the rock do not provide the entropy")
+
+    temperatures = np.empty(len(pressures))
+    temperatures.fill(T0)
+    active = np.arange(len(pressures))
+    for i in range(max_iterations):
+        S, C_p = _entropy_and_heat_capacity(rock, pressures[active], temperatures[active])
+        # Newton step in log(T), as dS/dlog(T) = C_p
+        step = np.exp(-(S - S0)/C_p)
+        temperatures[active] *= step
+        active = active[np.abs(step - 1.) > rtol]
+        if len(active) == 0:
+            break
+    else:
+        raise Exception("the isentrope did not converge at " + str(len(active)) + " pressures")
+    temperatures[0] = T0
+    return temperatures
+
+
+def _entropy_and_heat_capacity(rock, pressures, temperatures):
+    """
+    Returns the molar entropies and heat capacities at constant pressure of
+    the rock at arrays of pressures and temperatures.
+    """
+    fractions, phases = _phase_properties(rock, pressures, temperatures, ['S', 'C_p'])
+    S = sum(fraction*phase['S'] for (fraction, phase) in zip(fractions, phases))
+    C_p = sum(fraction*phase['C_p'] for (fraction, phase) in zip(fractions, phases))
+    return S, C_p
+
+
+def _static_unroll(rock):
+    """
+    Returns the unrolled fractions and minerals of the rock if they do not
+    depend on the state, otherwise None.
+    """
+    if isinstance(rock, Mineral):
+        return rock.unroll_arrays()
+    if isinstance(rock, Composite):
+        if any(_static_unroll(phase) is None for (fraction, phase) in rock.children):
+            return None
+        return rock.unroll_arrays()
+    return None
+
+
+def _phase_properties(rock, pressures, temperatures, names):
+    """
+    Evaluate properties of the phases of the rock at arrays of pressures and
+    temperatures.  Returns the fractions of the phases and a list of
+    dictionaries of arrays, one for each phase.  If the phases depend on the
+    state, the rock is set to each state in turn, and has to unroll to the
+    same number of phases at all of them.
+    """
+    unrolled = _static_unroll(rock)
+    if unrolled is not None:
+        fractions, minerals = unrolled
+        return fractions, [mineral.evaluate(pressures, temperatures, names) for mineral in minerals]
+
+    fractions = None
+    phases = None
+    for idx in range(len(pressures)):
+        rock.set_state(pressures[idx], temperatures[idx], names)
+        (point_fractions, minerals) = rock.unroll_arrays()
+        if phases is None:
+            fractions = np.empty((len(minerals), len(pressures)))
+            phases = [dict((name, np.empty(len(pressures))) for name in names) for mineral in minerals]
+        elif len(minerals) != len(phases):
+            raise ValueError("the rock unrolls to a different number of phases at point " + str(idx))
+        fractions[:, idx] = point_fractions
+        for (phase, mineral) in zip(phases, minerals):
+            for name in names:
+                phase[name][idx] = getattr(mineral, name)
+    return list(fractions), phases
+
+
+# the Dormand-Prince 5(4) pair: nodes, coefficients of the stages, weights of
+# the fifth order solution (also the last row of a), differences to the
+# weights of the fourth order solution, and the coefficients of the dense
+# output (see Hairer, Norsett and Wanner, Solving Ordinary Differential
+# Equations I)
+_dopri_c = [0., 1./5., 3./10., 4./5., 8./9., 1., 1.]
+_dopri_a = [[],
+            [1./5.],
+            [3./40., 9./40.],
+            [44./45., -56./15., 32./9.],
+            [19372./6561., -25360./2187., 64448./6561., -212./729.],
+            [9017./3168., -355./33., 46732./5247., 49./176., -5103./18656.],
+            [35./384., 0., 500./1113., 125./192., -2187./6784., 11./84.]]
+_dopri_e = [71./57600., 0., -71./16695., 71./1920., -17253./339200., 22./525., -1./40.]
+_dopri_d = [-12715105075./11282082432., 0., 87487479700./32700410799., -10690763975./1880347072.,
+            701980252875./199316789632., -1453857185./822651844., 69997945./29380423.]
+
+
+class AdiabaticProfile(object):
+    """
+    An adiabat computed by :func:`adiabatic_profile`.  The attributes are
+
+    - pressures: the output pressures :math:`[Pa]`
+    - temperatures: the temperatures at the output pressures :math:`[K]`
+    - moduli: the properties of the phases at the output pressures, as
+      returned by :func:`burnman.calculate_moduli_arrays`, which can be
+      passed on to :func:`burnman.velocities_from_rock`
+    - n_evaluations: the number of states of the rock that were evaluated
+      by the integration (not counting the output pressures)
+
+    Calling the profile with pressures between the first and the last
+    output pressure returns the temperatures there (dense output), with
+    the fourth order interpolant of the Runge-Kutta steps.
+    """
+
+    def __init__(self, pressures, temperatures, moduli, steps, n_evaluations):
+        self.pressures = pressures
+        self.temperatures = temperatures
+        self.moduli = moduli
+        self.n_evaluations = n_evaluations
+        # the pressures at the starts of the steps, and the coefficients of
+        # the dense output in the steps (see _dense_output)
+        self._steps = steps
+
+    def __call__(self, pressures):
+        return _dense_output(self._steps, np.asarray(pressures, dtype=float))
+
+
+def _dense_output(steps, pressures):
+    # the temperatures at the pressures, with the shape of the pressures
+    # followed by that of the integrated temperatures
+    P_start, h, coefficients = steps
+    sign = 1. if h[0] >= 0. else -1.
+    idx = np.clip(np.searchsorted(sign*P_start, sign*pressures, side='right') - 1, 0, len(P_start) - 1)
+    theta = (pressures - P_start[idx])/h[idx]
+    theta = theta.reshape(theta.shape + (1,)*(coefficients.ndim - 2))
+    r1, r2, r3, r4, r5 = coefficients[:, idx]
+    return r1 + theta*(r2 + (1. - theta)*(r3 + theta*(r4 + (1. - theta)*r5)))
+
+
+def _dormand_prince(gradient, pressures, T0, rtol, atol, max_steps=10000):
+    """
+    Integrate dT/dP = gradient(T, P) from the first to the last of the
+    pressures with adaptive Dormand-Prince steps.  T0 is a float or an
+    array of temperatures that are integrated together, with the steps
+    chosen for the largest error of them.  Returns the steps for
+    :func:`_dense_output`, the temperature at the last pressure and the
+    number of evaluations of the gradient.  Raises a ValueError if the
+    gradient is not finite, and an Exception if the integration takes
+    more than max_steps (accepted and rejected) steps or the steps become
+    negligibly small.
+    """
+    P_end = pressures[-1]
+    P = pressures[0]
+    T = T0
+    k = [gradient(T, P)] + [0.]*6
+    if not np.all(np.isfinite(k[0])):
+        raise ValueError("the adiabatic gradient is not finite at " + str(P) + " Pa")
+    n_evaluations = 1
+    h = 0.01*(P_end - P)
+    h_min = 1.e-12*abs(P_end - P)
+    P_start = []
+    h_steps = []
+    coefficients = []
+
+    for step in range(max_steps):
+        if P == P_end:
+            break
+        if abs(h) < h_min:
+            raise Exception("the step size of the adiabat became too small at " + str(P) + " Pa")
+        if abs(h) >= abs(P_end - P):
+            h = P_end - P
+        for stage in range(1, 7):
+            T_stage = T + h*sum(a*k_j for (a, k_j) in zip(_dopri_a[stage], k))
+            k[stage] = gradient(T_stage, P + _dopri_c[stage]*h)
+        n_evaluations += 6
+        # the last stage is the fifth order solution at P + h
+        T_new = T_stage
+        error = np.max(np.abs(h*sum(e*k_j for (e, k_j) in zip(_dopri_e, k)))
+                       /(atol + rtol*np.maximum(np.abs(T), np.abs(T_new))))
+        if not np.isfinite(error):
+            raise ValueError("the adiabatic gradient is not finite between " + str(P) + " and " + str(P + h) + " Pa")
+        if error <= 1.:
+            difference = T_new - T
+            r3 = h*k[0] - difference
+            P_start.append(P)
+            h_steps.append(h)
+            coefficients.append((T, difference, r3, difference - h*k[6] - r3,
+                                 h*sum(d*k_j for (d, k_j) in zip(_dopri_d, k))))
+            P = P_end if h == P_end - P else P + h
+            T = T_new
+            k[0] = k[6]
+        h *= 5. if error == 0. else min(5., max(0.2, 0.9*error**(-0.2)))
+    else:
+        if P != P_end:
+            raise Exception("the adiabat did not reach " + str(P_end) + " Pa in " + str(max_steps) + " steps")
+
+    if len(P_start) == 0:
+        steps = (np.array([P]), np.array([1.]), np.array([T, 0.*T, 0.*T, 0.*T, 0.*T])[:, np.newaxis])
+    else:
+        steps = (np.array(P_start), np.array(h_steps), np.swapaxes(np.array(coefficients), 0, 1))
+    return steps, T, n_evaluations
+
+
+def adiabatic_profile(pressures, T0, rock, rtol=1.e-8, atol=1.e-6):
+    """
+    Integrate the adiabat of :func:`adiabatic` with the Dormand-Prince
+    Runge-Kutta pair of orders 5 and 4 with adaptive steps.  The last stage
+    of a step is the first stage of the next one (first same as last), so
+    a step needs six evaluations of the rock, and these only compute the
+    Grueneisen parameters, adiabatic bulk moduli and heat capacities of
+    the phases.  The steps are chosen by the error control alone, and the
+    temperatures at the output pressures come from the dense output of
+    the steps, so closely spaced output pressures do not make the
+    integration more expensive.  Then the rock is evaluated once at each
+    output pressure, for the properties that
+    :func:`burnman.velocities_from_rock` needs.
+
+    Parameters
+    ----------
+    pressures : list of floats
+        The output pressures, increasing or decreasing. :math:`[Pa]`
+    T0 : float
+        The anchor temperature at the first pressure. :math:`[K]`
+    rock : :class:`burnman.Material`
+        The rock, which has to unroll to the same number of phases at all
+        the output pressures.
+    rtol, atol : float
+        Relative and absolute tolerance for the local error of a step,
+        which is estimated with the difference of the orders 5 and 4.
+
+    Returns
+    -------
+    adiabat : :class:`AdiabaticProfile`
+        The temperatures and properties of the phases at the output
+        pressures, and the dense output in between.
+    """
+    pressures = np.array(pressures, dtype=float)
+    steps, T, n_evaluations = _dormand_prince(lambda T, P: dTdP(T, P, rock), pressures, float(T0), rtol, atol)
+    temperatures = _dense_output(steps, pressures)
+    temperatures[0] = T0
+    temperatures[-1] = T
+    moduli = main.calculate_moduli_arrays(rock, pressures, temperatures)
+    return AdiabaticProfile(pressures, temperatures, moduli, steps, n_evaluations)
+
 
-table_anderson = tools.read_table("input_geotherm/anderson_82.txt")
-table_anderson_depth = np.array(table_anderson)[:,0]
-table_anderson_temperature = np.array(table_anderson)[:,1]
+def adiabatic_ensemble(pressures, T0, rocks, rtol=1.e-8, atol=1.e-6):
+    """
+    Integrate the adiabats of :func:`adiabatic` for many anchor
+    temperatures (and rocks) together, with the steps of
+    :func:`adiabatic_profile`, which are shared by all members of the
+    ensemble.  At each stage of a step, the phases are evaluated for all
+    members at once with :func:`burnman.Mineral.evaluate`.  Equal minerals
+    of different rocks (of the same type and with the same equation of
+    state and params, see
+    :class:`burnman.eos.parameters.ContentIndex`) are evaluated
+    together, so an ensemble of rocks that differ only in their
+    fractions costs about as much as a single rock.  Rocks whose phases
+    depend on the state are set to the state of each member in turn.
+
+    Parameters
+    ----------
+    pressures : list of floats
+        The output pressures, increasing or decreasing. :math:`[Pa]`
+    T0 : list of floats
+        The anchor temperatures at the first pressure, one for each member
+        of the ensemble. :math:`[K]`
+    rocks : :class:`burnman.Material` or list of :class:`burnman.Material`
+        The rock of all members, or the rock of each member.
+    rtol, atol : float
+        Relative and absolute tolerance for the local error of a step of
+        each member.
+
+    Returns
+    -------
+    temperatures : array of floats
+        The temperatures of each member (rows) at the pressures (columns). :math:`[K]`
+    """
+    pressures = np.array(pressures, dtype=float)
+    T0 = np.array(T0, dtype=float).reshape(-1)
+    if isinstance(rocks, (list, tuple)):
+        if len(rocks) != len(T0):
+            raise ValueError("the number of rocks does not match the number of anchor temperatures")
+    else:
+        rocks = [rocks]*len(T0)
+    groups, dynamic = _ensemble_groups(rocks)
+
+    def gradient(temperatures, pressure):
+        return _ensemble_dTdP(temperatures, pressure, groups, dynamic)
+
+    steps, T, n_evaluations = _dormand_prince(gradient, pressures, T0, rtol, atol)
+    temperatures = _dense_output(steps, pressures).T
+    temperatures[:, 0] = T0
+    temperatures[:, -1] = T
+    return temperatures
+
+
+def _mineral_key(mineral, index):
+    # minerals with equal keys give the same properties in evaluate()
+    if type(mineral).set_state.__func__ is Mineral.set_state.__func__ and \
+            type(mineral).compute_properties.__func__ is Mineral.compute_properties.__func__ and \
+            mineral.method is not None:
+        return (type(mineral), mineral.method, index.number(mineral.params))
+    return id(mineral)
 
+
+def _ensemble_groups(rocks):
+    """
+    Returns the minerals of the static rocks of an ensemble as a list of
+    (mineral, members, fractions), with the indices of the members that
+    contain the mineral and its fractions in their rocks, and the other
+    rocks as a list of (rock, members).
+    """
+    members_of = {}
+    order = []
+    for (member, rock) in enumerate(rocks):
+        if id(rock) not in members_of:
+            members_of[id(rock)] = []
+            order.append(rock)
+        members_of[id(rock)].append(member)
+
+    groups = {}
+    keys = []
+    dynamic = []
+    index = eos.parameters.ContentIndex()
+    for rock in order:
+        members = members_of[id(rock)]
+        unrolled = _static_unroll(rock)
+        if unrolled is None:
+            dynamic.append((rock, members))
+            continue
+        for (fraction, mineral) in zip(*unrolled):
+            key = _mineral_key(mineral, index)
+            if key not in groups:
+                groups[key] = (mineral, [], [])
+                keys.append(key)
+            groups[key][1].extend(members)
+            groups[key][2].extend([fraction]*len(members))
+    return [(groups[key][0], np.array(groups[key][1]), np.array(groups[key][2], dtype=float))
+            for key in keys], dynamic
+
+
+def _ensemble_dTdP(temperatures, pressure, groups, dynamic):
+    """
+    The adiabatic gradients of :func:`dTdP` for all members of an ensemble
+    (see :func:`_ensemble_groups`) at their temperatures and a pressure.
+    """
+    top = np.zeros(len(temperatures))
+    bottom = np.zeros(len(temperatures))
+    for (mineral, members, fractions) in groups:
+        values = mineral.evaluate(pressure, temperatures[members], _gradient_properties)
+        C_p = fractions*values['C_p']
+        np.add.at(top, members, C_p*values['gr']/values['K_S'])
+        np.add.at(bottom, members, C_p)
+    for (rock, members) in dynamic:
+        for member in members:
+            top[member] = dTdP(temperatures[member], pressure, rock)
+            bottom[member] = temperatures[member]
+    return temperatures*top/bottom
+
+
+# the geotherm tables (depths and temperatures) that have been read, by file name
+_tables = {}
+
+def _read_table(filename):
+    """
+    Returns the depths and temperatures of a geotherm table, which is only
+    read on first use.
+    """
+    if filename not in _tables:
+        table = np.array(tools.read_table(filename))
+        _tables[filename] = (table[:,0], table[:,1])
+    return _tables[filename]
@@ -8,6 +8,7 @@ import scipy.integrate as integrate
 import burnman.geotherm
 import burnman.seismic
 import burnman.averaging_schemes
+import burnman.tools
 
 
 class ElasticProperties(object):
@@ -17,13 +18,19 @@ class ElasticProperties(object):
     :func:`calculate_moduli`. Several instances of elastic_properties can be
     averaged using :func:`average_moduli`.
 
+    The attributes can also be arrays, with one entry per evaluation point
+    (and phase), see :func:`calculate_moduli_arrays` and
+    :func:`average_moduli_arrays`.
+
     :var float V: volume :math:`[m^3]`
     :var float rho: density :math:`[kg/m^3]`
     :var float K: bulk modulus :math:`K` :math:`[Pa]`
     :var float G: shear modulus :math:`G` :math:`[Pa]`
+    :var n_phases: for arrays of a rock whose number of phases changes, the
+      number of phases at each point, otherwise None
     """
 
-    def __init__(self, V=None, rho=None, K=None, G=None, fraction=None):
+    def __init__(self, V=None, rho=None, K=None, G=None, fraction=None, n_phases=None):
         """
         create an object with the given parameters.
         """
@@ -32,12 +39,122 @@ class ElasticProperties(object):
         self.K = K
         self.G = G
         self.fraction = fraction
+        self.n_phases = n_phases
+
+
+def calculate_moduli_arrays(rock, pressures, temperatures, warm_start=False, n_workers=None, executor=None):
+    """
+    Given a composite and a list of pressures :math:`[Pa]` and temperatures :math:`[K]`,
+    calculate the elastic moduli and densities of the individual phases, as
+    arrays of shape (n_evaluation_points, n_phases).  If the number of phases
+    of the rock changes, n_phases is the largest number, and the points with
+    fewer phases are padded with copies of their first phase with zero
+    fraction and volume, which do not change the averages (the numbers of
+    phases are in the n_phases attribute of the result).
 
+    :param burnman.abstract_material rock: this is a rock
 
-def calculate_moduli(rock, pressures, temperatures):
+    :type pressures: list of float
+    :param pressures: list of pressures you want to evaluate the rock at. :math:`[Pa]`
+
+    :type temperatures: list of float
+    :param temperatures: list of temperatures you want to evaluate the rock at. :math:`[K]`
+
+    :type warm_start: bool
+    :param warm_start: whether to warm start the volume solves from the previous point, see :func:`calculate_moduli`.
+
+    :type n_workers: int
+    :param n_workers: evaluate the points in this many chunks in parallel processes, see :func:`burnman.tools.map_in_chunks`.
+
+    :param executor: pool of processes to evaluate the chunks in, see :func:`burnman.tools.map_in_chunks`.
+
+    :returns:
+      moduli -- elastic properties whose attributes V (the molar volumes
+      times the molar fractions), rho, K, G and fraction are arrays of
+      shape (n_evaluation_points, n_phases)
+    :rtype: :class:`burnman.ElasticProperties`
+    """
+    if executor is not None or (n_workers is not None and n_workers > 1):
+        chunks = burnman.tools.map_in_chunks(_moduli_arrays, rock, pressures, temperatures, warm_start, n_workers, executor)
+        n_phases = max(chunk.V.shape[1] for chunk in chunks)
+        if all(chunk.n_phases is None and chunk.V.shape[1] == n_phases for chunk in chunks):
+            return ElasticProperties(*[np.concatenate([getattr(chunk, name) for chunk in chunks])
+                                       for name in ['V', 'rho', 'K', 'G', 'fraction']])
+        return ElasticProperties(*[np.concatenate([_pad_phases(getattr(chunk, name), n_phases, name == 'V' or name == 'fraction')
+                                                   for chunk in chunks])
+                                   for name in ['V', 'rho', 'K', 'G', 'fraction']],
+                                 n_phases=np.concatenate([np.repeat(chunk.V.shape[1], chunk.V.shape[0])
+                                                          if chunk.n_phases is None else chunk.n_phases
+                                                          for chunk in chunks]))
+    return _moduli_arrays(rock, pressures, temperatures, warm_start)
+
+def _pad_phases(values, n_phases, zero):
+    """
+    Pad an array of shape (n_points, m) to (n_points, n_phases) with zeros
+    or with copies of the first phase.
+    """
+    padding = np.zeros((values.shape[0], n_phases - values.shape[1])) if zero else \
+        np.repeat(values[:, :1], n_phases - values.shape[1], axis=1)
+    return np.concatenate([values, padding], axis=1)
+
+def _moduli_arrays(rock, pressures, temperatures, warm_start):
+    """
+    Serial part of :func:`calculate_moduli_arrays`.
+    """
+    n_points = len(pressures)
+    n_phases = 0
+    V = K = G = rho = fraction = np.empty((n_points, 0))
+    # the numbers of phases at the points, if they change
+    counts = None
+
+    if warm_start:
+        rock.set_warm_start(True)
+    try:
+        for idx in range(n_points):
+            rock.set_state(pressures[idx], temperatures[idx])
+            (fractions,minerals) = rock.unroll_arrays()
+            if idx == 0:
+                n_phases = len(minerals)
+                V, K, G, rho, fraction = [np.empty((n_points, n_phases)) for i in range(5)]
+            elif len(minerals) != n_phases:
+                if counts is None:
+                    counts = np.repeat(n_phases, n_points)
+                if len(minerals) > n_phases:
+                    # the earlier points are padded with zeros and copies
+                    # of their first phase, see _pad_phases
+                    V, rho, K, G, fraction = [_pad_phases(values, len(minerals), zero)
+                                              for (values, zero) in [(V, True), (rho, False), (K, False),
+                                                                     (G, False), (fraction, True)]]
+                    n_phases = len(minerals)
+            if counts is not None:
+                counts[idx] = len(minerals)
+            fraction[idx, :len(minerals)] = fractions
+            fraction[idx, len(minerals):] = 0.
+            for (i, mineral) in enumerate(minerals):
+                V[idx, i] = mineral.molar_volume()
+                K[idx, i] = mineral.adiabatic_bulk_modulus()
+                G[idx, i] = mineral.shear_modulus()
+                rho[idx, i] = mineral.molar_mass() / V[idx, i]
+            for i in range(len(minerals), n_phases):
+                V[idx, i], K[idx, i], G[idx, i], rho[idx, i] = V[idx, 0], K[idx, 0], G[idx, 0], rho[idx, 0]
+    finally:
+        if warm_start:
+            rock.set_warm_start(False)
+
+    V *= fraction
+    return ElasticProperties(V=V, rho=rho, K=K, G=G, fraction=fraction, n_phases=counts)
+
+def calculate_moduli(rock, pressures, temperatures, warm_start=False):
     """
     Given a composite and a list of pressures :math:`[Pa]` and temperatures :math:`[K]`,
     calculate the elastic moduli and densities of the individual phases.
+    With warm_start, the volume solve at each point starts from the solution at the
+    previous point (see :func:`burnman.Mineral.set_warm_start`), which is faster
+    for closely spaced points along a profile.
+
+    This returns the result of :func:`calculate_moduli_arrays` as one object
+    per point and phase (without the padding of rocks whose number of phases
+    changes).
 
     :param burnman.abstract_material rock: this is a rock
 
@@ -47,28 +164,56 @@ def calculate_moduli(rock, pressures, temperatures):
     :type temperatures: list of float
     :param temperatures: list of temperatures you want to evaluate the rock at. :math:`[K]`
 
+    :type warm_start: bool
+    :param warm_start: whether to warm start the volume solves from the previous point.
+
     :returns:
       answer -- an array of (n_evaluation_points by n_phases) of
       elastic_properties(), so the result is of the form
       answer[pressure_idx][phase_idx].V
     :rtype: list of list of :class:`burnman.elastic_properties`
     """
+    moduli = calculate_moduli_arrays(rock, pressures, temperatures, warm_start)
+    return [[ElasticProperties(V=moduli.V[idx, i], rho=moduli.rho[idx, i], K=moduli.K[idx, i],
+                               G=moduli.G[idx, i], fraction=moduli.fraction[idx, i])
+             for i in range(moduli.V.shape[1] if moduli.n_phases is None else moduli.n_phases[idx])]
+            for idx in range(moduli.V.shape[0])]
 
-    answer = [[] for p in pressures]
+def average_moduli_arrays(moduli, averaging_scheme=burnman.averaging_schemes.VoigtReussHill()):
+    """
+    Given elastic properties with arrays of shape (n_evaluation_points,
+    n_phases), as returned by :func:`calculate_moduli_arrays`, calculate the
+    bulk properties according to an averaging scheme (see
+    :func:`average_moduli`).  Schemes that average 2-D arrays (see
+    :class:`burnman.averaging_schemes.AveragingScheme`) are called once
+    with the whole arrays, other schemes once per point.
 
-    for idx in range(len(pressures)):
-        rock.set_state(pressures[idx], temperatures[idx])
-        (fractions,minerals) = rock.unroll()
-        for (fraction,mineral) in zip(fractions,minerals):
-            e = ElasticProperties()
-            e.V = fraction * mineral.molar_volume()
-            e.K = mineral.adiabatic_bulk_modulus()
-            e.G = mineral.shear_modulus()
-            e.rho = mineral.molar_mass() / mineral.molar_volume()
-            e.fraction = fraction
-            answer[idx].append(e)
+    :type moduli: :class:`burnman.ElasticProperties`
+    :param moduli: End-member moduli to be averaged.
 
-    return answer
+    :type averaging_scheme: :class:`burnman.averaging_schemes.averaging_scheme`
+    :param averaging_scheme: Averaging scheme to use.
+
+    :returns: Elastic properties whose attributes are arrays of length n_evaluation_points.
+    :rtype: :class:`burnman.ElasticProperties`
+    """
+    n_points = moduli.V.shape[0]
+    if getattr(averaging_scheme, 'averages_arrays', False):
+        K = averaging_scheme.average_bulk_moduli(moduli.V, moduli.K, moduli.G)
+        G = averaging_scheme.average_shear_moduli(moduli.V, moduli.K, moduli.G)
+        rho = averaging_scheme.average_density(moduli.V, moduli.rho)
+    else:
+        K, G, rho = [np.empty(n_points) for i in range(3)]
+        for idx in range(n_points):
+            # without the padding of calculate_moduli_arrays
+            n = moduli.V.shape[1] if moduli.n_phases is None else moduli.n_phases[idx]
+            V_ph, K_ph, G_ph = moduli.V[idx, :n], moduli.K[idx, :n], moduli.G[idx, :n]
+            K[idx] = averaging_scheme.average_bulk_moduli(V_ph, K_ph, G_ph)
+            G[idx] = averaging_scheme.average_shear_moduli(V_ph, K_ph, G_ph)
+            rho[idx] = averaging_scheme.average_density(V_ph, moduli.rho[idx, :n])
+
+    return ElasticProperties(V=np.sum(moduli.V, axis=1), rho=np.asarray(rho), K=np.asarray(K),
+                             G=np.asarray(G), fraction=np.ones(n_points))
 
 def average_moduli(moduli_list, averaging_scheme=burnman.averaging_schemes.VoigtReussHill):
     """
@@ -80,7 +225,8 @@ def average_moduli(moduli_list, averaging_scheme=burnman.averaging_schemes.Voigt
     may specify, Voigt, Reuss, the Hashin-Shtrikman bounds, or any user
     defined scheme that satisfies the interface
     :class:`burnman.averaging_schemes.averaging_scheme` (also see
-    :doc:`averaging`).
+    :doc:`averaging`).  The averages are computed by
+    :func:`average_moduli_arrays`.
 
     :type moduli_list: list of list of :class:`burnman.elastic_properties`
     :param moduli_list: List of end-member moduli to be averaged.
@@ -91,24 +237,16 @@ def average_moduli(moduli_list, averaging_scheme=burnman.averaging_schemes.Voigt
     :returns: A list of n_evaluation_points instances of elastic_properties.
     :rtype: list of :class:`burnman.elastic_properties`
     """
-    n_pressures = len(moduli_list)
-    result = [ElasticProperties() for i in range(n_pressures)]
-
-    for idx in range(n_pressures):
-        fractions = np.array([e.fraction for e in moduli_list[idx]])
-
-        V_frac = np.array([m.V for m in moduli_list[idx]])
-        K_ph = np.array([m.K for m in moduli_list[idx]])
-        G_ph = np.array([m.G for m in moduli_list[idx]])
-        rho_ph = np.array([m.rho for m in moduli_list[idx]])
-
-        result[idx].V = sum(V_frac)
-        result[idx].K = averaging_scheme.average_bulk_moduli(V_frac, K_ph, G_ph)
-        result[idx].G = averaging_scheme.average_shear_moduli(V_frac, K_ph, G_ph)
-        result[idx].rho = averaging_scheme.average_density(V_frac, rho_ph)
-        result[idx].fraction = 1.0
-
-    return result
+    # points with fewer phases are padded as in calculate_moduli_arrays
+    n_phases = max(len(point) for point in moduli_list) if len(moduli_list) else 0
+    moduli = ElasticProperties(*[np.array([[getattr(e, name) for e in point] +
+                                           [0. if name in ('V', 'fraction') else getattr(point[0], name)]*(n_phases - len(point))
+                                           for point in moduli_list], dtype=float)
+                                 for name in ['V', 'rho', 'K', 'G', 'fraction']])
+    averages = average_moduli_arrays(moduli, averaging_scheme)
+    return [ElasticProperties(V=averages.V[idx], rho=averages.rho[idx], K=averages.K[idx],
+                              G=averages.G[idx], fraction=1.0)
+            for idx in range(len(moduli_list))]
 
 def compute_velocities(moduli):
     """
@@ -116,7 +254,7 @@ def compute_velocities(moduli):
     and :math:`V_{\phi}` :math:`[m/s]` for each entry in the list.
 
 
-    :type moduli: list of :class:`ElasticProperties`
+    :type moduli: list of :class:`ElasticProperties`, or :class:`ElasticProperties` of arrays
     :param moduli: input elastic properties.
 
     :returns: lists of :math:`V_p, V_s,` and :math:`V_{\phi}` :math:`[m/s]`
@@ -124,25 +262,27 @@ def compute_velocities(moduli):
 
 
     """
-    mat_vs = np.ndarray(len(moduli))
-    mat_vp = np.ndarray(len(moduli))
-    mat_vphi = np.ndarray(len(moduli))
-
-    for i in range(len(moduli)):
+    if isinstance(moduli, ElasticProperties):
+        K, G, rho = np.asarray(moduli.K), np.asarray(moduli.G), np.asarray(moduli.rho)
+    else:
+        K = np.array([m.K for m in moduli], dtype=float)
+        G = np.array([m.G for m in moduli], dtype=float)
+        rho = np.array([m.rho for m in moduli], dtype=float)
 
-        mat_vs[i] = np.sqrt( moduli[i].G / moduli[i].rho)
-        mat_vp[i] = np.sqrt( (moduli[i].K + 4./3.*moduli[i].G) / moduli[i].rho)
-        mat_vphi[i] = np.sqrt( moduli[i].K / moduli[i].rho)
+    mat_vs = np.sqrt( G / rho)
+    mat_vp = np.sqrt( (K + 4./3.*G) / rho)
+    mat_vphi = np.sqrt( K / rho)
 
     return mat_vp, mat_vs, mat_vphi
 
 
-def velocities_from_rock(rock, pressures, temperatures, averaging_scheme=burnman.averaging_schemes.VoigtReussHill()):
+def velocities_from_rock(rock, pressures, temperatures, averaging_scheme=burnman.averaging_schemes.VoigtReussHill(), warm_start=False,
+                         n_workers=None, executor=None, moduli=None):
     """
     A function that rolls several steps into one: given a rock and a list of
     pressures and temperatures, it calculates the elastic moduli of the
-    individual phases using calculate_moduli(), averages them using
-    average_moduli(), and calculates the seismic velocities using
+    individual phases using calculate_moduli_arrays(), averages them using
+    average_moduli_arrays(), and calculates the seismic velocities using
     compute_velocities().
 
 
@@ -158,19 +298,29 @@ def velocities_from_rock(rock, pressures, temperatures, averaging_scheme=burnman
     :type averaging_scheme: :class:`burnman.averaging_schemes.averaging_scheme`
     :param averaging_scheme: Averaging scheme to use.
 
+    :type warm_start: bool
+    :param warm_start: whether to warm start the volume solves from the previous point, see :func:`calculate_moduli`.
+
+    :type n_workers: int
+    :param n_workers: evaluate the points in this many chunks in parallel processes, see :func:`burnman.tools.map_in_chunks`.
+
+    :param executor: pool of processes to evaluate the chunks in, see :func:`burnman.tools.map_in_chunks`.
+
+    :type moduli: :class:`burnman.ElasticProperties`
+    :param moduli: the moduli of the phases at the points, if they have been calculated already
+      (e.g. by :func:`burnman.geotherm.adiabatic_profile`), in which case the rock is not evaluated again.
+
     :returns: :math:`\\rho` :math:`[kg/m^3]` , :math:`V_p, V_s,` and :math:`V_{\phi}` :math:`[m/s]`, bulk modulus :math:`K` :math:`[Pa]`,shear modulus :math:`G` :math:`[Pa]`
     :rtype: lists of floats
 
     """
-    moduli_list = calculate_moduli(rock, pressures, temperatures)
-    moduli = average_moduli(moduli_list, averaging_scheme)
+    if moduli is None:
+        moduli = calculate_moduli_arrays(rock, pressures, temperatures, warm_start, n_workers, executor)
+    moduli = average_moduli_arrays(moduli, averaging_scheme)
     mat_vp, mat_vs, mat_vphi = compute_velocities(moduli)
-    mat_rho = np.array([m.rho for m in moduli])
-    mat_K = np.array([m.K for m in moduli])
-    mat_G = np.array([m.G for m in moduli])
-    return mat_rho, mat_vp, mat_vs, mat_vphi, mat_K, mat_G
+    return moduli.rho, mat_vp, mat_vs, mat_vphi, moduli.K, moduli.G
 
-def depths_for_rock(rock,pressures, temperatures,averaging_scheme=burnman.averaging_schemes.VoigtReussHill()):
+def depths_for_rock(rock,pressures, temperatures,averaging_scheme=burnman.averaging_schemes.VoigtReussHill(), n_workers=None, executor=None):
     """
     Function computes the self-consistent depths (to avoid using the PREM depth-pressure conversion) :cite:`Cammarano2013`.
     It is simplified by taking :math:`g` from PREM.
@@ -186,20 +336,24 @@ def depths_for_rock(rock,pressures, temperatures,averaging_scheme=burnman.averag
     :type averaging_scheme: :class:`burnman.averaging_schemes.averaging_scheme`
     :param averaging_scheme: Averaging scheme to use.
 
+    :type n_workers: int
+    :param n_workers: evaluate the points in this many chunks in parallel processes, see :func:`burnman.tools.map_in_chunks`.
+
+    :param executor: pool of processes to evaluate the chunks in, see :func:`burnman.tools.map_in_chunks`.
+
     :returns: depth :math:`[m]`
     :rtype: list of floats
     """
-    moduli_list = calculate_moduli(rock, pressures, temperatures)
-    moduli = average_moduli(moduli_list, averaging_scheme)
-    mat_rho = np.array([m.rho for m in moduli])
-    seismic_model = burnman.seismic.PREM()
+    mat_rho = average_moduli_arrays(calculate_moduli_arrays(rock, pressures, temperatures, n_workers=n_workers, executor=executor),
+                                    averaging_scheme).rho
+    seismic_model = burnman.seismic.prem_model
     depthsref = np.array(map(seismic_model.depth,pressures))
     pressref = np.zeros_like(pressures)
     g  = seismic_model.gravity(depthsref) # G for prem
     depths  = np.hstack((depthsref[0],depthsref[0]+integrate.cumtrapz(1./(g*mat_rho),pressures)))
     return depths
 
-def pressures_for_rock(rock, depths, T0, averaging_scheme=burnman.averaging_schemes.VoigtReussHill()):
+def pressures_for_rock(rock, depths, T0, averaging_scheme=burnman.averaging_schemes.VoigtReussHill(), n_workers=None, executor=None):
     """
     Function computes the self-consistent pressures (to avoid using the PREM depth pressure conversion) :cite:`Cammarano2013`.
     Only simplification is using :math:`g` from PREM.
@@ -215,12 +369,18 @@ def pressures_for_rock(rock, depths, T0, averaging_scheme=burnman.averaging_sche
     :type averaging_scheme: :class:`burnman.averaging_schemes.averaging_scheme`
     :param averaging_scheme: Averaging scheme to use.
 
+    :type n_workers: int
+    :param n_workers: evaluate the densities in this many chunks in parallel processes, see :func:`burnman.tools.map_in_chunks`.
+      The adiabat is integrated in this process.
+
+    :param executor: pool of processes to evaluate the chunks in, see :func:`burnman.tools.map_in_chunks`.
+
     :returns: pressures :math:`[Pa]`
     :rtype: list of floats
 
     """
     # use PREM pressures as inital guestimate
-    seismic_model = burnman.seismic.PREM()
+    seismic_model = burnman.seismic.prem_model
     pressures,_,_,_,_ = seismic_model.evaluate_all_at(depths)
     pressref = np.zeros_like(pressures)
     #gets table with PREM gravities
@@ -229,9 +389,8 @@ def pressures_for_rock(rock, depths, T0, averaging_scheme=burnman.averaging_sche
     while nrmse(len(pressures),pressures,pressref)>1.e-6:
         # calculate density
         temperatures = burnman.geotherm.adiabatic(pressures,T0,rock)
-        moduli_list = calculate_moduli(rock, pressures, temperatures)
-        moduli = average_moduli(moduli_list, averaging_scheme)
-        mat_rho = np.array([m.rho for m in moduli])
+        mat_rho = average_moduli_arrays(calculate_moduli_arrays(rock, pressures, temperatures, n_workers=n_workers, executor=executor),
+                                        averaging_scheme).rho
         # calculate pressures
         pressref = pressures
         pressures = np.hstack((pressref[0], pressref[0]+integrate.cumtrapz(g*mat_rho,depths)))
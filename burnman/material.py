@@ -2,6 +2,7 @@
 # Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
 # Released under GPL v2 or later.
 
+import numpy as np
 
 class Material(object):
     """
@@ -20,6 +21,14 @@ class Material(object):
         The current temperature as set by :func:`~burnman.Material.set_state`. [K]
     """
 
+    """
+    Whether the result of unroll() may change with the state.
+    :class:`burnman.Composite` keeps the unrolled minerals of its children
+    for which this is False, and calls unroll() of the others on every
+    call of its own unroll().
+    """
+    unroll_depends_on_state = True
+
     def __init__(self):
         self.pressure = None
         self.temperature = None
@@ -65,7 +74,7 @@ class Material(object):
             for (fr,mi) in zip(frs,mins):
                 print "  %g of phase %s" % (fr, mi.to_string())
 
-    def set_state(self, pressure, temperature):
+    def set_state(self, pressure, temperature, properties=None):
         """
         Set the material to the given pressure and temperature.
 
@@ -75,10 +84,23 @@ class Material(object):
             The desired pressure in [Pa].
         temperature : float
             The desired temperature in [K].
+        properties : string or list of strings
+            Properties to compute right away instead of on first access:
+            'all', 'elastic', 'thermodynamic' or a list of property names,
+            see :func:`burnman.Mineral.set_state`.
         """
         self.pressure = pressure
         self.temperature = temperature
 
+    def set_warm_start(self, warm_start):
+        """
+        Switch warm started volume solves on or off for all minerals in this
+        material, see :func:`burnman.Mineral.set_warm_start`.  Warm starts
+        help when the material is evaluated along a profile of closely
+        spaced states.  The base class does nothing.
+        """
+        pass
+
     def unroll(self):
         """
         Unroll this material into a list of :class:`burnman.Mineral` and their molar fractions. All averaging schemes
@@ -99,6 +121,22 @@ class Material(object):
         raise NotImplementedError("need to implement unroll() in derived class!")
         return ([], [])
 
+    def unroll_arrays(self):
+        """
+        Like :func:`unroll`, but returns the molar fractions as an array.
+        The returned array and list may be kept by the material (see
+        :func:`burnman.Composite.unroll_arrays`) and must not be modified.
+
+        Returns
+        -------
+        fractions : array of float
+            Array of molar fractions, should sum to 1.0.
+        minerals : list of :class:`burnman.Mineral`
+            List of minerals.
+        """
+        (fractions, minerals) = self.unroll()
+        return (np.array(fractions, dtype=float), minerals)
+
     def density(self):
         """
         Returns the density of this material. Note that the return value of this function may depend on the current
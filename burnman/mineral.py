@@ -3,12 +3,63 @@
 # Released under GPL v2 or later.
 
 import warnings
+import collections
 
 import numpy as np
 
 from burnman.material import Material
 import burnman.eos as eos
 
+# the active SharedStates contexts, innermost last
+_shared_states = []
+
+
+class SharedStates(object):
+    """
+    Context in which minerals with the same equation of state and equal
+    params (see :class:`burnman.eos.parameters.ContentIndex`) share the properties they compute at the same pressure and temperature.
+    The same endmember is often instantiated several times, e.g. in
+    several solid solutions, or used in several composites with the same
+    method; within the context it is evaluated once per state and the
+    result is handed to all of its copies::
+
+        with burnman.SharedStates():
+            for rock in rocks:
+                rho, v_p, v_s, v_phi, K, G = burnman.velocities_from_rock(rock, pressures, temperatures)
+
+    The properties (and the contents of the params) are kept until the
+    context is left, so the context
+    should not span more states than fit in memory.  Contexts can be
+    nested, the innermost one is used.  Minerals that compute their
+    properties from anything else than their params (like solid solutions
+    and tabulated minerals) do not take part.
+
+    This class is available as ``burnman.SharedStates``.
+    """
+
+    def __init__(self):
+        # the properties by (pressure, temperature, method, number of the params)
+        self.states = {}
+        self.params = eos.parameters.ContentIndex()
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        _shared_states.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _shared_states.remove(self)
+        return False
+
+    def info(self):
+        """
+        Returns a dictionary with the number of hits and misses (property
+        computations of minerals that did or did not find the state in
+        the context) and the number of states in the context.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.states)}
+
 
 class Mineral(Material):
     """
@@ -37,13 +88,55 @@ class Mineral(Material):
     unit cell. You can look up Z in many places, including www.mindat.org
     """
 
+    # attributes that are computed on first access after set_state()
+    lazy_attributes = eos.equation_of_state.property_names
+
+    # a mineral unrolls to itself
+    unroll_depends_on_state = False
+
+    """
+    Number of states whose properties :func:`Mineral.set_state` keeps, in
+    addition to the current one.  The states are identified by pressure,
+    temperature and the version of the params (see
+    :class:`burnman.eos.parameters.Parameters`), so that modifying the
+    params invalidates them.  The least recently used states are dropped
+    first.  Set to 0 to disable the cache.
+    """
+    state_cache_size = 32
+
+    """
+    Whether volume solves start from the volume of the previous state,
+    extrapolated to the new pressure and temperature, see
+    :func:`set_warm_start`.
+    """
+    warm_start = False
+
     def __init__(self):
-        if 'params' not in self.__dict__:
+        if '_params' not in self.__dict__:
             self.params = {}
         self.method = None
         if 'equation_of_state' in self.params:
             self.set_method(self.params['equation_of_state'])
 
+    @property
+    def params(self):
+        """
+        The parameters of the mineral, a dictionary.  Dictionaries assigned
+        to params are stored as a :class:`burnman.eos.parameters.Parameters`
+        (a copy), which keeps track of modifications so that the equation of
+        state can keep its compiled parameters until params change.
+        """
+        try:
+            return self.__dict__['_params']
+        except KeyError:
+            raise AttributeError("'" + self.__class__.__name__ + "' object has no attribute 'params'")
+
+    @params.setter
+    def params(self, params):
+        if not isinstance(params, eos.parameters.Parameters):
+            params = eos.parameters.Parameters(params)
+        self._params = params
+
     def set_method(self, equation_of_state):
         """
         Set the equation of state to be used for this mineral.
@@ -78,13 +171,20 @@ class Mineral(Material):
                 pass
 
         self.method = new_method
-
-        #Validate the params object on the requested EOS. 
-        try:
-            self.method.validate_parameters(self.params)
-        except Exception as e:
-            print 'Mineral ' + self.to_string() + ' failed to validate parameters with message : \" ' + e.message + '\"'
-            raise
+        # the cached properties are from the previous method (the cache is
+        # recreated by set_state)
+        self._state_cache = None
+        self._state_key = None
+
+        #Validate the params object on the requested EOS, unless this
+        #version of the params has been validated on it already.
+        if self.method not in self.params.validated:
+            try:
+                self.method.validate_parameters(self.params)
+            except Exception as e:
+                print 'Mineral ' + self.to_string() + ' failed to validate parameters with message : \" ' + e.message + '\"'
+                raise
+            self.params.validated.add(self.method)
 
     def to_string(self):
         """
@@ -101,54 +201,193 @@ class Mineral(Material):
     def eos_pressure(self, temperature, volume):
         return self.method.pressure(temperature, volume, self.params)
 
-    def set_state(self, pressure, temperature):
+    def set_state(self, pressure, temperature, properties=None):
         """
         Update the material to the given pressure [Pa] and temperature [K].
 
-        This updates the other properties of this class (v_s, v_p, ...).
+        This only records the new state. The other properties of this class
+        (V, K_S, G, gibbs, ..., and everything derived from them, like v_s and v_p)
+        are computed by the equation of state when they are first accessed, and
+        then cached. The properties of recently visited states are kept as
+        well (see :data:`state_cache_size`), so returning to one of them
+        does not recompute anything.
+
+        Parameters
+        ----------
+        pressure : float
+            The desired pressure in [Pa].
+        temperature : float
+            The desired temperature in [K].
+        properties : string or list of strings
+            Properties to compute right away instead of on first access:
+            'all', 'elastic' (volume, moduli, heat capacities, thermal
+            expansivity and Grueneisen parameter, enough for densities,
+            seismic velocities and adiabats), 'thermodynamic' (volume, gibbs,
+            helmholtz, S and H) or an explicit list of attribute names (see
+            :data:`burnman.eos.equation_of_state.property_names`).
         """
-
-        #in an effort to avoid additional work, don't do all the calculations if nothing has changed
-        try:
-            if self.pressure == pressure and self.temperature == temperature and self.old_params == self.params:
-                return
-        except AttributeError:
-            pass  #do nothing
-
-        self.pressure = pressure
-        self.temperature = temperature
-        self.old_params = self.params
-
         if self.method is None:
             raise AttributeError, "no method set for mineral, or equation_of_state given in mineral.params"
 
-        self.V = self.method.volume(self.pressure, self.temperature, self.params)
-        self.gr = self.method.grueneisen_parameter(self.pressure, self.temperature, self.V, self.params)
-        self.K_T = self.method.isothermal_bulk_modulus(self.pressure, self.temperature, self.V, self.params)
-        self.K_S = self.method.adiabatic_bulk_modulus(self.pressure, self.temperature, self.V, self.params)
-        self.G = self.method.shear_modulus(self.pressure, self.temperature, self.V, self.params)
-        self.C_v = self.method.heat_capacity_v(self.pressure, self.temperature, self.V, self.params)
-        self.C_p = self.method.heat_capacity_p(self.pressure, self.temperature, self.V, self.params)
-        self.alpha = self.method.thermal_expansivity(self.pressure, self.temperature, self.V, self.params)
-
-        # Attempt to calculate the gibbs free energy and helmholtz free energy, but don't complain if the
-        # equation of state does not calculate it, or if the mineral params do not have the requisite entries.
-        try:
-            self.gibbs = self.method.gibbs_free_energy(self.pressure, self.temperature, self.V, self.params)
-        except (KeyError, NotImplementedError):
-            self.gibbs = float('nan')
-        try:
-            self.helmholtz = self.method.helmholtz_free_energy(self.pressure, self.temperature, self.V, self.params)
-        except (KeyError, NotImplementedError):
-            self.helmholtz = float('nan')
+        # in an effort to avoid additional work, the properties computed at
+        # recently visited states are kept in a cache
+        key = (pressure, temperature, self.params.version)
         try:
-            self.S = self.method.entropy(self.pressure, self.temperature, self.V, self.params)
-        except (KeyError, NotImplementedError):
-            self.S = float('nan')
-        try:
-            self.H = self.method.enthalpy(self.pressure, self.temperature, self.V, self.params)
-        except (KeyError, NotImplementedError):
-            self.H = float('nan')
+            hash(key)
+        except TypeError:
+            # e.g. arrays of one element, these states are not cached
+            key = None
+        current_key = self.__dict__.get('_state_key')
+        if key is not None and key == current_key:
+            self._state_cache_hits = self.__dict__.get('_state_cache_hits', 0) + 1
+        else:
+            cache = self.__dict__.get('_state_cache')
+            if cache is None:
+                cache = self._state_cache = collections.OrderedDict()
+            values = {}
+            for name in self.lazy_attributes:
+                if name in self.__dict__:
+                    values[name] = self.__dict__.pop(name)
+            if self.warm_start and 'V' in values:
+                self._previous_solution = (self.pressure, self.temperature, values)
+            if current_key is not None and len(values) > 0 and self.state_cache_size > 0:
+                cache.pop(current_key, None)
+                cache[current_key] = values
+                while len(cache) > self.state_cache_size:
+                    cache.popitem(last=False)
+
+            self.pressure = pressure
+            self.temperature = temperature
+            self._state_key = key
+            if key is not None and key in cache:
+                self.__dict__.update(cache.pop(key))
+                self._state_cache_hits = self.__dict__.get('_state_cache_hits', 0) + 1
+            else:
+                self._state_cache_misses = self.__dict__.get('_state_cache_misses', 0) + 1
+
+        if properties is not None:
+            self.compute_properties(properties)
+
+    def set_warm_start(self, warm_start):
+        """
+        Switch warm started volume solves on or off.  With warm starts, the
+        volume solve for a new state starts from the volume of the previous
+        state, extrapolated with the bulk modulus and thermal expansivity,
+        with a tight bracket around it.  For the closely spaced states of a
+        profile this needs one or two Newton steps per state instead of a
+        search from V_0.  Equations of state that do not solve for the volume
+        ignore this.
+        """
+        self.warm_start = warm_start
+        self._previous_solution = None
+
+    def clear_state_cache(self):
+        """
+        Forget the properties computed at all states, including the current
+        one, and reset the hit and miss counts of the state cache.
+        """
+        for name in self.lazy_attributes:
+            self.__dict__.pop(name, None)
+        self._state_cache = collections.OrderedDict()
+        self._state_key = None
+        self._state_cache_hits = 0
+        self._state_cache_misses = 0
+
+    def state_cache_info(self):
+        """
+        Returns a dictionary with the number of hits and misses of the state
+        cache (calls of :func:`set_state` that did or did not find the state
+        in the cache), its current size and maximum size.
+        """
+        return {'hits': self.__dict__.get('_state_cache_hits', 0),
+                'misses': self.__dict__.get('_state_cache_misses', 0),
+                'size': len(self.__dict__.get('_state_cache') or ()),
+                'max_size': self.state_cache_size}
+
+    def compute_properties(self, properties):
+        """
+        Compute the given properties (see :func:`set_state`) at the current
+        state, unless they are cached already. All missing properties are
+        requested from the equation of state in one go, so that it can share
+        intermediate results between them; everything it returns is cached.
+        Gibbs and Helmholtz free energy, entropy and enthalpy are nan if the
+        equation of state does not calculate them, or if the mineral params
+        do not have the requisite entries.
+        """
+        names = [name for name in eos.equation_of_state.requested_properties(properties) if name not in self.__dict__]
+        if len(names) == 0:
+            return
+
+        shared = None
+        if _shared_states and self.__dict__.get('_state_key') is not None:
+            key = (self.pressure, self.temperature, self.method, _shared_states[-1].params.number(self.params))
+            shared = _shared_states[-1].states.setdefault(key, {})
+            for (name, value) in shared.items():
+                self.__dict__.setdefault(name, value)
+            names = [name for name in names if name not in self.__dict__]
+            if len(names) == 0:
+                _shared_states[-1].hits += 1
+                return
+            _shared_states[-1].misses += 1
+
+        if 'V' not in self.__dict__:
+            previous = self.__dict__.get('_previous_solution') if self.warm_start else None
+            if previous is None:
+                self.V = self.method.volume(self.pressure, self.temperature, self.params)
+            else:
+                # extrapolate the volume of the previous state with dV = -V/K_T dP + alpha V dT
+                pressure, temperature, values = previous
+                K = values.get('K_T', values.get('K_S'))
+                if K is None:
+                    guess = values['V']
+                else:
+                    guess = values['V']*(1. - (self.pressure - pressure)/K
+                                         + values.get('alpha', 0.)*(self.temperature - temperature))
+                width = 2.*abs(guess/values['V'] - 1.) + 1.e-3
+                self.V = self.method.volume_from_guess(self.pressure, self.temperature, self.params, guess, width)
+
+        values = self.method.properties(self.pressure, self.temperature, self.V, self.params, names)
+        for (name, value) in values.items():
+            self.__dict__.setdefault(name, value)
+        if shared is not None:
+            for name in self.lazy_attributes:
+                if name in self.__dict__:
+                    shared.setdefault(name, self.__dict__[name])
+
+    def evaluate(self, pressures, temperatures, properties='all'):
+        """
+        Compute properties for arrays of pressures [Pa] and temperatures [K]
+        at once.  properties is as for :func:`set_state`.  Returns a
+        dictionary of arrays in the broadcast shape of pressures and
+        temperatures.  Minerals that are fully described by their equation
+        of state are evaluated with
+        :func:`burnman.eos.EquationOfState.evaluate` in one go, without
+        changing their state; other minerals (that override
+        :func:`set_state` or :func:`compute_properties`) are set to each
+        state in turn, so they are left at the last one.
+        """
+        P, T = eos.equation_of_state.broadcast_state(pressures, temperatures)
+        names = eos.equation_of_state.requested_properties(properties)
+        if type(self).set_state.__func__ is Mineral.set_state.__func__ and \
+                type(self).compute_properties.__func__ is Mineral.compute_properties.__func__ and self.method is not None:
+            result = self.method.evaluate(P, T, self.params)
+            return dict((name, np.asarray(result[name], dtype=float)) for name in names)
+
+        values = dict((name, np.empty(P.shape)) for name in names)
+        for idx in np.ndindex(P.shape):
+            self.set_state(P[idx], T[idx], names)
+            for name in names:
+                values[name][idx] = getattr(self, name)
+        return values
+
+    def __getattr__(self, name):
+        # only called if name is not found otherwise, i.e. for properties
+        # that have not been computed yet at the current state
+        if name in self.lazy_attributes and self.__dict__.get('pressure') is not None:
+            self.compute_properties([name])
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'" + self.__class__.__name__ + "' object has no attribute '" + name + "'")
 
 
     # The following gibbs function avoids having to calculate a bunch of unnecessary parameters over P-T space. This will be useful for gibbs minimisation.
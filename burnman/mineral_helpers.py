@@ -65,9 +65,13 @@ class HelperSolidSolution(Mineral):
             mat.set_method(method)
         self.method = self.endmembers[0].method
 
-    def set_state(self, pressure, temperature):
+    def set_warm_start(self, warm_start):
         for mat in self.endmembers:
-            mat.set_state(pressure, temperature)
+            mat.set_warm_start(warm_start)
+
+    def set_state(self, pressure, temperature, properties=None):
+        for mat in self.endmembers:
+            mat.set_state(pressure, temperature, properties)
 
         itrange = range(0, len(self.endmembers))
         self.params = {}
@@ -78,7 +82,7 @@ class HelperSolidSolution(Mineral):
                 #if there is a type error, it is probably a string. Just go with the value of the first endmembers.
                 self.params[prop] = self.endmembers[0].params[prop]
 
-        Mineral.set_state(self,pressure,temperature)
+        Mineral.set_state(self,pressure,temperature,properties)
 
 class HelperSpinTransition(Material):
     """
@@ -107,13 +111,17 @@ class HelperSpinTransition(Material):
         self.ls_mat.set_method(method)
         self.hs_mat.set_method(method)
 
-    def set_state(self, pressure, temperature):
+    def set_warm_start(self, warm_start):
+        self.ls_mat.set_warm_start(warm_start)
+        self.hs_mat.set_warm_start(warm_start)
+
+    def set_state(self, pressure, temperature, properties=None):
         if (pressure >= self.transition_pressure):
             self.active_mat = self.ls_mat
         else:
             self.active_mat = self.hs_mat
         Material.set_state(self, pressure, temperature)
-        self.active_mat.set_state(pressure, temperature)
+        self.active_mat.set_state(pressure, temperature, properties)
 
     def unroll(self):
         """ return (fractions, minerals) where both are arrays. May depend on current state """
@@ -159,12 +167,12 @@ class HelperFeDependent(Material):
     def iron_number(self):
         return self.iron_number_with_pt(self.pressure, self.temperature)[self.which_index]
 
-    def set_state(self, pressure, temperature):
+    def set_state(self, pressure, temperature, properties=None):
         Material.set_state(self, pressure, temperature)
         self.endmembers = self.create_inner_material(self.iron_number())
         if self.method:
             self.endmembers.set_method(self.method)
-        self.endmembers.set_state(pressure, temperature)
+        self.endmembers.set_state(pressure, temperature, properties)
 
     def unroll(self):
         """ return (fractions, minerals) where both are arrays. May depend on current state """
@@ -15,24 +15,52 @@ Mineral database
   - :mod:`~burnman.minerals.HP_2011_fluids`
   - :mod:`~burnman.minerals.HHPH_2013`
   - :mod:`~burnman.minerals.other`
+
+The modules are large, so they are only imported when they are first used
+(e.g. with ``burnman.minerals.SLB_2011.periclase()``).  The endmembers of
+SLB_2011, HP_2011_ds62 and HHPH_2013 can be searched with
+:mod:`~burnman.minerals.catalogue` without importing these modules.
+"""
+
+import sys as _sys
+import types as _types
+
 """
+The modules of the mineral database.
+"""
+submodules = [# Stixrude and Lithgow-Bertelloni
+              'SLB_2011', 'SLB_2011_ZSB_2013', 'SLB_2005',
+              # Murakami and coworkers
+              'Murakami_etal_2012', 'Murakami_2013',
+              # Matas and coworkers
+              'Matas_etal_2007',
+              # Holland, Powell and coworkers
+              'HP_2011_ds62', 'HP_2011_fluids', 'HHPH_2013',
+              # Other
+              'other']
+
+__all__ = list(submodules)
+
 
-# Stixrude and Lithgow-Bertelloni
-import SLB_2011
-import SLB_2011_ZSB_2013
-import SLB_2005
+class _LazyModule(_types.ModuleType):
+    """
+    This package, with the modules of the database imported on first
+    access to them.  The methods only use the attributes of the package,
+    as python 2 clears the globals of this (replaced) module.
+    """
 
-# Murakami and coworkers
-import Murakami_etal_2012
-import Murakami_2013
+    def __getattr__(self, name):
+        if name in self.submodules or name == 'catalogue':
+            # importing sets the attribute, so that this is only called once
+            __import__(self.__name__ + '.' + name)
+            return self.__dict__[name]
+        raise AttributeError("'module' object has no attribute '" + name + "'")
 
-# Matas and coworkers
-import Matas_etal_2007
+    def __dir__(self):
+        return list(self.submodules)
 
-# Holland, Powell and coworkers
-import HP_2011_ds62
-import HP_2011_fluids
-import HHPH_2013
 
-# Other
-import other
+_module = _LazyModule(__name__)
+_module.__dict__.update((key, value) for (key, value) in globals().items()
+                        if key not in ('_sys', '_types', '_module'))
+_sys.modules[__name__] = _module
@@ -0,0 +1,242 @@
+# BurnMan - a lower mantle toolkit
+# Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
+# Released under GPL v2 or later.
+
+import json
+import pkgutil
+
+from burnman.mineral import Mineral
+from burnman.processchemistry import read_masses, dictionarize_formula, formula_mass
+
+"""
+Catalogue of the endmembers of the large mineral databases.  The endmembers
+are stored in one data file per database (in data/input_endmember_datasets,
+written by the scripts in data/input_raw_endmember_datasets), with their
+formulas already parsed and their molar masses already computed.  The data
+file of a database is read when it is first used, and the mineral class of
+an endmember is only created when it is asked for, so that the catalogue
+can be searched without importing the databases::
+
+    for entry in burnman.minerals.catalogue.find(elements=['Fe', 'Al']):
+        print entry.dataset, entry.class_name, entry.formula
+
+The classes are the ones of the database modules, that is
+``find(name='py', dataset='HP_2011_ds62')[0].mineral_class()`` is
+:class:`burnman.minerals.HP_2011_ds62.py`.
+"""
+
+"""
+The databases in the catalogue.
+"""
+datasets = ['SLB_2011', 'HP_2011_ds62', 'HHPH_2013']
+
+# the entries of the databases (in the order of the data files), the entries
+# by dataset and class name, and the mineral classes that have been created
+_entries = {}
+_index = {}
+_classes = {}
+
+
+class CatalogueEntry(object):
+    """
+    An endmember of the catalogue.  The attributes are
+
+    - dataset: the name of the database (and of its module in
+      :mod:`burnman.minerals`)
+    - class_name: the name of the mineral class in the module
+    - name: the name in the params of the mineral
+    - formula: a dictionary of the numbers of atoms of the elements
+    - equation_of_state: the equation of state in the params
+    - molar_mass: the molar mass [kg/mol]
+    - params: the params of the mineral, without formula, n and molar_mass
+    - uncertainties: the uncertainties of the params, or None
+    - shared_params: the validated params of the first mineral of this
+      entry, of which the following minerals get a
+      :func:`burnman.eos.parameters.Parameters.shared_copy`, or None
+    """
+
+    def __init__(self, dataset, data):
+        self.dataset = dataset
+        self.class_name = data['class']
+        self.formula = data['formula']
+        self.molar_mass = data['molar_mass']
+        self.params = data['params']
+        self.uncertainties = data.get('uncertainties')
+        self.name = self.params['name']
+        self.equation_of_state = self.params['equation_of_state']
+        self.shared_params = None
+
+    def __repr__(self):
+        return "<CatalogueEntry " + self.dataset + "." + self.class_name + ">"
+
+    @property
+    def elements(self):
+        """
+        The set of the elements in the formula.
+        """
+        return set(self.formula)
+
+    def make_params(self):
+        """
+        Return a new params dictionary for a mineral of this entry.  The
+        values that are lists are copied, so that the minerals do not
+        share them.
+        """
+        params = dict((key, list(value) if isinstance(value, list) else value)
+                      for key, value in self.params.items())
+        params['formula'] = dict(self.formula)
+        params['n'] = sum(self.formula.values())
+        params['molar_mass'] = self.molar_mass
+        return params
+
+    def mineral_class(self):
+        """
+        Return the mineral class of this entry.
+        """
+        return mineral_class(self.dataset, self.class_name)
+
+
+def _decode(pairs):
+    # the json module returns unicode strings, but class names and the
+    # strings in params are str
+    return dict((str(key), str(value) if isinstance(value, unicode) else value)
+                for key, value in pairs)
+
+
+def entries(dataset):
+    """
+    Return the list of the entries of a database, which is read on the first
+    call.  The list must not be modified.
+    """
+    if dataset not in _entries:
+        if dataset not in datasets:
+            raise ValueError("unknown dataset '" + dataset + "', the datasets are " + ", ".join(datasets))
+        datastream = pkgutil.get_data('burnman', 'data/input_endmember_datasets/' + dataset + '.json')
+        data = json.loads(datastream, object_pairs_hook=_decode)
+        _entries[dataset] = [CatalogueEntry(dataset, endmember) for endmember in data['endmembers']]
+        for entry in _entries[dataset]:
+            _index[(dataset, entry.class_name)] = entry
+    return _entries[dataset]
+
+
+def find(name=None, formula=None, elements=None, equation_of_state=None, dataset=None):
+    """
+    Search the catalogue.  All of the given criteria have to match.
+
+    Parameters
+    ----------
+    name : string
+        The class name or the name in the params (not case sensitive).
+    formula : string or dictionary
+        The formula, as a string like 'Mg2SiO4' or as a dictionary.
+    elements : list of strings
+        Elements that have to be in the formula (others may be too).
+    equation_of_state : string
+        The name of the equation of state, e.g. 'slb3'.
+    dataset : string or list of strings
+        The databases to search, all of them by default.
+
+    Returns
+    -------
+    entries : list of :class:`CatalogueEntry`
+        The matching entries, in the order of :data:`datasets` and of the
+        data files.
+    """
+    if dataset is None:
+        dataset = datasets
+    elif isinstance(dataset, basestring):
+        dataset = [dataset]
+    if name is not None:
+        name = name.lower()
+    if isinstance(formula, basestring):
+        formula = dictionarize_formula(formula)
+    if elements is not None:
+        elements = set(elements)
+
+    found = []
+    for d in dataset:
+        for entry in entries(d):
+            if name is not None and name != entry.class_name.lower() and name != entry.name.lower():
+                continue
+            if formula is not None and formula != entry.formula:
+                continue
+            if elements is not None and not elements.issubset(entry.formula):
+                continue
+            if equation_of_state is not None and equation_of_state != entry.equation_of_state:
+                continue
+            found.append(entry)
+    return found
+
+
+def _make_class(entry):
+    def __init__(self):
+        if entry.shared_params is None:
+            self.params = entry.make_params()
+        else:
+            self.params = entry.shared_params.shared_copy()
+        if entry.uncertainties is not None:
+            self.uncertainties = dict(entry.uncertainties)
+        Mineral.__init__(self)
+        if entry.shared_params is None:
+            entry.shared_params = self.params.shared_copy()
+
+    return type(entry.class_name, (Mineral,),
+                {'__init__': __init__,
+                 '__module__': 'burnman.minerals.' + entry.dataset,
+                 '__doc__': entry.name + " from " + entry.dataset + "."})
+
+
+def mineral_class(dataset, class_name):
+    """
+    Return the mineral class of an endmember of a database, which is created
+    on the first call.
+    """
+    key = (dataset, class_name)
+    if key not in _classes:
+        entries(dataset)
+        if key not in _index:
+            raise KeyError("no endmember '" + class_name + "' in " + dataset)
+        _classes[key] = _make_class(_index[key])
+    return _classes[key]
+
+
+def mineral_classes(dataset):
+    """
+    Return a dictionary of all the mineral classes of a database, with the
+    class names as keys.
+    """
+    return dict((entry.class_name, mineral_class(dataset, entry.class_name))
+                for entry in entries(dataset))
+
+
+def write_dataset(filename, dataset, endmembers):
+    """
+    Write the data file of a database.  This is used by the scripts that
+    convert the original tables.
+
+    Parameters
+    ----------
+    filename : string
+        The file to write.
+    dataset : string
+        The name of the database.
+    endmembers : list of tuples
+        For each endmember, the class name, the formula as a string, the
+        params (without formula, n and molar_mass) and the uncertainties
+        (or None).
+    """
+    atomic_masses = read_masses()
+    lines = []
+    for class_name, formula, params, uncertainties in endmembers:
+        formula = dictionarize_formula(formula)
+        data = {'class': class_name,
+                'formula': formula,
+                'molar_mass': formula_mass(formula, atomic_masses),
+                'params': params}
+        if uncertainties is not None:
+            data['uncertainties'] = uncertainties
+        lines.append(json.dumps(data, sort_keys=True))
+    with open(filename, 'w') as f:
+        f.write('{"dataset": "' + dataset + '", "endmembers": [\n')
+        f.write(',\n'.join(lines))
+        f.write('\n]}\n')
@@ -5,6 +5,7 @@
 import numpy as np
 from material import Material
 from averaging_schemes import AveragingScheme
+from tools import map_in_chunks
 
 
 class Model(object):
@@ -17,8 +18,15 @@ class Model(object):
 
     all computations are done automatically and lazily
 
+    with warm_start, the volume solves at each point start from the solution at the
+    previous point (see :func:`burnman.Mineral.set_warm_start`)
+
+    with n_workers or executor, the points are evaluated in chunks in parallel
+    processes (see :func:`burnman.tools.map_in_chunks`), which gives the same
+    results as the serial evaluation
+
     """
-    def __init__(self, rock, p, T, avgscheme):
+    def __init__(self, rock, p, T, avgscheme, warm_start=False, n_workers=None, executor=None):
         assert(len(p) == len(T))
         assert(len(p) > 0)
         assert(isinstance(rock, Material))
@@ -28,6 +36,9 @@ class Model(object):
         self.p = p
         self.T = T
         self.avgscheme = avgscheme
+        self.warm_start = warm_start
+        self.n_workers = n_workers
+        self.executor = executor
 
         self.moduli = None
         self.mat_rho = None
@@ -93,22 +104,10 @@ class Model(object):
         Internal function to compute the moduli if necessary.
         """
         if self.moduli is None:
-                self.moduli = [[] for p in self.p]
-
-                for idx in range(len(self.p)):
-                    self.rock.set_state(self.p[idx], self.T[idx])
-                    (fractions, minerals) = self.rock.unroll()
-                    for (fraction, mineral) in zip(fractions, minerals):
-                        e = {}
-                        e['fraction'] = fraction
-                        e['V'] = fraction * mineral.molar_volume()
-                        e['K'] = mineral.adiabatic_bulk_modulus()
-                        e['G'] = mineral.shear_modulus()
-                        e['rho'] = mineral.molar_mass() / mineral.molar_volume()
-                        e['alpha'] = mineral.thermal_expansivity()
-                        e['c_v'] = mineral.heat_capacity_v()
-                        e['c_p'] = mineral.heat_capacity_p()
-                        self.moduli[idx].append(e)
+            self.moduli = []
+            for chunk in map_in_chunks(_phase_properties, self.rock, self.p, self.T, self.warm_start,
+                                       self.n_workers, self.executor):
+                self.moduli.extend(chunk)
 
     def avg_moduli_(self):
         """
@@ -166,3 +165,34 @@ class Model(object):
                 self.mat_vs[i] = np.sqrt( self.mat_G[i] / self.mat_rho[i])
                 self.mat_vp[i] = np.sqrt( (self.mat_K[i] + 4./3.*self.mat_G[i]) / self.mat_rho[i])
                 self.mat_vphi[i] = np.sqrt(self.mat_K[i] / self.mat_rho[i])
+
+
+def _phase_properties(rock, p, T, warm_start):
+    """
+    Compute the properties of the phases of the rock at the points, as a list
+    (for the points) of lists (for the phases) of dictionaries.  This is done
+    by :func:`Model.calc_moduli_`, possibly in chunks in parallel processes.
+    """
+    moduli = [[] for i in p]
+
+    if warm_start:
+        rock.set_warm_start(True)
+    try:
+        for idx in range(len(p)):
+            rock.set_state(p[idx], T[idx])
+            (fractions, minerals) = rock.unroll_arrays()
+            for (fraction, mineral) in zip(fractions, minerals):
+                e = {}
+                e['fraction'] = fraction
+                e['V'] = fraction * mineral.molar_volume()
+                e['K'] = mineral.adiabatic_bulk_modulus()
+                e['G'] = mineral.shear_modulus()
+                e['rho'] = mineral.molar_mass() / mineral.molar_volume()
+                e['alpha'] = mineral.thermal_expansivity()
+                e['c_v'] = mineral.heat_capacity_v()
+                e['c_p'] = mineral.heat_capacity_p()
+                moduli[idx].append(e)
+    finally:
+        if warm_start:
+            rock.set_warm_start(False)
+    return moduli
@@ -11,11 +11,18 @@ import numpy as np
 from fractions import Fraction
 import pkgutil
 
+# the table of atomic masses, read on the first call of read_masses()
+_atomic_masses = None
+
 def read_masses(): 
     """
     A simple function to read a file with a two column list of 
-    elements and their masses into a dictionary
+    elements and their masses into a dictionary.  The file is only read
+    once, all calls return the same dictionary, which must not be modified.
     """
+    global _atomic_masses
+    if _atomic_masses is not None:
+        return _atomic_masses
     datastream = pkgutil.get_data('burnman', 'data/input_masses/atomic_masses.dat')
     datalines = [ line.strip() for line in datastream.split('\n') if line.strip() ]
     lookup=dict()
@@ -23,13 +30,22 @@ def read_masses():
         data="%".join(line.split("%")[:1]).split()
         if data != []:
             lookup[data[0]]=float(data[1])
+    _atomic_masses = lookup
     return lookup
 
+# the parsed formulas, by formula string
+_formulas = {}
+
 def dictionarize_formula(formula):
     """
     A function to read a chemical formula string and 
-    convert it into a dictionary
+    convert it into a dictionary.  The parsed formulas are
+    cached, every call returns a new dictionary.
     """
+    try:
+        return dict(_formulas[formula])
+    except KeyError:
+        pass
     f=dict()
     elements=re.findall('[A-Z][^A-Z]*',formula)
     for element in elements:
@@ -41,7 +57,8 @@ def dictionarize_formula(formula):
             element_atoms=Fraction(element_atoms[0])
         f[element_name]=f.get(element_name, 0.0) + element_atoms
 
-    return f
+    _formulas[formula] = f
+    return dict(f)
 
 def formula_mass(formula, atomic_masses):
     """
@@ -228,7 +228,8 @@ class SeismicRadiusTable(Seismic1DModel):
         return self._lookup(depth, self.table_density)
 
     def depth(self, pressure):
-        if pressure > max(self.table_pressure) or pressure < min(self.table_pressure)  :
+        pressure = np.asarray(pressure)
+        if np.any(pressure > self.table_pressure[0]) or np.any(pressure < self.table_pressure[-1]):
            raise ValueError, "Pressure outside range of PREM"
         radius = np.interp(pressure, self.table_pressure[::-1], self.table_radius[::-1] )
         return self.earth_radius - radius
@@ -241,9 +242,22 @@ class PREM(SeismicRadiusTable):
     """
     Reads  PREM (1s) (input_seismic/prem_table.txt, :cite:`dziewonski1981`).
     See also :class:`burnman.seismic.SeismicRadiusTable`.
+    The tables are read when they are first used.
     """
     def __init__(self):
-        SeismicRadiusTable.__init__(self)
+        # the empty tables of SeismicRadiusTable would hide __getattr__
+        Seismic1DModel.__init__(self)
+        self.earth_radius = 6371.0e3
+
+    def __getattr__(self, name):
+        # only called for missing attributes, i.e. before the tables are read
+        if name.startswith('table_'):
+            self.__read_tables()
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'" + self.__class__.__name__ + "' object has no attribute '" + name + "'")
+
+    def __read_tables(self):
         table = tools.read_table("input_seismic/prem_table.txt") # radius, pressure, density, v_p, v_s
         table = np.array(table)
         self.table_radius = table[:,0]
@@ -372,7 +386,8 @@ def attenuation_correction(v_p,v_s,v_phi,Qs,Qphi):
 
 """
 shared variable of prem, so that other routines do not need to create
-prem over and over. See geotherm for example.
+prem over and over. See geotherm for example.  The tables of the model
+are read when it is first used.
 """
 prem_model = PREM()
 
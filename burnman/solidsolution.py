@@ -5,6 +5,7 @@
 import numpy as np
 
 from burnman import Mineral
+import burnman.eos.equation_of_state as eos
 from solutionmodel import SolutionModel
 from solutionmodel import kd
 
@@ -27,6 +28,12 @@ class SolidSolution(Mineral):
     and P derivatives in J/K/mol and m^3/mol.
     """
 
+    # attributes that are computed on first access after set_state()
+    # the excess and partial properties are computed together with V or gibbs
+    excess_property_groups = {'excess_volume': 'V', 'excess_partial_gibbs': 'gibbs', 'excess_gibbs': 'gibbs',
+                              'partial_gibbs': 'gibbs', 'excess_enthalpy': 'gibbs', 'excess_entropy': 'gibbs'}
+    lazy_attributes = eos.property_names + excess_property_groups.keys()
+
     def __init__(self, endmembers, solution_model=SolutionModel()):
         """
         Set up matrices to speed up calculations for when P, T, X is defined.
@@ -65,12 +72,18 @@ class SolidSolution(Mineral):
         assert(sum(molar_fraction) > 0.9999)
         assert(sum(molar_fraction) < 1.0001)
         self.molar_fraction = molar_fraction 
+        for name in self.lazy_attributes:
+            self.__dict__.pop(name, None)
 
     def set_method(self, method):
         for i in range(self.n_endmembers):
             self.endmembers[i][0].set_method(method)
         self.method = self.endmembers[0][0].method
 
+    def set_warm_start(self, warm_start):
+        for i in range(self.n_endmembers):
+            self.endmembers[i][0].set_warm_start(warm_start)
+
     def molar_mass(self):
         """
         Returns molar mass of the mineral [kg/mol]
@@ -78,45 +91,127 @@ class SolidSolution(Mineral):
         molar_mass = sum([ self.endmembers[i][0].molar_mass()*self.molar_fraction[i] for i in range(self.n_endmembers) ])
         return molar_mass
 
-    def set_state(self, pressure, temperature):
+    def set_state(self, pressure, temperature, properties=None):
+        """
+        Update the solid solution to the given pressure [Pa] and temperature [K].
+        As for :func:`burnman.Mineral.set_state`, the properties of the
+        solution are computed on first access, unless they are requested
+        right away with properties.
+        """
         self.pressure=pressure
         self.temperature=temperature
         # Set the state of all the endmembers
         for i in range(self.n_endmembers):
             self.endmembers[i][0].set_state(pressure, temperature)
 
-        self.excess_partial_gibbs = self.solution_model.excess_partial_gibbs_free_energies( pressure, temperature, self.molar_fraction)
-        self.excess_gibbs = self.solution_model.excess_gibbs_free_energy( pressure, temperature, self.molar_fraction)
-        self.partial_gibbs = np.array([self.endmembers[i][0].gibbs for i in range(self.n_endmembers)]) + self.excess_partial_gibbs
-        self.gibbs= sum([ self.endmembers[i][0].gibbs * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_gibbs
-
-        self.excess_enthalpy = self.solution_model.excess_enthalpy( pressure, temperature, self.molar_fraction)
-        self.excess_entropy = self.solution_model.excess_entropy( pressure, temperature, self.molar_fraction)
-        self.excess_volume = self.solution_model.excess_volume( pressure, temperature, self.molar_fraction)
-
-        self.H = sum([ self.endmembers[i][0].H * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_enthalpy
-        self.S = sum([ self.endmembers[i][0].S * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_entropy
-        self.V = sum([ self.endmembers[i][0].V * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_volume
-        self.C_p = sum([ self.endmembers[i][0].C_p * self.molar_fraction[i] for i in range(self.n_endmembers) ])
-        self.alpha = (1./self.V) * sum([ self.endmembers[i][0].alpha * self.endmembers[i][0].V * self.molar_fraction[i] for i in range(self.n_endmembers) ])
-        self.K_T = self.V * 1./(sum([ self.endmembers[i][0].V / (self.endmembers[i][0].K_T)  * self.molar_fraction[i] for i in range(self.n_endmembers) ]))
- 
-        G_list = [ self.endmembers[i][0].G for i in range(self.n_endmembers) ]
-        if 0.0 in G_list:
-            self.G = 0.0
-        else:
-            self.G = self.V * 1./(sum([ self.endmembers[i][0].V / (self.endmembers[i][0].G)  * self.molar_fraction[i] for i in range(self.n_endmembers) ]))
-
-        # Derived properties
-        self.C_v = self.C_p - self.V*temperature*self.alpha*self.alpha*self.K_T
-
-        # C_v and C_p -> 0 as T -> 0
-        if temperature<1e-10:
-            self.K_S = self.K_T
-            self.gr = float('nan')
-        else:
-            self.K_S = self.K_T*self.C_p/self.C_v
-            self.gr = self.alpha*self.K_T*self.V/self.C_v     
+        for name in self.lazy_attributes:
+            self.__dict__.pop(name, None)
+
+        if properties is not None:
+            self.compute_properties(properties)
+
+    def compute_properties(self, properties):
+        """
+        Compute the given properties (see :func:`burnman.Mineral.set_state`)
+        of the solution at the current state. The volume, the thermodynamic
+        properties (including the excess and partial gibbs free energies) and
+        the elastic properties are computed as groups, and each group only
+        asks the endmembers for the properties it needs.
+        """
+        if not isinstance(properties, basestring):
+            properties = [self.excess_property_groups.get(name, name) for name in properties]
+        names = eos.requested_properties(properties)
+        pressure = self.pressure
+        temperature = self.temperature
+
+        if 'V' not in self.__dict__:
+            self.excess_volume = self.solution_model.excess_volume( pressure, temperature, self.molar_fraction)
+            self.V = sum([ self.endmembers[i][0].V * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_volume
+
+        if any(name in names and name not in self.__dict__ for name in eos.thermodynamic_property_names):
+            self.excess_partial_gibbs = self.solution_model.excess_partial_gibbs_free_energies( pressure, temperature, self.molar_fraction)
+            self.excess_gibbs = self.solution_model.excess_gibbs_free_energy( pressure, temperature, self.molar_fraction)
+            self.partial_gibbs = np.array([self.endmembers[i][0].gibbs for i in range(self.n_endmembers)]) + self.excess_partial_gibbs
+            self.gibbs= sum([ self.endmembers[i][0].gibbs * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_gibbs
+
+            self.excess_enthalpy = self.solution_model.excess_enthalpy( pressure, temperature, self.molar_fraction)
+            self.excess_entropy = self.solution_model.excess_entropy( pressure, temperature, self.molar_fraction)
+
+            self.H = sum([ self.endmembers[i][0].H * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_enthalpy
+            self.S = sum([ self.endmembers[i][0].S * self.molar_fraction[i] for i in range(self.n_endmembers) ]) + self.excess_entropy
+            # the Helmholtz free energy is not computed for solutions
+            self.helmholtz = float('nan')
+
+        if any(name in names and name not in self.__dict__ for name in eos.elastic_property_names):
+            self.C_p = sum([ self.endmembers[i][0].C_p * self.molar_fraction[i] for i in range(self.n_endmembers) ])
+            self.alpha = (1./self.V) * sum([ self.endmembers[i][0].alpha * self.endmembers[i][0].V * self.molar_fraction[i] for i in range(self.n_endmembers) ])
+            self.K_T = self.V * 1./(sum([ self.endmembers[i][0].V / (self.endmembers[i][0].K_T)  * self.molar_fraction[i] for i in range(self.n_endmembers) ]))
+
+            G_list = [ self.endmembers[i][0].G for i in range(self.n_endmembers) ]
+            if 0.0 in G_list:
+                self.G = 0.0
+            else:
+                self.G = self.V * 1./(sum([ self.endmembers[i][0].V / (self.endmembers[i][0].G)  * self.molar_fraction[i] for i in range(self.n_endmembers) ]))
+
+            # Derived properties
+            self.C_v = self.C_p - self.V*temperature*self.alpha*self.alpha*self.K_T
+
+            # C_v and C_p -> 0 as T -> 0
+            if temperature<1e-10:
+                self.K_S = self.K_T
+                self.gr = float('nan')
+            else:
+                self.K_S = self.K_T*self.C_p/self.C_v
+                self.gr = self.alpha*self.K_T*self.V/self.C_v
+
+    def evaluate(self, pressures, temperatures, properties='all'):
+        """
+        Compute properties of the solution for arrays of pressures [Pa] and
+        temperatures [K] at once, see :func:`burnman.Mineral.evaluate`.
+        The endmembers are evaluated with their evaluate(), the excess
+        properties of the solution model point by point.  The Helmholtz
+        free energy is not computed for solutions and is nan.
+        """
+        P, T = eos.broadcast_state(pressures, temperatures)
+        names = eos.requested_properties(properties)
+        thermodynamic = any(name in names for name in eos.thermodynamic_property_names)
+        elastic = any(name in names and name != 'V' for name in eos.elastic_property_names)
+        endmember_names = ['V'] + (['gibbs', 'H', 'S'] if thermodynamic else []) + \
+            (['C_p', 'alpha', 'K_T', 'G'] if elastic else [])
+        x = self.molar_fraction
+        endmembers = [mineral.evaluate(P, T, endmember_names) for (mineral, formula) in self.endmembers]
+
+        def mix(name):
+            return sum(endmembers[i][name] * x[i] for i in range(self.n_endmembers))
+
+        def excess(function):
+            return np.array([function(P[idx], T[idx], x) for idx in np.ndindex(P.shape)], dtype=float).reshape(P.shape)
+
+        values = {}
+        values['V'] = mix('V') + excess(self.solution_model.excess_volume)
+        if thermodynamic:
+            values['gibbs'] = mix('gibbs') + excess(self.solution_model.excess_gibbs_free_energy)
+            values['H'] = mix('H') + excess(self.solution_model.excess_enthalpy)
+            values['S'] = mix('S') + excess(self.solution_model.excess_entropy)
+            values['helmholtz'] = np.nan*P
+        if elastic:
+            V = values['V']
+            values['C_p'] = mix('C_p')
+            values['alpha'] = (1./V) * sum(endmembers[i]['alpha'] * endmembers[i]['V'] * x[i] for i in range(self.n_endmembers))
+            values['K_T'] = V * 1./sum(endmembers[i]['V'] / endmembers[i]['K_T'] * x[i] for i in range(self.n_endmembers))
+            zero_G = np.any([endmembers[i]['G'] == 0.0 for i in range(self.n_endmembers)], axis=0)
+            with np.errstate(divide='ignore'):
+                values['G'] = np.where(zero_G, 0.0, V * 1./sum(endmembers[i]['V'] / endmembers[i]['G'] * x[i]
+                                                               for i in range(self.n_endmembers)))
+
+            # Derived properties
+            values['C_v'] = values['C_p'] - V*T*values['alpha']*values['alpha']*values['K_T']
+
+            # C_v and C_p -> 0 as T -> 0
+            cold = T < 1e-10
+            values['K_S'] = np.where(cold, values['K_T'], values['K_T']*values['C_p']/values['C_v'])
+            values['gr'] = np.where(cold, np.nan, values['alpha']*values['K_T']*V/values['C_v'])
+        return dict((name, values[name]) for name in names)
 
     def calcgibbs(self, pressure, temperature, molar_fraction): 
         return sum([ self.endmembers[i][0].calcgibbs(pressure, temperature) * molar_fraction[i] for i in range(self.n_endmembers) ]) + self.solution_model.excess_gibbs_free_energy( pressure, temperature, molar_fraction)
@@ -0,0 +1,240 @@
+# BurnMan - a lower mantle toolkit
+# Copyright (C) 2012, 2013, Heister, T., Unterborn, C., Rose, I. and Cottaar, S.
+# Released under GPL v2 or later.
+
+import warnings
+
+import numpy as np
+from scipy.interpolate import RectBivariateSpline
+
+from burnman.mineral import Mineral
+import burnman.eos as eos
+
+"""
+A surrogate for a mineral that interpolates its properties from a table
+computed once on a pressure-temperature grid.
+"""
+
+
+"""
+Properties that are tabulated by :class:`TabulatedMineral`.  The other
+properties of :data:`burnman.eos.equation_of_state.property_names` are
+derived from these.
+"""
+tabulated_property_names = ['V', 'K_S', 'K_T', 'G', 'alpha', 'C_p', 'gibbs', 'S']
+
+# tabulated properties needed by the derived ones
+_derived_property_dependencies = {'C_v': ['V', 'K_T', 'alpha', 'C_p'],
+                                  'gr': ['V', 'K_T', 'alpha', 'C_p'],
+                                  'helmholtz': ['V', 'gibbs'],
+                                  'H': ['gibbs', 'S']}
+
+
+class TabulatedMineral(Mineral):
+    """
+    Wraps a :class:`burnman.Mineral` and answers set_state() by bicubic
+    spline interpolation of its properties (see
+    :data:`tabulated_property_names`) on a pressure-temperature grid,
+    which is much cheaper than solving the equation of state.  The splines
+    are twice continuously differentiable, so derivatives of the properties
+    (as used for adiabats) are smooth.  C_v, gr, helmholtz and H are derived
+    from the interpolated properties.
+
+    Each property has its own spline, so the interpolated properties are
+    only as consistent with each other as the interpolation errors allow:
+    the derivatives of the gibbs spline differ from the V and S splines by
+    about the relative error of the table.  With consistent=True, V and S
+    are the derivatives of the gibbs spline instead (V = dG/dP and
+    S = -dG/dT), which are exactly consistent, but less accurate than
+    their own splines on the same grid.
+
+    The table is a snapshot of the mineral: it is not updated if the
+    params of the mineral change.  States outside of the grid raise a
+    ValueError.
+
+    This class is available as :class:`burnman.TabulatedMineral`.
+    """
+
+    def __init__(self, mineral, pressures, temperatures, rtol=None, max_refinements=4, consistent=False):
+        """
+        Tabulate the properties of mineral.
+
+        Parameters
+        ----------
+        mineral : :class:`burnman.Mineral`
+            The mineral to tabulate.
+        pressures : array of floats
+            Increasing pressures [Pa] of the grid, at least 4.
+        temperatures : array of floats
+            Increasing temperatures [K] of the grid, at least 4.
+        rtol : float
+            If given, the grid is refined (by inserting midpoints of the
+            intervals with the largest errors) until the relative error of
+            all tabulated properties at the centres of the grid cells is
+            below rtol, or until max_refinements refinements have been done
+            (with a warning if rtol is not met then).
+        max_refinements : int
+            Maximum number of refinements of the grid.
+        consistent : bool
+            Whether V and S are the derivatives of the gibbs spline.
+        """
+        self.mineral = mineral
+        self.params = {'name': mineral.to_string(), 'molar_mass': mineral.params.get('molar_mass', float('nan'))}
+        self.method = getattr(mineral, 'method', None)
+        self.consistent = consistent
+
+        pressures = np.array(pressures, dtype=float)
+        temperatures = np.array(temperatures, dtype=float)
+        values = self.__evaluate_mineral(pressures, temperatures)
+        self.__set_table(pressures, temperatures, values)
+
+        self.max_error = float('nan')
+        if rtol is not None:
+            for i in range(max_refinements + 1):
+                P_mid = 0.5*(pressures[1:] + pressures[:-1])
+                T_mid = 0.5*(temperatures[1:] + temperatures[:-1])
+                exact = self.__evaluate_mineral(P_mid, T_mid)
+                interpolated = self.evaluate(*np.meshgrid(P_mid, T_mid, indexing='ij'),
+                                             properties=tabulated_property_names)
+                error = np.zeros((len(P_mid), len(T_mid)))
+                for (name, value) in exact.items():
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        e = np.abs(interpolated[name]/value - 1.)
+                    error = np.fmax(error, e)
+                self.max_error = np.max(error)
+                if self.max_error <= rtol:
+                    break
+                if i == max_refinements:
+                    warnings.warn("the table of " + self.params['name'] + " has a relative error of " +
+                                  str(self.max_error) + " after " + str(max_refinements) +
+                                  " refinements, more than rtol=" + str(rtol))
+                    break
+
+                bad = error > rtol
+                pressures = np.sort(np.concatenate([pressures, P_mid[np.any(bad, axis=1)]]))
+                temperatures = np.sort(np.concatenate([temperatures, T_mid[np.any(bad, axis=0)]]))
+                values = self.__evaluate_mineral(pressures, temperatures)
+                self.__set_table(pressures, temperatures, values)
+
+    def __evaluate_mineral(self, pressures, temperatures):
+        """
+        Compute the tabulated properties of the mineral on the grid
+        pressures x temperatures, returning a dictionary of 2D arrays.
+        """
+        P, T = np.meshgrid(pressures, temperatures, indexing='ij')
+        values = self.mineral.evaluate(P, T, tabulated_property_names)
+        return dict((name, values[name]) for name in tabulated_property_names)
+
+    def __set_table(self, pressures, temperatures, values):
+        if len(pressures) < 4 or len(temperatures) < 4:
+            raise ValueError("the grid needs at least 4 pressures and 4 temperatures")
+        self.pressures = pressures
+        self.temperatures = temperatures
+        self.table = values
+        self.splines = dict((name, RectBivariateSpline(pressures, temperatures, values[name]))
+                            for name in tabulated_property_names)
+
+    def to_string(self):
+        """
+        Returns the name of the tabulated mineral
+        """
+        return "'TabulatedMineral(" + self.params['name'] + ")'"
+
+    def set_method(self, method):
+        """
+        The properties of a tabulated mineral come from its tables, so the
+        method cannot be changed.  This does nothing, and warns if the
+        requested method is not the one the tables were computed with.
+        """
+        if method is None or self.method is None:
+            return
+        new_method = eos.create(method)
+        if type(new_method) is not type(self.method):
+            warnings.warn('Warning, the tables of ' + self.to_string() + ' were computed with the method ' +
+                          self.method.__class__.__name__ + ', they are not changed to ' +
+                          new_method.__class__.__name__ + '.', stacklevel=2)
+
+    def set_state(self, pressure, temperature, properties=None):
+        """
+        Update the material to the given pressure [Pa] and temperature [K].
+        As for :func:`burnman.Mineral.set_state`, the properties are
+        interpolated on first access, unless they are requested right away
+        with properties.
+        """
+        if pressure < self.pressures[0] or pressure > self.pressures[-1] or \
+                temperature < self.temperatures[0] or temperature > self.temperatures[-1]:
+            raise ValueError("state outside of the tabulated range")
+        self.pressure = pressure
+        self.temperature = temperature
+        for name in self.lazy_attributes:
+            self.__dict__.pop(name, None)
+        if properties is not None:
+            self.compute_properties(properties)
+
+    def compute_properties(self, properties):
+        """
+        Interpolate the given properties (see :func:`burnman.Mineral.set_state`)
+        at the current state, unless they are cached already.
+        """
+        names = [name for name in eos.equation_of_state.requested_properties(properties) if name not in self.__dict__]
+        values = self.evaluate(self.pressure, self.temperature, names)
+        for (name, value) in values.items():
+            self.__dict__.setdefault(name, float(value))
+
+    def evaluate(self, pressures, temperatures, properties='all'):
+        """
+        Interpolate properties for arrays of pressures [Pa] and
+        temperatures [K] at once, which is the fastest way to use the table.
+        properties is as for :func:`burnman.Mineral.set_state`.  Returns a
+        dictionary of arrays in the broadcast shape of pressures and
+        temperatures.  Points outside of the grid are not checked.
+        """
+        P, T = eos.equation_of_state.broadcast_state(pressures, temperatures)
+        names = eos.equation_of_state.requested_properties(properties)
+        needed = set(name for name in names if name in tabulated_property_names)
+        for name in names:
+            needed.update(_derived_property_dependencies.get(name, []))
+
+        derivatives = {}
+        if self.consistent:
+            derivatives = {'V': (1, 0, 1.), 'S': (0, 1, -1.)}
+        values = dict((name, self.splines[name].ev(P.ravel(), T.ravel()).reshape(P.shape))
+                      for name in needed if name not in derivatives)
+        for (name, (dP, dT, sign)) in derivatives.items():
+            if name in needed:
+                values[name] = sign*self.splines['gibbs'].ev(P.ravel(), T.ravel(), dx=dP, dy=dT).reshape(P.shape)
+        if 'C_v' in names or 'gr' in names:
+            C_v = values['C_p'] - values['V']*T*values['alpha']*values['alpha']*values['K_T']
+            values['C_v'] = C_v
+            values['gr'] = values['alpha']*values['K_T']*values['V']/C_v
+        if 'helmholtz' in names:
+            values['helmholtz'] = values['gibbs'] - P*values['V']
+        if 'H' in names:
+            values['H'] = values['gibbs'] + T*values['S']
+        return dict((name, values[name]) for name in names)
+
+    def save(self, filename):
+        """
+        Save the table to filename (a numpy .npz file), see :func:`load`.
+        """
+        np.savez(filename, name=self.params['name'], molar_mass=self.params['molar_mass'],
+                 pressures=self.pressures, temperatures=self.temperatures, max_error=self.max_error,
+                 consistent=self.consistent,
+                 **dict(('table_' + name, self.table[name]) for name in tabulated_property_names))
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load a table saved with :func:`save`.  The returned mineral only
+        knows the name and molar mass of the mineral that was tabulated.
+        """
+        data = np.load(filename)
+        self = cls.__new__(cls)
+        self.mineral = None
+        self.method = None
+        self.params = {'name': str(data['name']), 'molar_mass': float(data['molar_mass'])}
+        self.max_error = float(data['max_error'])
+        self.consistent = bool(data['consistent']) if 'consistent' in data.files else False
+        self.__set_table(data['pressures'], data['temperatures'],
+                         dict((name, data['table_' + name]) for name in tabulated_property_names))
+        return self
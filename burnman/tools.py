@@ -6,6 +6,7 @@ import operator
 import bisect
 import os
 import pkgutil
+import multiprocessing
 import numpy as np
 import constants
 
@@ -93,3 +94,68 @@ def molar_volume_from_unit_cell_volume(unit_cell_v, z):
     """
     return  unit_cell_v*constants.Avogadro/1e30/z
 
+
+def _evaluate_chunk(task):
+    # runs in the worker processes, which unpickle their own copy of the rock
+    function, rock, pressures, temperatures, warm_start = task
+    return function(rock, pressures, temperatures, warm_start)
+
+
+def map_in_chunks(function, rock, pressures, temperatures, warm_start=False, n_workers=None, executor=None):
+    """
+    Evaluate function(rock, pressures, temperatures, warm_start) for the
+    points of a profile in parallel processes.  The points are split into
+    n_workers contiguous chunks, each chunk is evaluated by a worker with
+    its own pickled copy of the rock, and the results of the chunks are
+    returned in the order of the points.
+
+    The chunks only depend on the number of points and of workers, and
+    every point is evaluated like in the serial loop, so the results are
+    the same as those of the serial evaluation.  With warm_start, each
+    chunk starts cold at its first point, which may change the results in
+    the last digits (as does warm starting itself).
+
+    Parameters
+    ----------
+    function : function
+        A function of the module level (so that it can be pickled), that
+        evaluates a rock at a list of points.
+    rock : :class:`burnman.Material`
+        The rock, which has to be picklable.
+    pressures, temperatures : lists of floats
+        The points. :math:`[Pa]`, :math:`[K]`
+    warm_start : bool
+        Passed on to function.
+    n_workers : int
+        The number of chunks, and of processes of the pool if no executor
+        is given.  By default (None), or with one worker and no executor,
+        function is called in this process for all the points at once.
+    executor : object
+        A pool of processes with a map method that returns the results in
+        order, like :class:`multiprocessing.Pool` or an executor of
+        :mod:`concurrent.futures`.  It is not shut down.  Without
+        n_workers, the points are split into one chunk per CPU.
+
+    Returns
+    -------
+    results : list
+        The results of function for the chunks, in order.
+    """
+    if executor is None and (n_workers is None or n_workers <= 1):
+        return [function(rock, pressures, temperatures, warm_start)]
+
+    if n_workers is None:
+        n_workers = multiprocessing.cpu_count()
+    n_chunks = max(1, min(n_workers, len(pressures)))
+    bounds = np.linspace(0, len(pressures), n_chunks + 1).astype(int)
+    tasks = [(function, rock, pressures[bounds[i]:bounds[i+1]], temperatures[bounds[i]:bounds[i+1]], warm_start)
+             for i in range(n_chunks)]
+
+    if executor is not None:
+        return list(executor.map(_evaluate_chunk, tasks))
+    pool = multiprocessing.Pool(n_workers)
+    try:
+        return pool.map(_evaluate_chunk, tasks)
+    finally:
+        pool.close()
+        pool.join()
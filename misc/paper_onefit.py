@@ -86,11 +86,14 @@ def array_to_rock(arr, names):
     for (fraction,phase) in rock.children:
         if isinstance(phase, HelperSolidSolution):
             for min in phase.endmembers:
-                for key in min.params:
-                    if key != 'equation_of_state' and key != 'F_0':
-                        assert(names[idx]==min.to_string()+'.'+key)
-                        min.params[key] = arr[idx]
-                        idx += 1
+                # the names are in the order of the params when the fits
+                # were made, so the keys are looked up by name
+                keys = [key for key in min.params if key != 'equation_of_state' and key != 'F_0']
+                for i in range(len(keys)):
+                    key = names[idx][len(min.to_string()+'.'):]
+                    assert(names[idx]==min.to_string()+'.'+key and key in keys)
+                    min.params[key] = arr[idx]
+                    idx += 1
         else:
             raise Exception, "unknown type"
     return rock, anchor_t
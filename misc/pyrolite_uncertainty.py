@@ -231,13 +231,14 @@ if whattodo=="plotgood":
     figsize=(8,6)
     figure=plt.figure(dpi=150,figsize=figsize)
 
-    for fit in goodfits:
+    # the adiabats of all fits are integrated together
+    rocks, anchor_ts = zip(*[array_to_rock(fit, names) for fit in goodfits])
+    temperatures = burnman.geotherm.adiabatic_ensemble(pressure, anchor_ts, list(rocks))
+
+    for (fit, rock, temperature) in zip(goodfits, rocks, temperatures):
         print fit
         print names
 
-        rock, anchor_t = array_to_rock(fit, names)
-        temperature = burnman.geotherm.adiabatic(pressure, anchor_t, rock)
-
         rho, vp, vs, vphi, K, G = \
             burnman.velocities_from_rock(rock, pressure, temperature, burnman.averaging_schemes.HashinShtrikmanAverage())
 
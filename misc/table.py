@@ -55,6 +55,9 @@ if __name__ == "__main__":
                         except:
                             print "Could not create '%s'" % name
 
+            if len(phasenames) == 0:
+                continue
+
             eos=phasenames[0][1].params['equation_of_state']
             if eos == 'hp_tmt':
                 params = ['V_0','K_0','Kprime_0','Kdprime_0','molar_mass','n','Cp']
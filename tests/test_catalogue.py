@@ -0,0 +1,64 @@
+import unittest
+import os, sys
+sys.path.insert(1,os.path.abspath('..'))
+
+import burnman
+from burnman import minerals
+from burnman.minerals import catalogue
+from util import BurnManTest
+
+
+class test_catalogue(BurnManTest):
+
+    def test_find(self):
+        found = catalogue.find(elements=['Fe', 'Al'])
+        self.assertTrue(len(found) > 0)
+        for entry in found:
+            self.assertTrue(set(['Fe', 'Al']).issubset(entry.elements))
+        names = [(entry.dataset, entry.class_name) for entry in found]
+        self.assertTrue(('SLB_2011', 'almandine') in names)
+        self.assertTrue(('HP_2011_ds62', 'alm') in names)
+        self.assertFalse(('SLB_2011', 'pyrope') in names)
+
+        found = catalogue.find(formula='Mg2SiO4', equation_of_state='hp_tmt')
+        self.assertEqual(sorted((e.dataset, e.class_name) for e in found),
+                         [('HHPH_2013', 'fo'), ('HHPH_2013', 'mrw'), ('HHPH_2013', 'mscf'), ('HHPH_2013', 'mwd'),
+                          ('HP_2011_ds62', 'fo'), ('HP_2011_ds62', 'mrw'), ('HP_2011_ds62', 'mwd')])
+        self.assertEqual(catalogue.find(name='Periclase', dataset='SLB_2011')[0].class_name, 'periclase')
+        self.assertEqual(catalogue.find(name='andalusite')[0].name, 'and')
+        self.assertEqual(catalogue.find(elements=['Fe'], equation_of_state='slb3', dataset='HHPH_2013'), [])
+        self.assertRaises(ValueError, catalogue.find, dataset='SLB_2012')
+
+    def test_classes(self):
+        entry = catalogue.find(name='py', dataset='HP_2011_ds62')[0]
+        self.assertTrue(entry.mineral_class() is minerals.HP_2011_ds62.py)
+        self.assertTrue(minerals.SLB_2011.pe is minerals.SLB_2011.periclase)
+        self.assertEqual(minerals.SLB_2011.periclase.__module__, 'burnman.minerals.SLB_2011')
+
+        pe = minerals.SLB_2011.periclase()
+        self.assertEqual(pe.params['name'], 'Periclase')
+        self.assertEqual(pe.params['formula'], {'Mg': 1.0, 'O': 1.0})
+        self.assertEqual(pe.params['n'], 2.0)
+        self.assertFloatEqual(pe.params['molar_mass'], 0.0403044)
+        self.assertEqual(pe.uncertainties['err_K_0'], 3.e9)
+
+        # the minerals do not share their params
+        fo1 = minerals.HP_2011_ds62.fo()
+        fo2 = minerals.HP_2011_ds62.fo()
+        fo1.params['Cp'][0] = 0.
+        fo1.params['formula']['Mg'] = 0.
+        self.assertEqual(fo2.params['Cp'][0], 233.3)
+        self.assertEqual(fo2.params['formula']['Mg'], 2.0)
+        self.assertFalse(hasattr(fo2, 'uncertainties'))
+
+        self.assertRaises(KeyError, catalogue.mineral_class, 'SLB_2011', 'unobtainium')
+
+    def test_formula_cache(self):
+        formula = burnman.processchemistry.dictionarize_formula('Mg2SiO4')
+        self.assertEqual(formula, {'Mg': 2.0, 'Si': 1.0, 'O': 4.0})
+        formula['Mg'] = 0.
+        self.assertEqual(burnman.processchemistry.dictionarize_formula('Mg2SiO4')['Mg'], 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import os, sys
 sys.path.insert(1,os.path.abspath('..'))
 import warnings
+import numpy as np
 
 import burnman
 from burnman import minerals
@@ -50,6 +51,48 @@ class composite(BurnManTest):
         #c.set_method("slb2")
         #c.set_state(5e9,300)
 
+    def test_unroll_cache(self):
+        min1 = minerals.SLB_2011.periclase()
+        min2 = minerals.SLB_2011.wuestite()
+        spin = minerals.Murakami_etal_2012.fe_periclase()
+        inner = burnman.Composite( [0.5, 0.5], [min1, spin] )
+        c = burnman.Composite( [0.2, 0.8], [min2, inner] )
+        c.set_state(5e9, 300)
+        (f, m) = c.unroll()
+        cached = c._unrolled
+        self.assertArraysAlmostEqual(f, [0.2, 0.4, 0.4])
+        self.assertArraysAlmostEqual(cached.fraction_array, [0.2, 0.4, 0.4])
+        self.assertTrue(m[2] is spin.hs_mat)
+        (f_array, m_list) = c.unroll_arrays()
+        self.assertTrue(f_array is cached.fraction_array and m_list is cached.minerals)
+        self.assertFalse(f_array.flags.writeable)
+        (f_array, m_list) = min1.unroll_arrays()
+        self.assertArraysAlmostEqual(f_array, [1.0])
+
+        # nothing changed
+        m.append(min1)
+        c.set_state(6e9, 300)
+        (f, m) = c.unroll()
+        self.assertTrue(c._unrolled is cached)
+        self.assertEqual(len(m), 3)
+
+        # the spin transition switches
+        c.set_state(80e9, 300)
+        (f, m) = c.unroll()
+        self.assertFalse(c._unrolled is cached)
+        self.assertTrue(m[2] is spin.ls_mat)
+        cached = c._unrolled
+
+        # the children of a child change
+        inner.children[0] = (0.5, min2)
+        (f, m) = c.unroll()
+        self.assertFalse(c._unrolled is cached)
+        self.assertTrue(m[1] is min2)
+        c.children = [(1.0, min1)]
+        (f, m) = c.unroll()
+        self.assertEqual(f, [1.0])
+        self.assertEqual(m, [min1])
+
     def test_changevalues(self):
         class mycomposite(burnman.Material):
             def unroll(self):
@@ -118,6 +161,25 @@ class composite(BurnManTest):
         assert(d2 == 5275)
         assert(dmix == 4744)
 
+    def test_property_sets(self):
+        rock = burnman.Composite( [0.5, 0.5], [minerals.SLB_2011.periclase(), minerals.SLB_2011.stishovite()] )
+        rock.set_state(40.e9, 2000., 'elastic')
+        (fractions, phases) = rock.unroll()
+        for phase in phases:
+            for name in burnman.eos.equation_of_state.property_names:
+                self.assertEqual(name in phase.__dict__, name in burnman.eos.equation_of_state.elastic_property_names)
+
+    def test_warm_start(self):
+        rock = burnman.Composite([0.8, 0.2], [minerals.SLB_2011.mg_perovskite(), minerals.SLB_2011.periclase()])
+        pressures = np.linspace(30.e9, 120.e9, 20)
+        temperatures = burnman.geotherm.brown_shankland(pressures)
+        cold = burnman.velocities_from_rock(rock, pressures, temperatures)
+        rock = burnman.Composite([0.8, 0.2], [minerals.SLB_2011.mg_perovskite(), minerals.SLB_2011.periclase()])
+        warm = burnman.velocities_from_rock(rock, pressures, temperatures, warm_start=True)
+        for (a, b) in zip(cold, warm):
+            self.assertArraysAlmostEqual(a, b)
+        self.assertFalse(rock.children[0][1].warm_start)
+
     def test_summing_bigger(self):
         min1 = minerals.SLB_2005.periclase()
         with warnings.catch_warnings(record=True) as w:
@@ -149,6 +211,39 @@ class composite(BurnManTest):
         self.assertArraysAlmostEqual(f, [0.8, 0.2, 0.0])
         self.assertTrue(f[2]>=0.0)
 
+    def shared_states_rocks(self):
+        rocks = []
+        for fraction in [0.8, 0.6]:
+            pv = minerals.SLB_2011.mg_fe_perovskite()
+            pv.set_composition([0.9, 0.1, 0.0])
+            rock = burnman.Composite([fraction, 1.-fraction], [pv, minerals.SLB_2005.periclase()])
+            rock.set_method('slb3')
+            rocks.append(rock)
+        return rocks
+
+    def test_shared_states(self):
+        p = [40.e9, 80.e9]
+        T = [2000., 2500.]
+        reference = [burnman.velocities_from_rock(rock, p, T) for rock in self.shared_states_rocks()]
+        with burnman.SharedStates() as shared:
+            results = [burnman.velocities_from_rock(rock, p, T) for rock in self.shared_states_rocks()]
+        # the endmembers of the second perovskite and the second periclase
+        # (equal params, but other objects) are not evaluated again
+        self.assertEqual(shared.info()['misses'], 8)
+        self.assertEqual(shared.info()['hits'], 8)
+        for (a, b) in zip(reference, results):
+            for (x, y) in zip(a, b):
+                self.assertArraysAlmostEqual(x, y)
+
+        # minerals with modified params do not share
+        per1 = minerals.SLB_2005.periclase()
+        per2 = minerals.SLB_2005.periclase()
+        per2.params['V_0'] *= 1.01
+        with burnman.SharedStates() as shared:
+            for per in [per1, per2]:
+                per.set_state(40.e9, 2000.)
+            self.assertNotEqual(per1.molar_volume(), per2.molar_volume())
+        self.assertEqual(shared.info()['hits'], 0)
 
 if __name__ == '__main__':
     unittest.main()
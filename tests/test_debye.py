@@ -3,6 +3,7 @@ import os, sys
 
 sys.path.insert(1, os.path.abspath('..'))
 import warnings
+import numpy as np
 
 import burnman
 from burnman import minerals
@@ -59,5 +60,39 @@ class Debye(BurnManTest):
         test_thermal_energy = burnman.debye.thermal_energy(x,rock.params['Debye_0'],rock.params['n'])
         self.assertFloatEqual(test_thermal_energy,0.)
 
+    def test_thermal_properties(self):
+        rock = mypericlase()
+        for T in [0., 300., 2000.]:
+            properties = burnman.debye.thermal_properties(T, rock.params['Debye_0'], rock.params['n'])
+            expected = [f(T, rock.params['Debye_0'], rock.params['n']) for f in
+                        [burnman.debye.thermal_energy, burnman.debye.heat_capacity_v,
+                         burnman.debye.helmholtz_free_energy, burnman.debye.entropy]]
+            self.assertArraysAlmostEqual(properties, expected)
+
+    def test_arrays(self):
+        rock = mypericlase()
+        T = np.array([0., 1e-16, 10., 300., 2000., 5000.])
+        debye_T = np.array([773., 773., 773., 100., 1000., 773.])
+        functions = [burnman.debye.thermal_energy, burnman.debye.heat_capacity_v,
+                     burnman.debye.helmholtz_free_energy, burnman.debye.entropy]
+        properties = burnman.debye.thermal_properties(T, debye_T, rock.params['n'])
+        for (function, values) in zip(functions, properties):
+            expected = [function(t, d, rock.params['n']) for (t, d) in zip(T, debye_T)]
+            self.assertArraysAlmostEqual(function(T, debye_T, rock.params['n']), expected)
+            self.assertArraysAlmostEqual(values, expected)
+
+        x = np.array([1.e-10, 0.5, 4., 10., 30., 35.5, 100.])
+        self.assertArraysAlmostEqual(burnman.debye.debye_fn_array(x), [burnman.debye.debye_fn_cheb(v) for v in x])
+        self.assertRaises(ValueError, burnman.debye.debye_fn_array, np.array([1., -1.]))
+
+    def test_tabulated(self):
+        x = np.linspace(1.e-3, 50., 10001)
+        exact = burnman.debye.debye_fn_array(x)
+        tabulated = burnman.debye.debye_fn_array(x, tabulated=True)
+        self.assertTrue(np.max(np.abs(tabulated/exact - 1.)) < 1.e-11)
+        T = np.array([0., 300., 2000.])
+        self.assertArraysAlmostEqual(burnman.debye.entropy(T, 773., 2, tabulated=True),
+                                     burnman.debye.entropy(T, 773., 2))
+
 if __name__ == '__main__':
     unittest.main()
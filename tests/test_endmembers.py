@@ -69,5 +69,64 @@ class test_endmembers(BurnManTest):
         K2=fo.K_T
         self.assertArraysAlmostEqual([K1], [K2])
 
+    def test_property_sets(self):
+        fo=forsterite()
+        fo.set_state(1.e9, 1000., 'elastic')
+        self.assertTrue('K_S' in fo.__dict__)
+        self.assertFalse('gibbs' in fo.__dict__)
+        K_S=fo.K_S
+        fo.set_state(1.e9, 1000., ['G', 'S'])
+        self.assertFalse('gibbs' in fo.__dict__)
+        fo.set_state(2.e9, 1000., 'thermodynamic')
+        self.assertFalse('K_S' in fo.__dict__)
+        self.assertTrue('gibbs' in fo.__dict__)
+        self.assertRaises(ValueError, fo.set_state, 1.e9, 1000., 'everything')
+        self.assertRaises(ValueError, fo.set_state, 1.e9, 1000., ['K'])
+
+    def test_lazy_properties(self):
+        fo=forsterite()
+        fo.set_state(1.e9, 1000.)
+        self.assertFalse('K_S' in fo.__dict__)
+        K_S = fo.K_S
+        self.assertTrue('K_S' in fo.__dict__)
+        self.assertFalse('gibbs' in fo.__dict__)
+        self.assertFloatEqual(fo.gibbs, fo.method.gibbs_free_energy(1.e9, 1000., fo.V, fo.params))
+        fo.set_state(10.e9, 1000.)
+        self.assertFalse('K_S' in fo.__dict__)
+        self.assertTrue(fo.K_S > K_S)
+        fo.set_state(1.e9, 1000., 'all')
+        self.assertFloatEqual(fo.K_S, K_S)
+        self.assertRaises(AttributeError, getattr, fo, 'not_a_property')
+
+    def test_state_cache(self):
+        fo=forsterite()
+        fo.set_state(1.e9, 1000.)
+        K_S_1 = fo.K_S
+        fo.set_state(2.e9, 1000.)
+        K_S_2 = fo.K_S
+        fo.set_state(1.e9, 1000.)
+        self.assertTrue('K_S' in fo.__dict__)
+        self.assertEqual(fo.K_S, K_S_1)
+        fo.set_state(2.e9, 1000.)
+        self.assertEqual(fo.K_S, K_S_2)
+        info = fo.state_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size']), (2, 2, 1))
+
+        # modifying the params invalidates the cache
+        fo.params['K_0'] = 1.1*fo.params['K_0']
+        fo.set_state(2.e9, 1000.)
+        self.assertTrue(fo.K_S > K_S_2)
+        fo.set_state(1.e9, 1000.)
+        self.assertTrue(fo.K_S > K_S_1)
+        self.assertEqual(fo.state_cache_info()['misses'], 4)
+
+        fo.state_cache_size = 2
+        for P in [3.e9, 4.e9, 5.e9, 6.e9]:
+            fo.set_state(P, 1000.)
+            fo.V
+        self.assertEqual(fo.state_cache_info()['size'], 2)
+        fo.clear_state_cache()
+        self.assertEqual(fo.state_cache_info(), {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 2})
+
 if __name__ == '__main__':
     unittest.main()
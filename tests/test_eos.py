@@ -3,6 +3,8 @@ import os, sys
 
 sys.path.insert(1, os.path.abspath('..'))
 import warnings
+import numpy as np
+import pickle
 
 import burnman
 from burnman import minerals
@@ -72,6 +74,268 @@ class eos(BurnManTest):
 
 
 
+class forsterite(burnman.Mineral):
+    """
+    Holland and Powell (2011)
+    """
+
+    def __init__(self):
+        self.params = {
+            'equation_of_state': 'hp_tmt',
+            'H_0': -2172590.0,
+            'S_0': 95.1,
+            'V_0': 4.366e-05,
+            'Cp': [233.3, 0.001494, -603800.0, -1869.7],
+            'a_0': 2.85e-05,
+            'K_0': 1.285e+11,
+            'Kprime_0': 3.84,
+            'Kdprime_0': -3e-11,
+            'n': 7.,
+            'molar_mass': .1406931}
+
+
+class test_eos_evaluate(BurnManTest):
+    pressures = [1.e5, 10.e9, 25.e9, 60.e9]
+    temperatures = [300., 1000., 1500., 2500.]
+
+    def check_against_scalar(self, eos, params):
+        result = eos.evaluate(self.pressures, self.temperatures, params)
+        expected = burnman.eos.EquationOfState.evaluate(eos, self.pressures, self.temperatures, params)
+        for name in burnman.eos.equation_of_state.property_names:
+            self.assertEqual(result[name].shape, (len(self.pressures),))
+            if np.all(np.isnan(expected[name])):
+                self.assertTrue(np.all(np.isnan(result[name])))
+            else:
+                self.assertArraysAlmostEqual(result[name], expected[name])
+
+    def test_debye_eoses(self):
+        params = mypericlase().params
+        burnman.eos.SLB3().validate_parameters(params)
+        for eos in [burnman.eos.SLB2(), burnman.eos.SLB3(), burnman.eos.MGD2(), burnman.eos.MGD3(),
+                    burnman.eos.BM2(), burnman.eos.BM3()]:
+            self.check_against_scalar(eos, params)
+
+    def test_hp_eoses(self):
+        params = forsterite().params
+        burnman.eos.HP_TMT().validate_parameters(params)
+        for eos in [burnman.eos.HP_TMT(), burnman.eos.MT()]:
+            self.check_against_scalar(eos, params)
+
+    def test_hp_disorder(self):
+        # the Landau (lrn) and Bragg-Williams (sill) terms against the scalar functions
+        eos = burnman.eos.HP_TMT()
+        for mineral in [minerals.HP_2011_ds62.lrn(), minerals.HP_2011_ds62.sill()]:
+            result = eos.evaluate(self.pressures, self.temperatures, mineral.params)
+            for (i, (P, T)) in enumerate(zip(self.pressures, self.temperatures)):
+                V = eos.volume(P, T, mineral.params)
+                expected = burnman.eos.EquationOfState.properties(eos, P, T, V, mineral.params)
+                for name in ['V', 'gr', 'K_T', 'K_S', 'C_v', 'C_p', 'alpha', 'gibbs', 'S', 'H']:
+                    self.assertFloatEqual(result[name][i], expected[name])
+            result = eos.evaluate(10.e9, 1000., mineral.params)
+            self.assertEqual(result['gibbs'].shape, ())
+
+    def test_einstein(self):
+        T = np.array([0., 300., 2000.])
+        E_th = burnman.eos.einstein.thermal_energy(T, 800., 7)
+        C_v = burnman.eos.einstein.heat_capacity_v(T, 800., 7)
+        for i in range(len(T)):
+            self.assertFloatEqual(E_th[i], burnman.eos.einstein.thermal_energy(T[i], 800., 7))
+            self.assertFloatEqual(C_v[i], burnman.eos.einstein.heat_capacity_v(T[i], 800., 7))
+
+    def test_broadcast(self):
+        params = mypericlase().params
+        result = burnman.eos.SLB3().evaluate(np.array([[10.e9, 20.e9]]), 2000., params)
+        self.assertEqual(result['V'].shape, (1, 2))
+        self.assertFloatEqual(result['V'][0, 1], burnman.eos.SLB3().volume(20.e9, 2000., params))
+
+
+class test_eos_properties(BurnManTest):
+    def test_slb_fused(self):
+        params = mypericlase().params
+        burnman.eos.SLB3().validate_parameters(params)
+        params['F_0'] = -569444.6
+        for eos in [burnman.eos.SLB2(), burnman.eos.SLB3()]:
+            for (P, T) in [(1.e5, 300.), (50.e9, 2000.)]:
+                V = eos.volume(P, T, params)
+                result = eos.properties(P, T, V, params)
+                expected = burnman.eos.EquationOfState.properties(eos, P, T, V, params)
+                for name in burnman.eos.equation_of_state.property_names:
+                    self.assertFloatEqual(result[name], expected[name])
+
+    def test_hp_fused(self):
+        # without order-disorder, with a Landau and with a Bragg-Williams term
+        for mineral in [minerals.HP_2011_ds62.fo(), minerals.HP_2011_ds62.lrn(), minerals.HP_2011_ds62.sill()]:
+            eos = burnman.eos.HP_TMT()
+            for (P, T) in [(1.e5, 300.), (10.e9, 1500.)]:
+                V = eos.volume(P, T, mineral.params)
+                result = eos.properties(P, T, V, mineral.params)
+                expected = burnman.eos.EquationOfState.properties(eos, P, T, V, mineral.params)
+                for name in ['V', 'gr', 'K_T', 'K_S', 'C_v', 'C_p', 'alpha', 'gibbs', 'S', 'H']:
+                    self.assertFloatEqual(result[name], expected[name])
+
+    def test_mineral_uses_properties(self):
+        rock = minerals.SLB_2011.periclase()
+        rock.set_state(30.e9, 1500.)
+        result = rock.method.properties(30.e9, 1500., rock.V, rock.params)
+        self.assertFloatEqual(rock.K_S, result['K_S'])
+        self.assertFloatEqual(rock.alpha, result['alpha'])
+
+
+class test_order_disorder(BurnManTest):
+    def test_bragg_williams(self):
+        params = minerals.HP_2011_ds62.sill().params
+        deltaS = burnman.endmemberdisorder.entropydisorder(params['BW_n'])
+        P = np.array([[1.e5, 5.e9, 20.e9], [1.e5, 5.e9, 20.e9]])
+        T = np.array([[300.], [1500.]])
+        Q = burnman.endmemberdisorder.order_parameter_BW(P, T, params)
+        self.assertEqual(Q.shape, (2, 3))
+        self.assertTrue(np.all((Q > 0.) & (Q < 1.)))
+        for idx in np.ndindex(Q.shape):
+            self.assertFloatEqual(float(burnman.endmemberdisorder.order_parameter_BW(P[idx], T[idx[0], 0], params)),
+                                  Q[idx])
+            residual = burnman.endmemberdisorder.equilibrium_Q(Q[idx], deltaS, P[idx], T[idx[0], 0], params)
+            self.assertTrue(abs(residual) < 1.e-3)
+
+        G, S, H = burnman.endmemberdisorder.disorder_BW(P, T, params)
+        self.assertArraysAlmostEqual((H - T*S).ravel(), G.ravel())
+        # the equilibrium state of order minimizes the gibbs energy of disordering
+        for dQ in [-1.e-3, 1.e-3]:
+            G2 = burnman.endmemberdisorder.disorder_BW(P, T, params, np.clip(Q + dQ, 0., 1.-1.e-12))[0]
+            self.assertTrue(np.all(G2 >= G))
+
+
+class test_volume_solver(BurnManTest):
+    pressures = np.array([1.e5, 25.e9, 60.e9, 135.e9])
+    temperatures = np.array([300., 1500., 2000., 3000.])
+
+    def test_volumes(self):
+        params = mypericlase().params
+        burnman.eos.SLB3().validate_parameters(params)
+        for eos in [burnman.eos.SLB3(), burnman.eos.MGD3()]:
+            V, iterations, converged, bracketed = eos.solve_volumes(self.pressures, self.temperatures, params)
+            self.assertTrue(np.all(converged))
+            self.assertTrue(np.all(bracketed))
+            self.assertTrue(np.all(iterations < 10))
+            P = [eos.pressure(T, v, params) for (T, v) in zip(self.temperatures, V)]
+            self.assertArraysAlmostEqual(P, self.pressures)
+            self.assertFloatEqual(V[2], eos.volume(self.pressures[2], self.temperatures[2], params))
+
+    def test_outside_bracket(self):
+        params = mypericlase().params
+        burnman.eos.SLB3().validate_parameters(params)
+        eos = burnman.eos.SLB3()
+        V, iterations, converged, bracketed = eos.solve_volumes([100.e9, 400.e9], 300., params)
+        self.assertTrue(np.all(converged))
+        self.assertEqual(list(bracketed), [True, False])
+        self.assertFloatEqual(eos.pressure(300., V[1], params), 400.e9)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertFloatEqual(eos.volume(400.e9, 300., params), V[1])
+            self.assertEqual(len(w), 1)
+
+    def test_warm_start(self):
+        params = mypericlase().params
+        burnman.eos.SLB3().validate_parameters(params)
+        for eos in [burnman.eos.SLB3(), burnman.eos.MGD3()]:
+            V, iterations, converged, bracketed = eos.solve_volumes(self.pressures, self.temperatures, params)
+            # guesses that are off by 0.1 percent converge in a few steps
+            V2, iterations, converged, bracketed = eos.solve_volumes(self.pressures, self.temperatures, params,
+                                                                     V*1.001, 0.002)
+            self.assertTrue(np.all(converged))
+            self.assertTrue(np.all(bracketed))
+            self.assertTrue(np.all(iterations <= 4))
+            self.assertArraysAlmostEqual(V2, V)
+            self.assertFloatEqual(eos.volume_from_guess(self.pressures[2], self.temperatures[2], params,
+                                                        V[2]*0.99, 1.e-3), V[2])
+        eos = burnman.eos.BM3()
+        self.assertFloatEqual(eos.volume_from_guess(50.e9, 300., params, 9.e-6, 1.e-3),
+                              eos.volume(50.e9, 300., params))
+
+    def test_newton(self):
+        # roots of x^3 - c, one of which is outside of the bracket
+        c = np.array([1., 8., 27., 1000.])
+        func = lambda x, idx: (c[idx] - x*x*x, -3.*x*x)
+        x, iterations, converged, bracketed = burnman.eos.newton.safeguarded_newton(func, 2.*np.ones(4), 0.5, 4.)
+        self.assertArraysAlmostEqual(x, [1., 2., 3., 10.])
+        self.assertTrue(np.all(converged))
+        self.assertEqual(list(bracketed), [True, True, True, False])
+
+
+class test_compiled_parameters(BurnManTest):
+    def test_parameters(self):
+        params = burnman.eos.Parameters(mypericlase().params)
+        version = params.version
+        params['K_0'] = 160.e9
+        self.assertNotEqual(params.version, version)
+        version = params.version
+        params.get('K_0')
+        self.assertEqual(params.version, version)
+        params.update({'K_0': 161.e9})
+        self.assertNotEqual(params.version, version)
+        copied = pickle.loads(pickle.dumps(params))
+        self.assertEqual(copied, params)
+        self.assertEqual(copied.compiled, {})
+
+    def test_shared_copy(self):
+        params = burnman.eos.Parameters(minerals.HP_2011_ds62.fo().params)
+        record = burnman.eos.HP_TMT().compiled_parameters(params)
+        shared = params.shared_copy()
+        self.assertEqual(shared, params)
+        self.assertEqual(shared.version, params.version)
+        self.assertTrue(burnman.eos.HP_TMT().compiled_parameters(shared) is record)
+        self.assertFalse(shared['Cp'] is params['Cp'])
+        self.assertFalse(shared['formula'] is params['formula'])
+
+        # copy on write
+        shared['K_0'] = 1.1*params['K_0']
+        self.assertNotEqual(shared.version, params.version)
+        self.assertFloatEqual(burnman.eos.HP_TMT().compiled_parameters(shared).K_0, 1.1*params['K_0'])
+        self.assertTrue(burnman.eos.HP_TMT().compiled_parameters(params) is record)
+
+        # minerals of the catalogue share the params of the first one
+        fo1 = minerals.HP_2011_ds62.fo()
+        fo2 = minerals.HP_2011_ds62.fo()
+        self.assertEqual(fo1.params.version, fo2.params.version)
+        fo2.params['K_0'] = 1.1*fo1.params['K_0']
+        fo1.set_state(1.e9, 1000.)
+        fo2.set_state(1.e9, 1000.)
+        self.assertTrue(fo2.V > minerals.HP_2011_ds62.fo().method.volume(1.e9, 1000., fo1.params))
+        self.assertFloatEqual(fo1.V, minerals.HP_2011_ds62.fo().method.volume(1.e9, 1000., fo1.params))
+
+    def test_content_index(self):
+        params = [burnman.eos.Parameters(mypericlase().params) for i in range(3)]
+        params[2]['K_0'] = 1.1*params[2]['K_0']
+        self.assertEqual(params[0].fingerprint, params[1].fingerprint)
+        index = burnman.eos.parameters.ContentIndex()
+        numbers = [index.number(p) for p in params]
+        self.assertEqual(numbers[0], numbers[1])
+        self.assertNotEqual(numbers[0], numbers[2])
+
+        # params with the same fingerprint but other contents
+        params[2]._fingerprint = params[0].fingerprint
+        index = burnman.eos.parameters.ContentIndex()
+        self.assertNotEqual(index.number(params[0]), index.number(params[2]))
+
+    def test_records(self):
+        rock = minerals.SLB_2011.periclase()
+        self.assertTrue(isinstance(rock.params, burnman.eos.Parameters))
+        record = rock.method.compiled_parameters(rock.params)
+        self.assertTrue(record is rock.method.compiled_parameters(rock.params))
+        self.assertFloatEqual(record.b_iikk, 9.*rock.params['K_0'])
+
+        V = rock.method.volume(10.e9, 1000., rock.params)
+        rock.params['K_0'] = 1.1*rock.params['K_0']
+        record = rock.method.compiled_parameters(rock.params)
+        self.assertFloatEqual(record.b_iikk, 9.*rock.params['K_0'])
+        self.assertTrue(rock.method.volume(10.e9, 1000., rock.params) > V)
+
+        fo = forsterite()
+        burnman.eos.HP_TMT().validate_parameters(fo.params)
+        record = burnman.eos.HP_TMT().compiled_parameters(fo.params)
+        self.assertArraysAlmostEqual([record.a, record.b, record.c],
+                                     burnman.eos.modified_tait.tait_constants(fo.params))
+
+
 class test_eos_validation(BurnManTest):
     def test_no_shear_error(self):
         #The validation should place nans in for the shear parameters
@@ -107,6 +371,25 @@ class test_eos_validation(BurnManTest):
                 self.fail('Parameter padding failed in validation')
                 pass
 
+    def test_validate_once(self):
+        self.assertTrue(burnman.eos.create('slb3') is burnman.eos.create('slb3'))
+        self.assertFalse(burnman.eos.create('slb3') is burnman.eos.create('slb2'))
+
+        class countingeos(burnman.eos.SLB3):
+            calls = 0
+            def validate_parameters(self, params):
+                countingeos.calls += 1
+                burnman.eos.SLB3.validate_parameters(self, params)
+
+        method = countingeos()
+        per = minerals.SLB_2011.periclase()
+        per.set_method(method)
+        per.set_method(method)
+        self.assertEqual(countingeos.calls, 1)
+        per.params['K_0'] = 162.e9
+        per.set_method(method)
+        self.assertEqual(countingeos.calls, 2)
+
     def test_dumb_parameter_values(self):
 
         class mymineralwithnegativekprime(burnman.Mineral):
@@ -4,6 +4,8 @@ import os, sys
 sys.path.insert(1, os.path.abspath('..'))
 import warnings
 
+import numpy as np
+
 import burnman
 from burnman import minerals
 
@@ -41,6 +43,93 @@ class geotherm(BurnManTest):
         test_K_adiabat = burnman.geotherm.adiabatic(pressure,T0,rock)
         self.assertArraysAlmostEqual(test_K_adiabat,[1500,1650.22034002])
 
+    def test_adiabatic_profile(self):
+        rock = mypericlase()
+        rock.set_method('slb3')
+        pressures = [100.e9, 110.e9, 125.e9, 150.e9]
+        adiabat = burnman.geotherm.adiabatic_profile(pressures, 1500., rock)
+        self.assertArraysAlmostEqual(adiabat.temperatures, burnman.geotherm.adiabatic(pressures, 1500., rock))
+        self.assertArraysAlmostEqual(adiabat.temperatures[[0, 3]], [1500, 1650.22034002])
+        self.assertArraysAlmostEqual(adiabat([105.e9, 140.e9]),
+                                     burnman.geotherm.adiabatic([100.e9, 105.e9, 140.e9], 1500., rock)[1:])
+        # decreasing pressures
+        self.assertArraysAlmostEqual(burnman.geotherm.adiabatic_profile(pressures[::-1], 1650.22034002, rock).temperatures,
+                                     adiabat.temperatures[::-1])
+
+        reference = burnman.velocities_from_rock(rock, pressures, adiabat.temperatures)
+        velocities = burnman.velocities_from_rock(rock, pressures, adiabat.temperatures, moduli=adiabat.moduli)
+        for (a, b) in zip(reference, velocities):
+            self.assertArraysAlmostEqual(a, b)
+
+    def test_adiabatic_profile_failures(self):
+        gradient = lambda T, P: float('nan') if P > 5.e9 else 1.e-8
+        self.assertRaises(ValueError, burnman.geotherm._dormand_prince, gradient, [1.e9, 1.e10], 1900., 1.e-8, 1.e-6)
+        gradient = lambda T, P: 1.e-8*np.sin(P/1.e4)
+        self.assertRaises(Exception, burnman.geotherm._dormand_prince, gradient, [1.e9, 1.e10], 1900., 1.e-8, 1.e-6, 50)
+
+    def test_adiabatic_ensemble(self):
+        rock = mypericlase()
+        rock.set_method('slb3')
+        pressures = [100.e9, 110.e9, 125.e9, 150.e9]
+        temperatures = burnman.geotherm.adiabatic_ensemble(pressures, [1500., 2000.], rock)
+        self.assertEqual(temperatures.shape, (2, 4))
+        self.assertArraysAlmostEqual(temperatures[0, [0, 3]], [1500, 1650.22034002])
+        self.assertArraysAlmostEqual(temperatures[0], burnman.geotherm.adiabatic(pressures, 1500., rock))
+        self.assertArraysAlmostEqual(temperatures[1], burnman.geotherm.adiabatic(pressures, 2000., rock))
+
+        # rocks with the same minerals in different fractions
+        pv = minerals.SLB_2011.mg_fe_perovskite()
+        pv.set_composition([0.9, 0.1, 0.])
+        rocks = [burnman.Composite([f, 1. - f], [pv, minerals.SLB_2011.periclase()]) for f in [0.6, 0.8]]
+        rocks.append(rock)
+        for r in rocks:
+            r.set_method('slb3')
+        temperatures = burnman.geotherm.adiabatic_ensemble(pressures, [1900., 1900., 1700.], rocks)
+        for (T, T0, r) in zip(temperatures, [1900., 1900., 1700.], rocks):
+            self.assertArraysAlmostEqual(T, burnman.geotherm.adiabatic(pressures, T0, r))
+
+    def test_isentrope(self):
+        rock = mypericlase()
+        rock.set_method('slb3')
+        pressures = [100.e9, 110.e9, 125.e9, 150.e9]
+        temperatures = burnman.geotherm.isentrope(pressures, 1500., rock)
+        self.assertArraysAlmostEqual(temperatures, burnman.geotherm.adiabatic(pressures, 1500., rock))
+        rock.set_state(100.e9, 1500.)
+        S = rock.S
+        rock.set_state(150.e9, temperatures[3])
+        self.assertFloatEqual(rock.S, S)
+
+        pv = minerals.SLB_2011.mg_fe_perovskite()
+        pv.set_composition([0.9, 0.1, 0.])
+        rock = burnman.Composite([0.7, 0.3], [pv, minerals.SLB_2011.periclase()])
+        rock.set_method('slb3')
+        self.assertArraysAlmostEqual(burnman.geotherm.isentrope(pressures, 1900., rock),
+                                     burnman.geotherm.adiabatic(pressures, 1900., rock))
+
+    def test_table_geotherms(self):
+        pressures = [50.e9, 100.e9]
+        brown = burnman.geotherm.brown_shankland(pressures)
+        anderson = burnman.geotherm.anderson(pressures)
+        for (temperatures, table) in [(brown, "input_geotherm/brown_81.txt"), (anderson, "input_geotherm/anderson_82.txt")]:
+            depths, table_temperatures = burnman.geotherm._read_table(table)
+            for (P, T) in zip(pressures, temperatures):
+                depth = burnman.seismic.prem_model.depth(P)
+                self.assertFloatEqual(T, burnman.tools.lookup_and_interpolate(depths, table_temperatures, depth))
+        self.assertRaises(ValueError, burnman.geotherm.brown_shankland, [5.e9])
+
+        # an unsorted table
+        geotherm = burnman.geotherm.TableGeotherm([2000.e3, 500.e3, 1000.e3], [2500., 1500., 2000.],
+                                                  extrapolate_top=False)
+        depths = burnman.seismic.prem_model.depth([25.e9, 50.e9, 130.e9])
+        self.assertArraysAlmostEqual(geotherm([25.e9, 50.e9, 130.e9]),
+                                     np.interp(depths, [500.e3, 1000.e3, 2000.e3], [1500., 2000., 2500.]))
+        self.assertRaises(ValueError, geotherm, [5.e9])
+
+    def test_isentrope_without_entropy(self):
+        rock = mypericlase()
+        rock.set_method('bm3')
+        self.assertRaises(ValueError, burnman.geotherm.isentrope, [100.e9, 150.e9], 1500., rock)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import os, sys
 sys.path.insert(1,os.path.abspath('..'))
+import multiprocessing
+import numpy as np
 
 import burnman
 from burnman import minerals
@@ -110,6 +112,27 @@ class test_model(BurnManTest):
         self.assertArraysAlmostEqual(m2.density(), [4619.86433138])
         self.assertArraysAlmostEqual(m12.density(), [4512.8331140])
 
+    def test_parallel(self):
+        rock = burnman.Composite([0.2, 0.8], [min1(), min2()])
+        rock.set_method('slb3')
+        p = np.linspace(30e9, 120e9, 11)
+        T = np.linspace(1800., 2600., 11)
+        serial = burnman.Model(rock, p, T, burnman.averaging_schemes.VoigtReussHill())
+        parallel = burnman.Model(rock, p, T, burnman.averaging_schemes.VoigtReussHill(), n_workers=3)
+        self.assertEqual(list(serial.v_s()), list(parallel.v_s()))
+        self.assertEqual(list(serial.heat_capacity_p()), list(parallel.heat_capacity_p()))
+
+        serial = burnman.velocities_from_rock(rock, p, T)
+        pool = multiprocessing.Pool(2)
+        try:
+            for parallel in [burnman.velocities_from_rock(rock, p, T, n_workers=4),
+                             burnman.velocities_from_rock(rock, p, T, executor=pool)]:
+                for a, b in zip(serial, parallel):
+                    self.assertEqual(list(a), list(b))
+        finally:
+            pool.close()
+            pool.join()
+
 
 
 
@@ -174,12 +174,60 @@ class test_solidsolution(BurnManTest):
         ss_properties=[fo_ss.gibbs, fo_ss.H, fo_ss.S, fo_ss.V, fo_ss.C_p, fo_ss.C_v, fo_ss.alpha, fo_ss.K_T, fo_ss.K_S, fo_ss.gr]
         self.assertArraysAlmostEqual(endmember_properties, ss_properties)
 
+    def test_property_sets(self):
+        fo, fo_ss = self.setup_2min_ss()
+        fo_ss.set_state(1.e9, 1000., 'elastic')
+        self.assertFalse('gibbs' in fo_ss.__dict__)
+        self.assertFalse('gibbs' in fo_ss.endmembers[0][0].__dict__)
+        fo.set_state(1.e9, 1000.)
+        self.assertArraysAlmostEqual([fo_ss.V, fo_ss.K_S, fo_ss.gr], [fo.V, fo.K_S, fo.gr])
+        fo_ss.set_state(1.e9, 1000., 'thermodynamic')
+        self.assertFalse('K_S' in fo_ss.__dict__)
+        self.assertArraysAlmostEqual([fo_ss.V, fo_ss.gibbs, fo_ss.S], [fo.V, fo.gibbs, fo.S])
+
+    def test_lazy_properties(self):
+        fo, fo_ss = self.setup_2min_ss()
+        fo_ss.set_state(1.e9, 1000.)
+        self.assertFalse('V' in fo_ss.__dict__)
+        self.assertArraysAlmostEqual([fo_ss.excess_gibbs], [0.])
+        self.assertFalse('K_S' in fo_ss.__dict__)
+        fo.set_state(1.e9, 1000.)
+        self.assertArraysAlmostEqual([fo_ss.K_S, fo_ss.gibbs], [fo.K_S, fo.gibbs])
+
+    def test_all_properties_cached(self):
+        fo, fo_ss = self.setup_2min_ss()
+        fo_ss.set_state(1.e9, 1000., 'all')
+        self.assertTrue(np.isnan(fo_ss.helmholtz))
+        calls = []
+        excess_entropy = fo_ss.solution_model.excess_entropy
+        def counting_excess_entropy(*args):
+            calls.append(args)
+            return excess_entropy(*args)
+        fo_ss.solution_model.excess_entropy = counting_excess_entropy
+        fo_ss.compute_properties('all')
+        fo_ss.compute_properties('thermodynamic')
+        self.assertEqual(len(calls), 0)
+
     def test_ol_Wh(self):
         ol_ss=olivine_ss()
         H_excess=ol_ss.solution_model.excess_enthalpy(1.e5, 1000., [0.5,0.5])
         Wh=ol_ss.solution_model.Wh[0][1]
         self.assertArraysAlmostEqual([Wh/4.0], [H_excess])
 
+    def test_asymmetric_entropy(self):
+        g = burnman.minerals.HP_2011_ds62.garnet()
+        g.set_composition([0.4, 0.3, 0.2, 0.1])
+        P = 1.e9
+        T = 1000.
+        dT = 1.e-2
+        g.set_state(P, T-dT)
+        G0 = g.gibbs
+        g.set_state(P, T+dT)
+        G1 = g.gibbs
+        g.set_state(P, T)
+        self.assertFloatEqual(g.S, -(G1-G0)/(2.*dT))
+        self.assertFloatEqual(g.gibbs, g.H - T*g.S)
+
     def test_order_disorder(self):
         opx = orthopyroxene()
         opx.set_composition( np.array([0.0, 1.0]) )
@@ -0,0 +1,96 @@
+import unittest
+import os, sys
+import tempfile
+import shutil
+import warnings
+
+sys.path.insert(1, os.path.abspath('..'))
+import numpy as np
+
+import burnman
+from burnman import minerals
+
+from util import BurnManTest
+
+
+class test_tabulated_mineral(BurnManTest):
+    pressures = np.linspace(25.e9, 130.e9, 30)
+    temperatures = np.linspace(1500., 3000., 20)
+
+    def test_interpolation(self):
+        pv = minerals.SLB_2011.mg_perovskite()
+        tab = burnman.TabulatedMineral(pv, self.pressures, self.temperatures)
+        pv.set_state(61.e9, 2111.)
+        tab.set_state(61.e9, 2111.)
+        for name in burnman.eos.equation_of_state.property_names:
+            self.assertFloatEqual(getattr(tab, name), getattr(pv, name))
+        self.assertFloatEqual(tab.density(), pv.density())
+        self.assertRaises(ValueError, tab.set_state, 10.e9, 2000.)
+
+    def test_refinement(self):
+        pv = minerals.SLB_2011.mg_perovskite()
+        tab = burnman.TabulatedMineral(pv, self.pressures[::6], self.temperatures[::4], rtol=1.e-5)
+        self.assertTrue(tab.max_error <= 1.e-5)
+        self.assertTrue(len(tab.pressures) > 5)
+
+    def test_refinement_warning(self):
+        pv = minerals.SLB_2011.mg_perovskite()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            tab = burnman.TabulatedMineral(pv, self.pressures[::6], self.temperatures[::4], rtol=1.e-12,
+                                           max_refinements=1)
+        self.assertTrue(tab.max_error > 1.e-12)
+        self.assertTrue(any('rtol' in str(warning.message) for warning in w))
+
+    def test_consistent(self):
+        pv = minerals.SLB_2011.mg_perovskite()
+        tab = burnman.TabulatedMineral(pv, self.pressures, self.temperatures, consistent=True)
+        P = np.array([61.e9, 100.e9])
+        T = np.array([2111., 2500.])
+        values = tab.evaluate(P, T, ['V', 'S'])
+        gibbs = tab.splines['gibbs']
+        self.assertArraysAlmostEqual(values['V'], gibbs.ev(P, T, dx=1))
+        self.assertArraysAlmostEqual(values['S'], -gibbs.ev(P, T, dy=1))
+        self.assertArraysAlmostEqual(values['V'], pv.evaluate(P, T, ['V'])['V'])
+
+    def test_save_load(self):
+        pv = minerals.SLB_2011.mg_perovskite()
+        tab = burnman.TabulatedMineral(pv, self.pressures, self.temperatures)
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'mg_perovskite.npz')
+            tab.save(filename)
+            loaded = burnman.TabulatedMineral.load(filename)
+        finally:
+            shutil.rmtree(directory)
+        result = loaded.evaluate([30.e9, 100.e9], [2000., 2500.])
+        expected = tab.evaluate([30.e9, 100.e9], [2000., 2500.])
+        for name in burnman.eos.equation_of_state.property_names:
+            self.assertArraysAlmostEqual(result[name], expected[name])
+        self.assertEqual(loaded.molar_mass(), pv.molar_mass())
+
+    def test_composite(self):
+        rock = burnman.Composite([0.5, 0.5], [burnman.TabulatedMineral(minerals.SLB_2011.periclase(), self.pressures,
+                                                                       self.temperatures),
+                                              minerals.SLB_2011.mg_perovskite()])
+        reference = burnman.Composite([0.5, 0.5], [minerals.SLB_2011.periclase(), minerals.SLB_2011.mg_perovskite()])
+        p = np.array([40.e9, 80.e9])
+        T = np.array([2000., 2500.])
+        self.assertArraysAlmostEqual(burnman.velocities_from_rock(rock, p, T)[1],
+                                     burnman.velocities_from_rock(reference, p, T)[1])
+
+    def test_set_method(self):
+        tab = burnman.TabulatedMineral(minerals.SLB_2011.periclase(), self.pressures, self.temperatures)
+        rock = burnman.Composite([0.5, 0.5], [tab, minerals.SLB_2011.mg_perovskite()])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            rock.set_method('slb3')
+            self.assertEqual(len(w), 0)
+            tab.set_method('bm3')
+            self.assertEqual(len(w), 1)
+        tab.set_state(50.e9, 2000.)
+        self.assertTrue(tab.K_S > 0.)
+
+
+if __name__ == '__main__':
+    unittest.main()
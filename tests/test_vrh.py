@@ -44,6 +44,35 @@ class VRH_average(BurnManTest):
         v = avg.voigt_reuss_hill_function([1.0, 2.0],[0.1, 0.2])        
         self.assertFloatEqual(0.15833333333333, v)
 
+    def test_points(self):
+        volumes = [[1.0, 2.0], [0.0, 2.0], [2.0, 2.0]]
+        moduli = [[0.1, 0.2], [0.123, 0.456], [0.456, 0.456]]
+        self.assertArraysAlmostEqual([0.15833333333333, 0.456, 0.456],
+                                     avg.voigt_reuss_hill_function(volumes, moduli))
+
+class Schemes(BurnManTest):
+    def test_points(self):
+        volumes = [[0.2, 0.5, 0.3], [0.6, 0.0, 0.4], [0.3, 0.3, 0.4]]
+        bulk_moduli = [[200.e9, 150.e9, 250.e9], [120.e9, 300.e9, 120.e9], [180.e9, 180.e9, 180.e9]]
+        shear_moduli = [[100.e9, 80.e9, 150.e9], [70.e9, 90.e9, 100.e9], [90.e9, 60.e9, 90.e9]]
+        densities = [[3000., 4000., 5000.], [3300., 3400., 3500.], [4000., 4100., 4200.]]
+        for scheme in [avg.Voigt(), avg.Reuss(), avg.VoigtReussHill(), avg.HashinShtrikmanUpper(),
+                       avg.HashinShtrikmanLower(), avg.HashinShtrikmanAverage()]:
+            K = scheme.average_bulk_moduli(volumes, bulk_moduli, shear_moduli)
+            G = scheme.average_shear_moduli(volumes, bulk_moduli, shear_moduli)
+            rho = scheme.average_density(volumes, densities)
+            for i in range(3):
+                self.assertFloatEqual(scheme.average_bulk_moduli(volumes[i], bulk_moduli[i], shear_moduli[i]), K[i])
+                self.assertFloatEqual(scheme.average_shear_moduli(volumes[i], bulk_moduli[i], shear_moduli[i]), G[i])
+                self.assertFloatEqual(scheme.average_density(volumes[i], densities[i]), rho[i])
+            # all the bounds are between the Voigt and Reuss bounds
+            self.assertTrue(all(K <= avg.Voigt().average_bulk_moduli(volumes, bulk_moduli, shear_moduli) * (1. + 1.e-12)))
+            self.assertTrue(all(G >= avg.Reuss().average_shear_moduli(volumes, bulk_moduli, shear_moduli) * (1. - 1.e-12)))
+
+    def test_single_phase(self):
+        K = avg.HashinShtrikmanUpper().average_bulk_moduli([[1.0], [2.0]], [[100.e9], [200.e9]], [[50.e9], [60.e9]])
+        self.assertArraysAlmostEqual([100.e9, 200.e9], K)
+
 class VRH(BurnManTest):
     def test_1(self):
         rock = burnman.Composite ( [1.0], [mypericlase()] )
@@ -87,6 +116,71 @@ class VRH(BurnManTest):
         self.assertFloatEqual(199.884, K_vrh[0]/1.e9)
         self.assertFloatEqual(150.901, G_vrh[0]/1.e9)
 
+    def test_arrays(self):
+        rock = burnman.Composite ( [0.7, 0.3], [minerals.SLB_2005.periclase(), minerals.SLB_2005.fe_perovskite()] )
+        rock.set_method('slb3')
+        pressures = [10e9, 30e9, 60e9]
+        temperatures = [300., 1500., 2500.]
+        moduli = burnman.calculate_moduli_arrays(rock, pressures, temperatures)
+        self.assertEqual(moduli.K.shape, (3, 2))
+        moduli_list = burnman.calculate_moduli(rock, pressures, temperatures)
+        averaged = burnman.average_moduli_arrays(moduli, avg.VoigtReussHill())
+        averaged_list = burnman.average_moduli(moduli_list, avg.VoigtReussHill())
+        for idx in range(3):
+            self.assertFloatEqual(moduli_list[idx][1].G, moduli.G[idx, 1])
+            self.assertFloatEqual(averaged_list[idx].K, averaged.K[idx])
+            self.assertFloatEqual(averaged_list[idx].rho, averaged.rho[idx])
+        v_p, v_s, v_phi = burnman.compute_velocities(averaged)
+        self.assertArraysAlmostEqual(burnman.compute_velocities(averaged_list)[0], v_p)
+
+    def test_point_scheme(self):
+        # a scheme with the interface of single points only
+        class arithmetic(avg.AveragingScheme):
+            def average_bulk_moduli(self, volumes, bulk_moduli, shear_moduli):
+                assert len(volumes) == 2 and not isinstance(volumes[0], list)
+                return avg.voigt_average_function(volumes, bulk_moduli)
+            def average_shear_moduli(self, volumes, bulk_moduli, shear_moduli):
+                return avg.voigt_average_function(volumes, shear_moduli)
+
+        rock = burnman.Composite ( [0.7, 0.3], [minerals.SLB_2005.periclase(), minerals.SLB_2005.fe_perovskite()] )
+        rock.set_method('slb3')
+        moduli = burnman.calculate_moduli_arrays(rock, [10e9, 30e9, 60e9], [300., 1500., 2500.])
+        averaged = burnman.average_moduli_arrays(moduli, arithmetic())
+        voigt = burnman.average_moduli_arrays(moduli, avg.Voigt())
+        self.assertArraysAlmostEqual(averaged.K, voigt.K)
+        self.assertArraysAlmostEqual(averaged.G, voigt.G)
+        self.assertArraysAlmostEqual(averaged.rho, voigt.rho)
+
+    def test_changing_number_of_phases(self):
+        class mycomposite(burnman.Material):
+            def __init__(self):
+                self.minerals = [minerals.SLB_2005.periclase(), minerals.SLB_2005.fe_perovskite()]
+                for mineral in self.minerals:
+                    mineral.set_method('slb3')
+            def set_state(self, pressure, temperature):
+                burnman.Material.set_state(self, pressure, temperature)
+                for mineral in self.minerals:
+                    mineral.set_state(pressure, temperature)
+            def unroll(self):
+                if self.temperature > 500:
+                    return ([1.0], self.minerals[:1])
+                return ([0.3, 0.7], self.minerals)
+
+        rock = mycomposite()
+        pressures = [10e9, 30e9, 60e9]
+        temperatures = [1000., 300., 1000.]
+        moduli = burnman.calculate_moduli_arrays(rock, pressures, temperatures)
+        self.assertEqual(moduli.K.shape, (3, 2))
+        self.assertEqual(list(moduli.n_phases), [1, 2, 1])
+        self.assertEqual([len(point) for point in burnman.calculate_moduli(rock, pressures, temperatures)], [1, 2, 1])
+        for scheme in [avg.VoigtReussHill(), avg.Reuss(), avg.HashinShtrikmanLower()]:
+            velocities = burnman.velocities_from_rock(rock, pressures, temperatures, scheme)
+            for idx in range(3):
+                point = burnman.velocities_from_rock(rock, pressures[idx:idx+1], temperatures[idx:idx+1], scheme)
+                self.assertArraysAlmostEqual([v[idx] for v in velocities], [v[0] for v in point])
+            averaged = burnman.average_moduli(burnman.calculate_moduli(rock, pressures, temperatures), scheme)
+            self.assertArraysAlmostEqual([a.K for a in averaged], velocities[4])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,6 +11,8 @@ from test_debye import *
 from test_geotherm import *
 from test_endmembers import *
 from test_solidsolution import *
+from test_tabulated_mineral import *
+from test_catalogue import *
 
 
 import os, sys
@@ -30,6 +32,20 @@ class TestRock(BurnManTest):
         self.assertFloatEqual(fr[1], 0.7)
 
 
+class TestImport(BurnManTest):
+    def test_lazy_minerals(self):
+        # the mineral database modules are only imported when they are used
+        import subprocess
+        code = ("import sys, burnman; "
+                "assert 'burnman.minerals.HP_2011_ds62' not in sys.modules; "
+                "assert burnman.minerals.HP_2011_ds62.fo().params['name'] == 'fo'; "
+                "assert 'burnman.minerals.HP_2011_ds62' in sys.modules; "
+                "assert 'burnman.minerals.SLB_2011' not in sys.modules; "
+                "assert burnman.minerals.catalogue.find(elements=['Fe', 'Al']); "
+                "assert 'burnman.minerals.SLB_2011' not in sys.modules")
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], cwd=os.path.abspath('..')), 0)
+        self.assertTrue('SLB_2011' in dir(minerals))
+        self.assertTrue(burnman.processchemistry.read_masses() is burnman.processchemistry.read_masses())
 
 
 if __name__ == '__main__':